@@ -0,0 +1,79 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_MODULES = ['scraper_handler', 'scraper.scraper']
+# Cold import of scraper_handler took ~500ms with eager pandas/undetected_chromedriver imports
+DEFAULT_BUDGET_MS = 250
+# Modules the scraper must only import on the code path that needs them
+DEFERRED_MODULES = ['pandas', 'undetected_chromedriver', 'fake_useragent', 'pyarrow']
+
+
+def import_profile(module):
+    """Run `python -X importtime -c "import module"` in a fresh interpreter.
+
+    Returns {imported module: cumulative microseconds}; the entry for module itself is
+    its full cold import cost.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, self_us, cumulative_us, name = (part.strip() for part in line.replace('import time:', '|', 1).split('|'))
+        timings[name] = int(cumulative_us)
+    return timings
+
+
+def bench_startup(module, runs=5, top=10):
+    """Median cold import time of module over runs fresh interpreters, plus its heaviest imports"""
+    profiles = [import_profile(module) for _ in range(runs)]
+    totals = [profile[module] / 1000 for profile in profiles]
+    heaviest = sorted(
+        ((name, us) for name, us in profiles[-1].items() if name not in (module, 'site')),
+        key=lambda item: -item[1]
+    )[:top]
+    return {
+        'module': module,
+        'runs': runs,
+        'median_ms': round(statistics.median(totals), 1),
+        'min_ms': round(min(totals), 1),
+        'max_ms': round(max(totals), 1),
+        'eager_heavy_modules': [name for name in DEFERRED_MODULES if name in profiles[-1]],
+        'heaviest_imports_ms': {name: round(us / 1000, 1) for name, us in heaviest}
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fail if cold import time of the scraper regresses past a budget")
+    parser.add_argument('--modules', nargs='+', default=DEFAULT_MODULES)
+    parser.add_argument('--budget-ms', type=float, default=float(os.getenv('STARTUP_BUDGET_MS', DEFAULT_BUDGET_MS)))
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--output', help="Write the JSON report here instead of stdout")
+    cli_args = parser.parse_args()
+
+    report = {'budget_ms': cli_args.budget_ms, 'results': [bench_startup(m, cli_args.runs) for m in cli_args.modules]}
+    failures = [
+        r for r in report['results']
+        if r['median_ms'] > cli_args.budget_ms or r['eager_heavy_modules']
+    ]
+    report['passed'] = not failures
+
+    if cli_args.output:
+        with open(cli_args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    for r in failures:
+        print(f"Startup budget exceeded for {r['module']}: median {r['median_ms']}ms "
+              f"(budget {cli_args.budget_ms}ms), eagerly imported: {r['eager_heavy_modules'] or 'none'}",
+              file=sys.stderr)
+    sys.exit(1 if failures else 0)
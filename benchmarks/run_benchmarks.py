@@ -0,0 +1,230 @@
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import pickle
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import shutil
+import tracemalloc
+from benchmarks.synthetic_pages import SyntheticPageGenerator, PROFILE_LAYOUTS
+from scraper.extractors import ProfileExtractor, SearchResultExtractor
+from utils.columnar_export import pq
+from utils.dom_snapshot import DOMSnapshot
+from utils.selector_cache import SelectorRankingCache
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+BENCHMARKS = ('profile_extraction', 'search_extraction', 'serialization', 'record_memory')
+
+
+def timed(fn):
+    """Run fn and return (result, wall seconds, cpu seconds)"""
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    result = fn()
+    return result, time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+
+def retained_bytes(records):
+    """Approximate memory held by a list of records, measured on a fresh copy with tracemalloc"""
+    payload = pickle.dumps(records)
+    tracemalloc.start()
+    copy = pickle.loads(payload)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del copy
+    return current
+
+
+def result_row(benchmark, n, wall, cpu, **extra):
+    row = {
+        'benchmark': benchmark,
+        'n': n,
+        'wall_seconds': round(wall, 4),
+        'cpu_seconds': round(cpu, 4),
+        'per_item_us': round(wall / max(1, n) * 1e6, 2),
+        'items_per_second': round(n / wall, 1) if wall else None
+    }
+    row.update(extra)
+    return row
+
+
+def bench_profile_extraction(n, pages, ranked=True):
+    extractor = ProfileExtractor(ranking=SelectorRankingCache(cache_file=None) if ranked else None)
+
+    def run():
+        profiles = []
+        for i in range(n):
+            profile_data = ProfileExtractor.new_profile_data(f"https://www.linkedin.com/in/bench-{i}/", "2024-01-01T00:00:00")
+            extractor.extract_profile(DOMSnapshot(pages[i % len(pages)]), profile_data)
+            profiles.append(profile_data)
+        return profiles
+
+    profiles, wall, cpu = timed(run)
+    memory = retained_bytes(profiles)
+    return profiles, result_row(
+        'profile_extraction', n, wall, cpu,
+        ranked_selectors=ranked,
+        retained_bytes=memory,
+        bytes_per_record=round(memory / max(1, n), 1)
+    )
+
+
+def bench_search_extraction(n, pages, cards_per_page):
+    extractor = SearchResultExtractor()
+
+    def run():
+        records = []
+        page_index = 0
+        while len(records) < n:
+            harvest = extractor.extract_from_snapshot(DOMSnapshot(pages[page_index % len(pages)]), cards_per_page)
+            records.extend(extractor.build_records(harvest['cards'], "2024-01-01T00:00:00"))
+            page_index += 1
+        return records[:n]
+
+    records, wall, cpu = timed(run)
+    memory = retained_bytes(records)
+    return records, result_row(
+        'search_extraction', n, wall, cpu,
+        retained_bytes=memory,
+        bytes_per_record=round(memory / max(1, n), 1)
+    )
+
+
+def bench_serialization(n, search_records, profiles, workdir):
+    """Time LinkedInScraper.save_data for JSON, CSV and (with pyarrow) Parquet on n search records plus n profiles"""
+    from scraper.scraper import LinkedInScraper
+
+    rows = []
+    previous_cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        scraper = LinkedInScraper(headless=True)
+        scraper.selector_ranking.cache_file = None
+        scraper.scraped_data = [search_records[:n]] + profiles[:n]
+        for fmt in ('json', 'csv') + (('parquet',) if pq is not None else ()):
+            # save_data(format='csv') prints every row
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                filepath, wall, cpu = timed(lambda: scraper.save_data(filename=f"bench_{n}", format=fmt))
+            size = directory_bytes(filepath) if filepath else None
+            rows.append(result_row(f'save_data_{fmt}', n, wall, cpu, file_bytes=size))
+            if filepath and os.path.isdir(filepath):
+                shutil.rmtree(filepath)
+            elif filepath:
+                os.remove(filepath)
+    finally:
+        os.chdir(previous_cwd)
+    return rows
+
+
+def bench_record_memory(n, search_records, profiles):
+    """Memory per record of the slotted models against their dict form, and to_dict/to_row cost"""
+    rows = []
+    for name, records in (('search_result', search_records[:n]), ('profile', profiles[:n])):
+        count = max(1, len(records))
+        model_bytes = retained_bytes(records)
+        dicts, dict_wall, dict_cpu = timed(lambda: [record.to_dict() for record in records])
+        dict_bytes = retained_bytes(dicts)
+        _, row_wall, _ = timed(lambda: [record.to_row() for record in records])
+        rows.append(result_row(
+            f'record_memory_{name}', len(records), dict_wall, dict_cpu,
+            bytes_per_record=round(model_bytes / count, 1),
+            dict_bytes_per_record=round(dict_bytes / count, 1),
+            saved_ratio=round(1 - model_bytes / dict_bytes, 3) if dict_bytes else None,
+            to_dict_us=round(dict_wall / count * 1e6, 2),
+            to_row_us=round(row_wall / count * 1e6, 2)
+        ))
+        del dicts
+    return rows
+
+
+def directory_bytes(path):
+    """Size of a file, or of every file under a dataset directory"""
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, benchmarks=BENCHMARKS, pool_size=200, seed=0, cards_per_page=10,
+                   experience_items=5, skills=10, certifications=2):
+    """Run the selected benchmarks for every size and return a machine-readable report"""
+    generator = SyntheticPageGenerator(seed)
+    sections = {'experience_items': experience_items, 'skills': skills, 'certifications': certifications}
+    profile_pages = [generator.profile_page(layout=PROFILE_LAYOUTS[i % len(PROFILE_LAYOUTS)], **sections) for i in range(pool_size)]
+    search_pages = [generator.search_page(cards_per_page) for _ in range(max(1, pool_size // cards_per_page))]
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in sizes:
+            profiles = []
+            search_records = []
+            needs_records = 'serialization' in benchmarks or 'record_memory' in benchmarks
+            if 'profile_extraction' in benchmarks or needs_records:
+                profiles, row = bench_profile_extraction(n, profile_pages)
+                if 'profile_extraction' in benchmarks:
+                    results.append(row)
+            if 'search_extraction' in benchmarks or needs_records:
+                search_records, row = bench_search_extraction(n, search_pages, cards_per_page)
+                if 'search_extraction' in benchmarks:
+                    results.append(row)
+            if 'serialization' in benchmarks:
+                results.extend(bench_serialization(n, search_records, profiles, workdir))
+            if 'record_memory' in benchmarks:
+                results.extend(bench_record_memory(n, search_records, profiles))
+            del profiles, search_records
+
+    return {
+        'meta': {
+            'timestamp': datetime.datetime.now().isoformat(),
+            'git_commit': git_commit(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'pool_size': pool_size,
+            'seed': seed,
+            'sections': sections,
+            'cards_per_page': cards_per_page,
+            'layouts': list(PROFILE_LAYOUTS),
+            'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        },
+        'results': results
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark extraction and serialization on synthetic pages")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--only', nargs='+', choices=BENCHMARKS, default=list(BENCHMARKS))
+    parser.add_argument('--pool-size', type=int, default=200, help="Distinct synthetic pages cycled through")
+    parser.add_argument('--experience-items', type=int, default=5)
+    parser.add_argument('--skills', type=int, default=10)
+    parser.add_argument('--certifications', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="Write the JSON report here instead of stdout")
+    cli_args = parser.parse_args()
+
+    report = run_benchmarks(
+        sizes=cli_args.sizes,
+        benchmarks=cli_args.only,
+        pool_size=cli_args.pool_size,
+        seed=cli_args.seed,
+        experience_items=cli_args.experience_items,
+        skills=cli_args.skills,
+        certifications=cli_args.certifications
+    )
+    if cli_args.output:
+        with open(cli_args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
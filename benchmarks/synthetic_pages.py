@@ -0,0 +1,183 @@
+import random
+from html import escape
+
+
+FIRST_NAMES = ["Ava", "Liam", "Sofia", "Noah", "Mia", "Ethan", "Isabella", "Lucas", "Amelia", "Benjamin",
+               "Harper", "Elijah", "Evelyn", "James", "Charlotte", "Mateo", "Aria", "Kai", "Zoe", "Ravi"]
+LAST_NAMES = ["Thompson", "Carter", "Patel", "Kim", "Rossi", "Brooks", "Nguyen", "Meyer", "Garcia", "Lee",
+              "Wilson", "Scott", "Adams", "Turner", "Hughes", "Okafor", "Silva", "Novak", "Haddad", "Ito"]
+TITLES = ["IT Recruiter", "Technical Recruiter", "Senior Sourcer", "Talent Partner", "Recruiting Lead",
+          "Software Engineer", "Data Analyst", "Engineering Manager", "Product Manager", "DevOps Engineer"]
+COMPANIES = ["Northwind", "Contoso", "Fabrikam", "Tailspin Toys", "Adventure Works", "Litware",
+             "Proseware", "Woodgrove Bank", "Coho Winery", "Wide World Importers", "Globex", "Initech"]
+CITIES = ["Austin, Texas", "Seattle, Washington", "New York, New York", "Chicago, Illinois",
+          "Denver, Colorado", "Boston, Massachusetts", "Atlanta, Georgia", "Remote"]
+SCHOOLS = ["University of Texas at Austin", "Ohio State University", "University of Washington",
+           "Georgia Institute of Technology", "Boston University", "Arizona State University"]
+SKILLS = ["Technical Recruiting", "Boolean Search", "Sourcing", "Python", "SQL", "Kubernetes", "Negotiation",
+          "Interviewing", "Applicant Tracking Systems", "Employer Branding", "AWS", "Stakeholder Management",
+          "Data Analysis", "Go", "Java", "Leadership", "Onboarding", "Talent Mapping", "Excel", "Communication"]
+ISSUERS = ["AIRS", "SHRM", "LinkedIn", "AWS", "Google", "Coursera"]
+
+# One layout per selector family in ProfileExtractor: "modern" hits the first
+# selector of every list, the others only match a later fallback.
+PROFILE_LAYOUTS = ('modern', 'left_panel', 'legacy', 'anonymized')
+
+
+class SyntheticPageGenerator:
+    """Deterministic generator of LinkedIn-like search and profile pages for benchmarks"""
+
+    def __init__(self, seed=0):
+        self.random = random.Random(seed)
+        self.counter = 0
+
+    def person(self):
+        self.counter += 1
+        first = self.random.choice(FIRST_NAMES)
+        last = self.random.choice(LAST_NAMES)
+        return {
+            'name': f"{first} {last}",
+            'slug': f"{first.lower()}-{last.lower()}-{self.counter}",
+            'headline': f"{self.random.choice(TITLES)} at {self.random.choice(COMPANIES)}",
+            'location': f"{self.random.choice(CITIES)}, United States",
+            'company': self.random.choice(COMPANIES)
+        }
+
+    def search_page(self, cards=10, next_page=True):
+        """Search results page in the current universal-template layout"""
+        items = []
+        for _ in range(cards):
+            p = {key: escape(value) for key, value in self.person().items()}
+            url = f"https://www.linkedin.com/in/{p['slug']}?miniProfileUrn=urn%3Ali%3Afs_miniProfile%3A{self.counter}"
+            items.append(
+                f'<li class="reusable-search__result-container">'
+                f'<div data-view-name="search-entity-result-universal-template">'
+                f'<a data-test-app-aware-link aria-hidden="true" href="{url}"><img alt="" src="https://media.licdn.com/{p["slug"]}.jpg"></a>'
+                f'<a data-test-app-aware-link href="{url}"><span dir="ltr"><span aria-hidden="true">{p["name"]}</span>'
+                f'<span class="visually-hidden">View {p["name"]}\'s profile</span></span></a>'
+                f'<div class="t-14 t-black t-normal">{p["headline"]}</div>'
+                f'<div class="t-14 t-normal">{p["location"]}</div>'
+                f'<p class="entity-result__summary--2-lines">Current: {p["headline"]}</p>'
+                f'</div></li>'
+            )
+        next_button = '<button aria-label="Next" class="artdeco-pagination__button--next"%s>Next</button>' % (
+            '' if next_page else ' disabled')
+        return (
+            '<!DOCTYPE html><html><head><title>Search | LinkedIn</title></head><body><main>'
+            '<div class="search-results-container"><ul>' + ''.join(items) + '</ul>'
+            f'<div class="artdeco-pagination">{next_button}</div></div></main></body></html>'
+        )
+
+    def profile_page(self, layout='modern', experience_items=5, education_items=2, skills=10, certifications=2, languages=2):
+        """Profile page for one selector family with configurable section sizes"""
+        if layout not in PROFILE_LAYOUTS:
+            raise ValueError(f"Unknown layout {layout!r}; expected one of {PROFILE_LAYOUTS}")
+        p = {key: escape(value) for key, value in self.person().items()}
+        experience = [
+            (self.random.choice(TITLES), self.random.choice(COMPANIES), f"{self.random.randint(1, 9)} yrs {self.random.randint(1, 11)} mos")
+            for _ in range(experience_items)
+        ]
+        education = [(self.random.choice(SCHOOLS), "Bachelor of Science - BS", "2010 - 2014") for _ in range(education_items)]
+        skill_names = self.random.sample(SKILLS, min(skills, len(SKILLS))) + [f"Skill {i}" for i in range(max(0, skills - len(SKILLS)))]
+        certs = [(f"Certification {i + 1}", self.random.choice(ISSUERS)) for i in range(certifications)]
+        langs = self.random.sample(["English", "Spanish", "French", "German", "Hindi", "Japanese"], min(languages, 6))
+        about = escape(" ".join(self.random.choice(SKILLS) for _ in range(60)))
+
+        if layout in ('modern', 'left_panel'):
+            body = self._modern_profile(p, layout, about, experience, education, skill_names, certs, langs)
+        else:
+            body = self._legacy_profile(p, layout, about, experience, education, skill_names, certs, langs)
+        return f'<!DOCTYPE html><html><head><title>{p["name"]} | LinkedIn</title></head><body>{body}</body></html>'
+
+    @staticmethod
+    def _pvs_item(title, subtitle=None, caption=None):
+        parts = [f'<li class="pvs-list__item"><div class="mr1 hoverable-link-text t-bold">'
+                 f'<span aria-hidden="true">{escape(title)}</span><span class="visually-hidden">{escape(title)}</span></div>']
+        if subtitle:
+            parts.append(f'<span class="t-14 t-normal"><span aria-hidden="true">{escape(subtitle)}</span></span>')
+        if caption:
+            parts.append(f'<span class="t-14 t-normal t-black--light"><span aria-hidden="true">{escape(caption)}</span></span>')
+        parts.append('</li>')
+        return ''.join(parts)
+
+    def _pvs_section(self, anchor, items):
+        return (f'<section><div id="{anchor}"></div><div class="pvs-list__container"><ul>'
+                + ''.join(items) + '</ul></div></section>')
+
+    def _modern_profile(self, p, layout, about, experience, education, skill_names, certs, langs):
+        if layout == 'modern':
+            top = (f'<h1 class="text-heading-xlarge">{p["name"]}</h1>'
+                   f'<div class="text-body-medium break-words">{p["headline"]}</div>'
+                   f'<span class="text-body-small inline t-black--light break-words">{p["location"]}</span>')
+        else:
+            top = (f'<div class="pv-text-details__left-panel"><h1>{p["name"]}</h1>'
+                   f'<div class="text-body-medium">{p["headline"]}</div>'
+                   f'<div class="text-body-small">{p["location"]}</div>'
+                   f'<button><span>500+ connections</span></button></div>')
+        return (
+            '<main><section class="pv-top-card">'
+            f'<div class="pv-top-card__photo"><img src="https://media.licdn.com/{p["slug"]}.jpg"></div>{top}'
+            f'<a href="https://www.linkedin.com/in/{p["slug"]}/overlay/connections/"><span>500+ connections</span></a>'
+            '</section>'
+            '<section><div id="about"></div><div class="pv-shared-text-with-see-more">'
+            f'<div class="inline-show-more-text"><span aria-hidden="true">{about}</span></div></div></section>'
+            + self._pvs_section('experience', [self._pvs_item(t, c, d) for t, c, d in experience])
+            + self._pvs_section('education', [self._pvs_item(s, deg, dur) for s, deg, dur in education])
+            + self._pvs_section('licenses_and_certifications', [self._pvs_item(n, i) for n, i in certs])
+            + self._pvs_section('skills', [self._pvs_item(s) for s in skill_names])
+            + self._pvs_section('languages', [self._pvs_item(lang) for lang in langs])
+            + '</main>'
+        )
+
+    def _legacy_profile(self, p, layout, about, experience, education, skill_names, certs, langs):
+        if layout == 'legacy':
+            top = (f'<section class="pv-top-card"><h2 class="pv-top-card__name">{p["name"]}</h2>'
+                   f'<h2 class="pv-top-card__headline">{p["headline"]}</h2>'
+                   f'<h3 class="pv-top-card__location">{p["location"]}</h3>'
+                   f'<span class="pv-top-card__connections">312 connections</span></section>')
+            about_html = f'<section class="pv-about-section"><p class="pv-about__summary-text">{about}</p></section>'
+
+            def section(name, items):
+                return f'<section class="pv-profile-section" data-section="{name}"><ul>' + ''.join(items) + '</ul></section>'
+        else:
+            top = (f'<section><h1 data-anonymize="person-name">{p["name"]}</h1>'
+                   f'<div data-anonymize="headline">{p["headline"]}</div>'
+                   f'<div data-anonymize="location">{p["location"]}</div></section>')
+            about_html = f'<section class="summary-section"><p class="pv-about__summary-text">{about}</p></section>'
+
+            def section(name, items):
+                return f'<section class="{name}-section"><ul>' + ''.join(items) + '</ul></section>'
+
+        experience_items = [
+            f'<li><div class="pv-entity__summary-info"><h3>{escape(t)}</h3>'
+            f'<p class="pv-entity__secondary-title">{escape(c)}</p>'
+            f'<h4 class="pv-entity__bullet-item-v2">{escape(d)}</h4>'
+            f'<p class="pv-entity__description">Hiring across engineering teams.</p></div></li>'
+            for t, c, d in experience
+        ]
+        education_items = [
+            f'<li><div class="pv-entity__summary-info"><h3 class="pv-entity__school-name">{escape(s)}</h3>'
+            f'<p class="pv-entity__degree-name">{escape(deg)}</p><p class="pv-entity__dates"><span>{dur}</span></p></div></li>'
+            for s, deg, dur in education
+        ]
+        skill_items = [
+            f'<li class="pv-skill-category-entity"><p class="pv-skill-category-entity__name">{escape(s)}</p></li>'
+            for s in skill_names
+        ]
+        cert_items = [
+            f'<li><div class="pv-entity__summary-info"><div class="mr1 hoverable-link-text t-bold"><span>{escape(n)}</span></div>'
+            f'<div class="t-14 t-normal"><span>{escape(i)}</span></div></div></li>'
+            for n, i in certs
+        ]
+        lang_items = [
+            f'<li><div class="pv-entity__summary-info"><div class="mr1 hoverable-link-text t-bold"><span>{escape(lang)}</span></div></div></li>'
+            for lang in langs
+        ]
+        return (
+            f'<main>{top}{about_html}'
+            + section('experience', experience_items)
+            + section('education', education_items)
+            + section('skills', skill_items)
+            + (section('certifications', cert_items) + section('languages', lang_items) if layout == 'legacy' else '')
+            + '</main>'
+        )
@@ -0,0 +1,462 @@
+import logging
+from scraper.models import SearchResult, Profile, Experience, Education, Certification
+
+
+class ProfileExtractor:
+    """Extract profile sections from a DOMSnapshot entirely in-process (no WebDriver calls)"""
+
+    name_selectors = [
+        "h1.text-heading-xlarge",
+        ".pv-text-details__left-panel h1",
+        ".ph5 h1",
+        ".pv-top-card .pv-top-card__name",
+        "h1[data-anonymize='person-name']"
+    ]
+
+    headline_selectors = [
+        ".text-body-medium.break-words",
+        ".pv-text-details__left-panel .text-body-medium",
+        ".pv-top-card .pv-top-card__headline",
+        "[data-anonymize='headline']"
+    ]
+
+    location_selectors = [
+        ".text-body-small.inline.t-black--light.break-words",
+        ".pv-text-details__left-panel .text-body-small",
+        ".pv-top-card .pv-top-card__location",
+        "[data-anonymize='location']"
+    ]
+
+    connections_selectors = [
+        ".pv-top-card .pv-top-card__connections",
+        "a[href*='overlay/connections'] span",
+        ".pv-text-details__left-panel button span"
+    ]
+
+    profile_picture_selectors = [
+        ".pv-top-card__photo img",
+        ".profile-photo-edit__preview img"
+    ]
+
+    about_selectors = [
+        "#about ~ .pv-shared-text-with-see-more .inline-show-more-text",
+        ".pv-about-section .pv-about__summary-text",
+        "[data-section='summary'] .pv-about__summary-text",
+        ".summary-section .pv-about__summary-text"
+    ]
+
+    about_expanded_selectors = [
+        ".inline-show-more-text__text"
+    ]
+
+    experience_selectors = [
+        "#experience ~ .pvs-list__container .pvs-list__item",
+        ".pv-profile-section[data-section='experience'] .pv-entity__summary-info",
+        ".experience-section .pv-entity__summary-info"
+    ]
+
+    experience_title_selectors = [
+        ".mr1.hoverable-link-text.t-bold span[aria-hidden='true']",
+        ".pv-entity__summary-info h3",
+        ".pvs-entity__summary-title"
+    ]
+
+    experience_company_selectors = [
+        ".t-14.t-normal span[aria-hidden='true']",
+        ".pv-entity__secondary-title",
+        ".pvs-entity__summary-subtitle"
+    ]
+
+    experience_duration_selectors = [
+        ".t-14.t-normal.t-black--light span[aria-hidden='true']",
+        ".pv-entity__bullet-item-v2",
+        ".pvs-entity__caption-wrapper"
+    ]
+
+    education_selectors = [
+        "#education ~ .pvs-list__container .pvs-list__item",
+        ".pv-profile-section[data-section='education'] .pv-entity__summary-info",
+        ".education-section .pv-entity__summary-info"
+    ]
+
+    education_school_selectors = [
+        ".mr1.hoverable-link-text.t-bold span[aria-hidden='true']",
+        ".pv-entity__school-name",
+        ".pvs-entity__summary-title"
+    ]
+
+    education_degree_selectors = [
+        ".t-14.t-normal span[aria-hidden='true']",
+        ".pv-entity__degree-name",
+        ".pvs-entity__summary-subtitle"
+    ]
+
+    skills_selectors = [
+        "#skills ~ .pvs-list__container .pvs-list__item",
+        ".pv-profile-section[data-section='skills'] .pv-skill-category-entity",
+        ".skills-section .pv-skill-category-entity"
+    ]
+
+    skill_name_selectors = [
+        ".mr1.hoverable-link-text.t-bold span[aria-hidden='true']",
+        ".pv-skill-category-entity__name",
+        ".pvs-entity__summary-title"
+    ]
+
+    contact_info_selectors = [
+        ".pv-contact-info__contact-type",
+        ".ci-email a",
+        ".ci-phone",
+        ".ci-websites a"
+    ]
+
+    cert_selectors = [
+        "#licenses_and_certifications ~ .pvs-list__container .pvs-list__item",
+        ".pv-profile-section[data-section='certifications'] .pv-entity__summary-info"
+    ]
+
+    lang_selectors = [
+        "#languages ~ .pvs-list__container .pvs-list__item",
+        ".pv-profile-section[data-section='languages'] .pv-entity__summary-info"
+    ]
+
+    # Item limits per section, matching what the scraper has always kept
+    max_experience = 10
+    max_education = 5
+    max_skills = 20
+    max_certifications = 5
+    max_languages = 5
+
+    def __init__(self, logger=None, ranking=None):
+        self.logger = logger or logging.getLogger(__name__)
+        # Optional SelectorRankingCache that reorders fallbacks by recent hits
+        self.ranking = ranking
+
+    @staticmethod
+    def new_profile_data(url, scraped_at, page_load_time=None):
+        """Empty Profile record for the extractors to fill in; sections are allocated as items are found"""
+        return Profile(url=url, scraped_at=scraped_at, page_load_time=page_load_time)
+
+    def extract_profile(self, snapshot, profile_data, about_expanded=False):
+        """Run every snapshot-based section extractor over one profile page"""
+        self.extract_basic_profile_info(snapshot, profile_data)
+        self.extract_about_section(snapshot, profile_data, about_expanded)
+        self.extract_experience_section(snapshot, profile_data)
+        self.extract_education_section(snapshot, profile_data)
+        self.extract_skills_section(snapshot, profile_data)
+        self.extract_additional_sections(snapshot, profile_data)
+        return profile_data
+
+    def extract_basic_profile_info(self, snapshot, profile_data):
+        """Extract basic profile information (name, headline, location, etc.)"""
+        try:
+            name = self._first_text(snapshot, 'name', self.name_selectors)
+            if name is not None:
+                profile_data.name = name
+
+            headline = self._first_text(snapshot, 'headline', self.headline_selectors)
+            if headline is not None:
+                profile_data.headline = headline
+
+            location = self._first_text(
+                snapshot, 'location', self.location_selectors,
+                predicate=lambda text: "connections" not in text.lower()
+            )
+            if location is not None:
+                profile_data.location = location
+
+            connections = self._first_text(
+                snapshot, 'connections', self.connections_selectors,
+                predicate=lambda text: "connection" in text.lower()
+            )
+            if connections is not None:
+                profile_data.connections = connections
+
+            img_elem = self._first(snapshot, 'profile_picture', self.profile_picture_selectors)
+            profile_data.profile_picture = snapshot.attr(img_elem, 'src')
+
+        except Exception as e:
+            self.logger.debug(f"Error extracting basic profile info: {e}")
+
+    def extract_about_section(self, snapshot, profile_data, expanded=False):
+        """Extract the about/summary section, preferring the expanded text when available"""
+        try:
+            if expanded:
+                about = snapshot.first_text(self.about_expanded_selectors)
+                if about is None:
+                    about = self._first_text(snapshot, 'about', self.about_selectors)
+            else:
+                about = self._first_text(snapshot, 'about', self.about_selectors)
+            if about is not None:
+                profile_data.about = about
+
+        except Exception as e:
+            self.logger.debug(f"Error extracting about section: {e}")
+
+    def extract_experience_section(self, snapshot, profile_data):
+        """Extract work experience information"""
+        try:
+            experience_items, _ = self._select_all(snapshot, 'experience', self.experience_selectors)
+
+            if not experience_items:
+                self.logger.debug("No experience items found")
+                return
+
+            for item in experience_items[:self.max_experience]:
+                try:
+                    experience = Experience(
+                        title=self._first_text(snapshot, 'experience_title', self.experience_title_selectors, root=item),
+                        company=self._first_text(snapshot, 'experience_company', self.experience_company_selectors, root=item),
+                        duration=self._first_text(
+                            snapshot, 'experience_duration', self.experience_duration_selectors,
+                            root=item,
+                            predicate=lambda text: any(keyword in text.lower() for keyword in ['year', 'month', 'present', 'yr', 'mo'])
+                        ),
+                        location=snapshot.first_text([".pv-entity__location span"], root=item),
+                        description=snapshot.first_text([".pv-entity__description"], root=item)
+                    )
+
+                    if experience.title or experience.company:
+                        profile_data.add('experience', experience)
+
+                except Exception as e:
+                    self.logger.debug(f"Error extracting individual experience: {e}")
+                    continue
+
+        except Exception as e:
+            self.logger.debug(f"Error extracting experience section: {e}")
+
+    def extract_education_section(self, snapshot, profile_data):
+        """Extract education information"""
+        try:
+            education_items, _ = self._select_all(snapshot, 'education', self.education_selectors)
+
+            for item in education_items[:self.max_education]:
+                try:
+                    education = Education(
+                        school=self._first_text(snapshot, 'education_school', self.education_school_selectors, root=item),
+                        degree=self._first_text(snapshot, 'education_degree', self.education_degree_selectors, root=item),
+                        duration=snapshot.first_text([".pv-entity__dates span"], root=item)
+                    )
+
+                    if education.school:
+                        profile_data.add('education', education)
+
+                except Exception as e:
+                    self.logger.debug(f"Error extracting individual education: {e}")
+                    continue
+
+        except Exception as e:
+            self.logger.debug(f"Error extracting education section: {e}")
+
+    def extract_skills_section(self, snapshot, profile_data):
+        """Extract skills information"""
+        try:
+            skills_items, _ = self._select_all(snapshot, 'skills', self.skills_selectors)
+
+            for item in skills_items[:self.max_skills]:
+                try:
+                    skill_name = self._first_text(snapshot, 'skill_name', self.skill_name_selectors, root=item)
+                    if skill_name and skill_name not in (profile_data.skills or ()):
+                        profile_data.add('skills', skill_name)
+
+                except Exception as e:
+                    self.logger.debug(f"Error extracting individual skill: {e}")
+                    continue
+
+        except Exception as e:
+            self.logger.debug(f"Error extracting skills section: {e}")
+
+    def extract_contact_info(self, snapshot, profile_data):
+        """Extract contact information from a snapshot of the opened contact-info modal"""
+        try:
+            for selector in self.contact_info_selectors:
+                for elem in snapshot.select(selector):
+                    text = snapshot.text(elem)
+                    if "@" in text:
+                        profile_data.add_contact('email', text)
+                    elif text.startswith(('http', 'www')):
+                        profile_data.add_contact('websites', text)
+                    elif any(char.isdigit() for char in text) and len(text) > 5:
+                        profile_data.add_contact('phone', text)
+
+        except Exception as e:
+            self.logger.debug(f"Error extracting contact info: {e}")
+
+    def extract_additional_sections(self, snapshot, profile_data):
+        """Extract additional profile sections (certifications, languages, etc.)"""
+        try:
+            cert_items, _ = self._select_all(snapshot, 'cert', self.cert_selectors)
+            for item in cert_items[:self.max_certifications]:
+                cert_name = snapshot.first_text([".mr1.hoverable-link-text.t-bold span"], root=item)
+                cert_issuer = snapshot.first_text([".t-14.t-normal span"], root=item)
+                if cert_name is None or cert_issuer is None:
+                    continue
+                profile_data.add('certifications', Certification(name=cert_name, issuer=cert_issuer))
+
+            lang_items, _ = self._select_all(snapshot, 'lang', self.lang_selectors)
+            for item in lang_items[:self.max_languages]:
+                lang_name = snapshot.first_text([".mr1.hoverable-link-text.t-bold span"], root=item)
+                if lang_name is not None:
+                    profile_data.add('languages', lang_name)
+
+        except Exception as e:
+            self.logger.debug(f"Error extracting additional sections: {e}")
+
+    def _first(self, snapshot, field, selectors, root=None, predicate=None):
+        """Ranked select_first that feeds the outcome back into the ranking cache"""
+        if self.ranking is None:
+            element, _ = snapshot.select_first(selectors, root, predicate)
+            return element
+        ordered = self.ranking.rank(field, selectors)
+        element, selector = snapshot.select_first(ordered, root, predicate)
+        self.ranking.record(field, ordered, selector)
+        return element
+
+    def _first_text(self, snapshot, field, selectors, root=None, predicate=None):
+        """Ranked variant of DOMSnapshot.first_text"""
+        text_predicate = None if predicate is None else (lambda el: predicate(snapshot.text(el)))
+        element = self._first(snapshot, field, selectors, root, text_predicate)
+        return snapshot.text(element) if element is not None else None
+
+    def _select_all(self, snapshot, field, selectors):
+        """Ranked variant of DOMSnapshot.select_all"""
+        if self.ranking is None:
+            return snapshot.select_all(selectors)
+        ordered = self.ranking.rank(field, selectors)
+        elements, selector = snapshot.select_all(ordered)
+        self.ranking.record(field, ordered, selector)
+        return elements, selector
+
+
+class SearchResultExtractor:
+    """Extract search-result cards, either in the browser with one script call or from a DOMSnapshot"""
+
+    # Multiple selectors for different LinkedIn layouts
+    result_selectors = [
+        # ".search-result__wrapper",
+        # ".search-results__result-item",
+        # ".reusable-search__result-container",
+        # ".search-entity-result-universal-template",
+        "div[data-view-name='search-entity-result-universal-template']"
+    ]
+
+    anchor_selector = "a[data-test-app-aware-link]:not([aria-hidden])"
+    name_selector = "span[aria-hidden='true']"
+
+    headline_selectors = [
+        ".t-14.t-black.t-normal",
+    ]
+
+    location_selectors = [
+        "div.t-14.t-normal:not(.t-black)",
+    ]
+
+    company_selectors = [
+        ".entity-result__summary--2-lines",
+    ]
+
+    # Harvests every card on the page in a single WebDriver round trip. Returns
+    # {index, cards} where index is the result selector that matched and each card
+    # is null (no profile anchor), {pending: true} (name not rendered yet) or the raw fields.
+    BATCH_SCRIPT = """
+    var resultSelectors = arguments[0];
+    var anchorSelector = arguments[1];
+    var nameSelector = arguments[2];
+    var fieldSelectors = arguments[3];
+    var maxResults = arguments[4];
+    function first(root, selectors) {
+        for (var i = 0; i < selectors.length; i++) {
+            try {
+                var el = root.querySelector(selectors[i]);
+                if (el) { return el; }
+            } catch (e) {}
+        }
+        return null;
+    }
+    function text(el) {
+        return el ? (el.innerText || el.textContent || '').trim() : null;
+    }
+    var cards = [];
+    var index = -1;
+    for (var i = 0; i < resultSelectors.length; i++) {
+        try { cards = document.querySelectorAll(resultSelectors[i]); } catch (e) { continue; }
+        if (cards.length) { index = i; break; }
+    }
+    var out = [];
+    for (var c = 0; c < cards.length && c < maxResults; c++) {
+        var card = cards[c];
+        var anchor = card.querySelector(anchorSelector);
+        if (!anchor) { out.push(null); continue; }
+        var name = anchor.querySelector(nameSelector);
+        if (!name) { out.push({pending: true}); continue; }
+        out.push({
+            name: text(name),
+            profile_url: anchor.href,
+            headline: text(first(card, fieldSelectors.headline)),
+            location: text(first(card, fieldSelectors.location)),
+            current_company: text(first(card, fieldSelectors.company))
+        });
+    }
+    return {index: index, cards: out};
+    """
+
+    def __init__(self, logger=None):
+        self.logger = logger or logging.getLogger(__name__)
+
+    def batch_script_args(self, result_selectors, max_results):
+        """Arguments for BATCH_SCRIPT, in order"""
+        return [
+            list(result_selectors),
+            self.anchor_selector,
+            self.name_selector,
+            {
+                'headline': self.headline_selectors,
+                'location': self.location_selectors,
+                'company': self.company_selectors
+            },
+            max_results
+        ]
+
+    def extract_from_snapshot(self, snapshot, max_results=None, result_selectors=None):
+        """Run the same harvest as BATCH_SCRIPT over an offline DOMSnapshot"""
+        selectors = list(result_selectors or self.result_selectors)
+        cards, selector = snapshot.select_all(selectors)
+        raw_cards = []
+        for card in cards[:max_results]:
+            anchors = snapshot.select(self.anchor_selector, card)
+            if not anchors:
+                raw_cards.append(None)
+                continue
+            names = snapshot.select(self.name_selector, anchors[0])
+            if not names:
+                raw_cards.append({'pending': True})
+                continue
+            raw_cards.append({
+                'name': snapshot.text(names[0]),
+                'profile_url': anchors[0].get('href'),
+                'headline': snapshot.first_text(self.headline_selectors, card),
+                'location': snapshot.first_text(self.location_selectors, card),
+                'current_company': snapshot.first_text(self.company_selectors, card)
+            })
+        return {'index': selectors.index(selector) if selector else -1, 'cards': raw_cards}
+
+    def build_records(self, raw_cards, scraped_at):
+        """Convert raw harvested cards into SearchResult records"""
+        records = []
+        for raw in raw_cards:
+            if not raw or raw.get('pending'):
+                continue
+            headline = raw.get('headline')
+            location_text = (raw.get('location') or '').strip()
+            company = raw.get('current_company')
+            records.append(SearchResult(
+                name=(raw.get('name') or '').strip(),
+                profile_url=raw.get('profile_url'),
+                headline=headline.strip() if headline is not None else None,
+                # Reasonable location length
+                location=location_text if location_text and len(location_text) < 100 else None,
+                current_company=company.strip() if company is not None else None,
+                scraped_at=scraped_at
+            ))
+        return records
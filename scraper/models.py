@@ -0,0 +1,276 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Optional
+
+
+class _Record(Mapping):
+    """Read-only dict view over a slotted record, for callers written against the old dict records.
+
+    record['name'], record.get('experience') and 'personal_info' in record behave as they did
+    on the dicts, and every value handed out is plain (dicts and lists, never records), so it
+    can go straight to json, sqlite or pyarrow. Keys that the dict omitted when empty are
+    still missing here.
+    """
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        return self._get(key)
+
+    def __iter__(self):
+        return iter(self.to_dict())
+
+    def __len__(self):
+        return len(self.to_dict())
+
+    def __bool__(self):
+        # A record is never empty; skip building the dict just to test truthiness
+        return True
+
+    def _get(self, key):
+        return self.to_dict()[key]
+
+
+@dataclass(slots=True)
+class SearchResult(_Record):
+    """One search-result card"""
+    name: Optional[str] = None
+    profile_url: Optional[str] = None
+    headline: Optional[str] = None
+    location: Optional[str] = None
+    current_company: Optional[str] = None
+    scraped_at: Optional[str] = None
+
+    # Column order of save_data's CSV export
+    ROW_FIELDS = ('name', 'headline', 'location', 'profile_url', 'current_company', 'scraped_at')
+
+    @classmethod
+    def coerce(cls, record):
+        """A SearchResult for a card that may have been reloaded as a dict (checkpoint, search cache)"""
+        if isinstance(record, cls):
+            return record
+        return cls(**{key: record.get(key) for key in cls.__dataclass_fields__})
+
+    def to_dict(self):
+        data = {'name': self.name, 'profile_url': self.profile_url}
+        # The card dict never had headline/location keys when they were not found
+        if self.headline is not None:
+            data['headline'] = self.headline
+        if self.location is not None:
+            data['location'] = self.location
+        data['current_company'] = self.current_company
+        data['scraped_at'] = self.scraped_at
+        return data
+
+    def to_row(self):
+        return (self.name, self.headline, self.location, self.profile_url, self.current_company, self.scraped_at)
+
+    def _get(self, key):
+        if key in ('headline', 'location'):
+            value = getattr(self, key)
+            if value is None:
+                raise KeyError(key)
+            return value
+        if key in SearchResult.__dataclass_fields__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+
+@dataclass(slots=True)
+class Experience(_Record):
+    title: Optional[str] = None
+    company: Optional[str] = None
+    duration: Optional[str] = None
+    location: Optional[str] = None
+    description: Optional[str] = None
+
+    def to_dict(self):
+        data = {}
+        if self.title is not None:
+            data['title'] = self.title
+        if self.company is not None:
+            data['company'] = self.company
+        if self.duration is not None:
+            data['duration'] = self.duration
+        data['location'] = self.location
+        data['description'] = self.description
+        return data
+
+    def to_row(self):
+        return (self.title, self.company, self.duration, self.location, self.description)
+
+
+@dataclass(slots=True)
+class Education(_Record):
+    school: Optional[str] = None
+    degree: Optional[str] = None
+    duration: Optional[str] = None
+
+    def to_dict(self):
+        data = {}
+        if self.school is not None:
+            data['school'] = self.school
+        if self.degree is not None:
+            data['degree'] = self.degree
+        data['duration'] = self.duration
+        return data
+
+    def to_row(self):
+        return (self.school, self.degree, self.duration)
+
+
+@dataclass(slots=True)
+class Certification(_Record):
+    name: Optional[str] = None
+    issuer: Optional[str] = None
+
+    def to_dict(self):
+        return {'name': self.name, 'issuer': self.issuer}
+
+    def to_row(self):
+        return (self.name, self.issuer)
+
+
+def _values(items):
+    return list(items) if items else []
+
+
+def _dicts(items):
+    return [item.to_dict() for item in items] if items else []
+
+
+# List sections of a profile, in the order the dict record listed them. Each stays None
+# until its first item is added, so a profile without certifications pays for no list.
+PROFILE_SECTIONS = ('experience', 'education', 'skills', 'recommendations', 'languages',
+                    'certifications', 'publications', 'projects', 'honors_awards')
+
+
+@dataclass(slots=True)
+class Profile(_Record):
+    """A detailed profile page, optionally merged with the search card it was reached from"""
+    url: Optional[str] = None
+    scraped_at: Optional[str] = None
+    page_load_time: Optional[float] = None
+    name: Optional[str] = None
+    headline: Optional[str] = None
+    location: Optional[str] = None
+    profile_picture: Optional[str] = None
+    connections: Optional[str] = None
+    about: Optional[str] = None
+    contact_info: Optional[dict] = None
+    experience: Optional[list] = None
+    education: Optional[list] = None
+    skills: Optional[list] = None
+    recommendations: Optional[list] = None
+    languages: Optional[list] = None
+    certifications: Optional[list] = None
+    publications: Optional[list] = None
+    projects: Optional[list] = None
+    honors_awards: Optional[list] = None
+    search_result: Optional[SearchResult] = None
+
+    ROW_FIELDS = ('profile_url', 'name', 'headline', 'location', 'current_company', 'connections', 'about',
+                  'experience_count', 'education_count', 'skills_count', 'scraped_at')
+
+    def add(self, section, item):
+        """Append to a list section, allocating it on first use"""
+        items = getattr(self, section)
+        if items is None:
+            items = []
+            setattr(self, section, items)
+        items.append(item)
+
+    def add_contact(self, kind, value):
+        """Record one contact detail; websites accumulate, anything else is overwritten"""
+        if self.contact_info is None:
+            self.contact_info = {}
+        if kind == 'websites':
+            self.contact_info.setdefault('websites', []).append(value)
+        else:
+            self.contact_info[kind] = value
+
+    def update(self, search_result):
+        """Merge the search card this profile was reached from (was dict.update on the dict records)"""
+        self.search_result = SearchResult.coerce(search_result)
+
+    def personal_info(self):
+        info = {}
+        if self.name is not None:
+            info['name'] = self.name
+        if self.headline is not None:
+            info['headline'] = self.headline
+        if self.location is not None:
+            info['location'] = self.location
+        info['profile_picture'] = self.profile_picture
+        return info
+
+    def section(self, name):
+        """A list section as plain values (empty list when never allocated)"""
+        items = getattr(self, name)
+        if name in ('experience', 'education', 'certifications'):
+            return _dicts(items)
+        return _values(items)
+
+    def current_company(self):
+        if self.search_result is not None and self.search_result.current_company is not None:
+            return self.search_result.current_company
+        return self.experience[0].company if self.experience else None
+
+    def to_dict(self):
+        data = {
+            'url': self.url,
+            'scraped_at': self.scraped_at,
+            'page_load_time': self.page_load_time,
+            'personal_info': self.personal_info(),
+            'experience': _dicts(self.experience),
+            'education': _dicts(self.education),
+            'skills': _values(self.skills),
+            'recommendations': _values(self.recommendations),
+            'connections': self.connections,
+            'about': self.about,
+            'contact_info': self._contact_info(),
+            'languages': _values(self.languages),
+            'certifications': _dicts(self.certifications),
+            'publications': _values(self.publications),
+            'projects': _values(self.projects),
+            'honors_awards': _values(self.honors_awards)
+        }
+        if self.search_result is not None:
+            data.update(self.search_result.to_dict())
+        return data
+
+    def to_row(self):
+        card = self.search_result
+        return (
+            self.url if self.url is not None else card and card.profile_url,
+            self.name if self.name is not None else card and card.name,
+            self.headline if self.headline is not None else card and card.headline,
+            self.location if self.location is not None else card and card.location,
+            self.current_company(),
+            self.connections,
+            self.about,
+            len(self.experience or ()),
+            len(self.education or ()),
+            len(self.skills or ()),
+            self.scraped_at
+        )
+
+    def _contact_info(self):
+        if not self.contact_info:
+            return {}
+        return {key: list(value) if key == 'websites' else value for key, value in self.contact_info.items()}
+
+    def _get(self, key):
+        if self.search_result is not None:
+            try:
+                return self.search_result._get(key)
+            except KeyError:
+                pass
+        if key == 'personal_info':
+            return self.personal_info()
+        if key in PROFILE_SECTIONS:
+            return self.section(key)
+        if key == 'contact_info':
+            return self._contact_info()
+        if key in ('url', 'scraped_at', 'page_load_time', 'connections', 'about'):
+            return getattr(self, key)
+        raise KeyError(key)
@@ -0,0 +1,158 @@
+import argparse
+import datetime
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from urllib.parse import urlsplit, parse_qs
+from scraper.extractors import ProfileExtractor, SearchResultExtractor
+from utils.dom_snapshot import DOMSnapshot
+from utils.output_sink import JSONLSink
+from utils.snapshot_archive import SnapshotArchive
+
+# Archived pages each worker task handles; large enough to amortize pickling, small
+# enough that results reach the sink steadily
+DEFAULT_CHUNK_SIZE = 200
+
+# Per-process state, set up once by _init_worker
+_archive = None
+_profile_extractor = None
+_search_extractor = None
+
+
+def _init_worker(archive_dir):
+    global _archive, _profile_extractor, _search_extractor
+    _archive = SnapshotArchive(archive_dir, readonly=True)
+    _profile_extractor = ProfileExtractor()
+    _search_extractor = SearchResultExtractor()
+
+
+def extract_entry(archive, entry, profile_extractor, search_extractor):
+    """Re-run extraction over one archived page; returns (record_type, data) like the live scraper emits"""
+    html = archive.read(entry)
+    snapshot = DOMSnapshot(html, url=entry['url'])
+    scraped_at = datetime.datetime.fromtimestamp(entry['captured_at']).isoformat()
+
+    if entry['page_type'] == 'profile':
+        profile_data = ProfileExtractor.new_profile_data(entry['url'], scraped_at)
+        # The about text was expanded before the page was archived; falls back to the collapsed text
+        profile_extractor.extract_profile(snapshot, profile_data, about_expanded=True)
+        return 'profile', profile_data
+
+    if entry['page_type'] == 'search':
+        search_url, _, fragment = entry['url'].partition('#')
+        harvested = search_extractor.extract_from_snapshot(snapshot)
+        return 'search_page', {
+            'search_url': search_url,
+            'keywords': parse_qs(urlsplit(search_url).query).get('keywords', [None])[0],
+            'page': int(fragment.partition('=')[2] or 1),
+            'profiles': search_extractor.build_records(harvested['cards'], scraped_at)
+        }
+
+    return None
+
+
+def _extract_chunk(entries):
+    """Worker task: extract a chunk of entries, counting pages that fail instead of aborting"""
+    records, failed = [], 0
+    for entry in entries:
+        try:
+            record = extract_entry(_archive, entry, _profile_extractor, _search_extractor)
+        except Exception as e:
+            logging.warning(f"Re-extraction failed for snapshot {entry['id']} ({entry['url']}): {e}")
+            failed += 1
+            continue
+        if record:
+            records.append(record)
+    return records, failed
+
+
+def _chunks(entries, size):
+    chunk = []
+    for entry in entries:
+        chunk.append(entry)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def reextract_archive(archive_dir, output_sink, page_type=None, since=None, until=None, url_prefix=None,
+                      workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Re-run search-card and profile extraction over archived pages, without a browser.
+
+    Index entries matching the filters are read in the parent and handed out in chunks
+    to a process pool; each worker opens the archive read-only and decompresses and parses
+    its pages itself, so only index rows and extracted records cross process boundaries.
+    At most two chunks per worker are in flight, so memory stays flat on any archive size.
+    Records stream to output_sink as chunks finish (not in archive order).
+    """
+    workers = workers or os.cpu_count() or 1
+    start_time = time.perf_counter()
+    stats = {'pages': 0, 'records': 0, 'failed': 0, 'by_type': {}}
+
+    with SnapshotArchive(archive_dir, readonly=True) as archive:
+        entries = archive.entries(page_type=page_type, since=since, until=until, url_prefix=url_prefix)
+        pending = {}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(archive_dir,)) as pool:
+            chunks = _chunks(entries, chunk_size)
+            while True:
+                for chunk in chunks:
+                    pending[pool.submit(_extract_chunk, chunk)] = len(chunk)
+                    if len(pending) >= workers * 2:
+                        break
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stats['pages'] += pending.pop(future)
+                    records, failed = future.result()
+                    stats['failed'] += failed
+                    for record_type, data in records:
+                        output_sink.write(record_type, data)
+                        stats['records'] += 1
+                        stats['by_type'][record_type] = stats['by_type'].get(record_type, 0) + 1
+
+    elapsed = time.perf_counter() - start_time
+    stats['workers'] = workers
+    stats['elapsed_seconds'] = round(elapsed, 3)
+    stats['pages_per_second'] = round(stats['pages'] / elapsed, 1) if elapsed else None
+    logging.info(f"Re-extracted {stats['pages']} archived pages into {stats['records']} records "
+                 f"in {stats['elapsed_seconds']}s ({stats['failed']} failed)")
+    return stats
+
+
+def parse_date(value):
+    """CLI date (YYYY-MM-DD or ISO timestamp, local time) to the archive's epoch seconds"""
+    return datetime.datetime.fromisoformat(value).timestamp() if value else None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-run extraction over a snapshot archive, without a browser")
+    parser.add_argument('archive_dir', nargs='?', default=os.getenv("SNAPSHOT_ARCHIVE", "archive"))
+    parser.add_argument('--page-type', choices=['search', 'profile'])
+    parser.add_argument('--since', help="Only pages captured at or after this date (YYYY-MM-DD or ISO timestamp)")
+    parser.add_argument('--until', help="Only pages captured before this date")
+    parser.add_argument('--url-prefix', help="Only pages whose canonical URL starts with this")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: all CPU cores)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--output', help="JSONL file to write (default: a timestamped file under output/)")
+    parser.add_argument('--compress', action='store_true', help="zstd-compress the output stream")
+    cli_args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    with JSONLSink(path=cli_args.output, compress=cli_args.compress) as sink:
+        result = reextract_archive(
+            cli_args.archive_dir,
+            sink,
+            page_type=cli_args.page_type,
+            since=parse_date(cli_args.since),
+            until=parse_date(cli_args.until),
+            url_prefix=cli_args.url_prefix,
+            workers=cli_args.workers,
+            chunk_size=cli_args.chunk_size
+        )
+    result['output'] = sink.path
+    print(json.dumps(result, indent=2))
@@ -0,0 +1,402 @@
+import argparse
+import json
+import logging
+import os
+import re
+import time
+from urllib.parse import urlsplit, parse_qs, urlencode
+from lxml import etree
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from scraper.extractors import SearchResultExtractor
+from utils.clock import SystemClock, VirtualClock
+from utils.dom_snapshot import DOMSnapshot, OUTER_HTML_SCRIPT
+from utils.element_locator import FIND_FIRST_SCRIPT, FIND_ALL_SCRIPT
+from utils.output_sink import json_default
+from utils.tracing import Tracer
+
+DEFAULT_FIXTURES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fixtures', 'linkedin'
+)
+
+# Query parameters that select a different saved page; everything else
+# (keywords, geoUrn, miniProfileUrn tracking, ...) is ignored when routing.
+ROUTE_PARAMS = ('page',)
+
+BLANK_PAGE = "<html><head><title>Not found</title></head><body></body></html>"
+
+# Selenium's private-use key codes; typed text never contains them
+SPECIAL_KEYS = {value for name, value in vars(Keys).items() if not name.startswith('_')}
+
+
+def route_key(url):
+    """Normalize a URL to the key used to look up its fixture"""
+    parts = urlsplit(url)
+    path = parts.path.rstrip('/') or '/'
+    query = parse_qs(parts.query)
+    kept = sorted((name, query[name][0]) for name in ROUTE_PARAMS if name in query)
+    key = f"{parts.netloc}{path}"
+    if kept:
+        key += '?' + urlencode(kept)
+    return key
+
+
+class ReplayElement:
+    """WebElement stand-in backed by an lxml element of the current replay page"""
+
+    def __init__(self, driver, element):
+        self._driver = driver
+        self._element = element
+        self.id = f"replay-{id(element)}"
+
+    def __eq__(self, other):
+        return isinstance(other, ReplayElement) and other._element is self._element
+
+    def __hash__(self):
+        return hash(self._element)
+
+    @property
+    def tag_name(self):
+        return self._element.tag
+
+    @property
+    def text(self):
+        return self._driver.dom.text(self._element)
+
+    @property
+    def location(self):
+        return {'x': 0, 'y': 0}
+
+    @property
+    def size(self):
+        return {'width': 200, 'height': 40}
+
+    def get_attribute(self, name):
+        if name == 'outerHTML':
+            return etree.tostring(self._element, encoding='unicode', method='html')
+        if name in ('innerText', 'textContent'):
+            return self.text
+        return self._element.get(name)
+
+    def get_dom_attribute(self, name):
+        return self._element.get(name)
+
+    def is_displayed(self):
+        element = self._element
+        while element is not None:
+            if DOMSnapshot._is_hidden(element):
+                return False
+            element = element.getparent()
+        return True
+
+    def is_enabled(self):
+        return self._element.get('disabled') is None
+
+    def click(self):
+        self._driver._click(self._element)
+
+    def clear(self):
+        self._element.set('value', '')
+
+    def send_keys(self, *values):
+        value = self._element.get('value') or ''
+        for chunk in values:
+            for char in str(chunk):
+                if char == Keys.BACKSPACE:
+                    value = value[:-1]
+                elif char not in SPECIAL_KEYS:
+                    value += char
+        self._element.set('value', value)
+
+    def find_element(self, by=By.ID, value=None):
+        return self._driver._find_element(by, value, self._element)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._driver._find_elements(by, value, self._element)
+
+
+class ReplayDriver:
+    """In-process stand-in for the subset of the Selenium WebDriver API used by the scraper.
+
+    Pages are served from saved HTML fixtures listed in a manifest.json mapping URLs to
+    files. Elements may carry data-replay-href (navigate on click), data-replay-reveal and
+    data-replay-hide (toggle the hidden attribute on elements matching a CSS selector).
+    """
+
+    def __init__(self, fixtures_dir=DEFAULT_FIXTURES_DIR):
+        self.fixtures_dir = fixtures_dir
+        with open(os.path.join(fixtures_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        self.pages = {route_key(url): filename for url, filename in manifest['pages'].items()}
+        self.w3c = True
+        self.session_id = 'replay'
+        self.current_url = 'about:blank'
+        self.dom = DOMSnapshot(BLANK_PAGE, url=self.current_url)
+        self.scroll_y = 0
+        self.viewport = (1366, 768)
+        self.cookies = []
+        self._page_cache = {}
+        self.stats = {
+            'navigations': 0,
+            'script_calls': 0,
+            'find_calls': 0,
+            'clicks': 0,
+            'missing_urls': []
+        }
+
+    # --- navigation -------------------------------------------------------
+
+    def get(self, url):
+        self.stats['navigations'] += 1
+        filename = self.pages.get(route_key(url))
+        if filename is None:
+            logging.warning(f"Replay: no fixture for {url}, serving a blank page")
+            self.stats['missing_urls'].append(url)
+            page_source = BLANK_PAGE
+        else:
+            page_source = self._load(filename)
+        self.current_url = url
+        self.dom = DOMSnapshot(page_source, url=url)
+        self.scroll_y = 0
+        if 'feed' in url and not self.cookies:
+            self.cookies = [{'name': 'li_at', 'value': 'replay-session', 'domain': '.linkedin.com', 'path': '/'}]
+
+    @property
+    def page_source(self):
+        return etree.tostring(self.dom.root, encoding='unicode', method='html')
+
+    @property
+    def title(self):
+        titles = self.dom.select('title')
+        return self.dom.text(titles[0]) if titles else ''
+
+    def _load(self, filename):
+        if filename not in self._page_cache:
+            with open(os.path.join(self.fixtures_dir, filename), 'r', encoding='utf-8') as f:
+                self._page_cache[filename] = f.read()
+        return self._page_cache[filename]
+
+    def _click(self, element):
+        self.stats['clicks'] += 1
+        # Clicks land on inner spans too, so honour replay attributes on ancestors
+        while element is not None:
+            href = element.get('data-replay-href')
+            if href:
+                self.get(href)
+                return
+            reveal = element.get('data-replay-reveal')
+            if reveal:
+                for target in self.dom.select(reveal):
+                    target.attrib.pop('hidden', None)
+                return
+            hide = element.get('data-replay-hide')
+            if hide:
+                for target in self.dom.select(hide):
+                    target.set('hidden', '')
+                return
+            element = element.getparent()
+
+    # --- element lookup ---------------------------------------------------
+
+    def find_element(self, by=By.ID, value=None):
+        return self._find_element(by, value, None)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._find_elements(by, value, None)
+
+    def _find_element(self, by, value, root):
+        elements = self._find_elements(by, value, root)
+        if not elements:
+            raise NoSuchElementException(f"Replay: no element for {by}={value!r}")
+        return elements[0]
+
+    def _find_elements(self, by, value, root):
+        self.stats['find_calls'] += 1
+        root = self.dom.root if root is None else root
+        if by == By.CSS_SELECTOR:
+            matches = self.dom.select(value, root)
+        elif by == By.TAG_NAME:
+            matches = list(root.iter(value))
+        elif by == By.ID:
+            matches = root.xpath('.//*[@id=$value]', value=value)
+        elif by == By.CLASS_NAME:
+            matches = self.dom.select(f".{value}", root)
+        elif by == By.XPATH:
+            matches = root.xpath(value)
+        else:
+            raise NotImplementedError(f"Replay driver does not support locator strategy {by}")
+        return [ReplayElement(self, match) for match in matches]
+
+    # --- scripts ----------------------------------------------------------
+
+    def execute_script(self, script, *args):
+        self.stats['script_calls'] += 1
+        args = [arg._element if isinstance(arg, ReplayElement) else arg for arg in args]
+
+        if script == FIND_FIRST_SCRIPT:
+            return self._script_find_first(*args)
+        if script == FIND_ALL_SCRIPT:
+            return self._script_find_all(*args)
+        if script == SearchResultExtractor.BATCH_SCRIPT:
+            result_selectors, _, _, _, max_results = args
+            return SearchResultExtractor().extract_from_snapshot(self.dom, max_results, result_selectors)
+        if script == OUTER_HTML_SCRIPT:
+            matches = self.dom.select(args[0])
+            return etree.tostring(matches[0], encoding='unicode', method='html') if matches else None
+
+        if 'window.innerWidth' in script:
+            return self.viewport[0]
+        if 'window.innerHeight' in script:
+            return self.viewport[1]
+        if 'document.body.scrollHeight' in script:
+            return 3000
+        scroll = re.search(r"window\.scrollBy\(\s*0\s*,\s*(-?\d+)\s*\)", script)
+        if scroll:
+            self.scroll_y = max(0, self.scroll_y + int(scroll.group(1)))
+        return None
+
+    def _script_find_first(self, selectors, root=None, condition=None):
+        empty = 0
+        for index, selector in enumerate(selectors):
+            matches = self.dom.select(selector, root)
+            if not matches:
+                empty += 1
+                continue
+            element = ReplayElement(self, matches[0])
+            if condition == 'displayed' and not element.is_displayed():
+                continue
+            if condition == 'enabled' and not element.is_enabled():
+                continue
+            return [element, index, empty]
+        return [None, -1, empty]
+
+    def _script_find_all(self, selectors, root=None):
+        for index, selector in enumerate(selectors):
+            matches = self.dom.select(selector, root)
+            if matches:
+                return [[ReplayElement(self, match) for match in matches], index]
+        return None
+
+    # --- session and no-op browser controls -------------------------------
+
+    def execute(self, driver_command, params=None):
+        """Accepts ActionChains and other raw commands without doing anything"""
+        return {'value': None}
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        if cmd == 'Network.setCookies':
+            for cookie in cmd_args['cookies']:
+                self.add_cookie(cookie)
+        elif cmd == 'Network.clearBrowserCookies':
+            self.delete_all_cookies()
+        return {}
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def get_cookie(self, name):
+        return next((c for c in self.cookies if c['name'] == name), None)
+
+    @property
+    def window_handles(self):
+        return [] if self.session_id is None else ['replay']
+
+    def add_cookie(self, cookie_dict):
+        self.cookies = [c for c in self.cookies if c['name'] != cookie_dict['name']] + [cookie_dict]
+
+    def delete_all_cookies(self):
+        self.cookies = []
+
+    def implicitly_wait(self, time_to_wait):
+        pass
+
+    def set_page_load_timeout(self, time_to_wait):
+        pass
+
+    def set_window_size(self, width, height, windowHandle='current'):
+        self.viewport = (width, height)
+
+    def refresh(self):
+        self.get(self.current_url)
+
+    def quit(self):
+        self.dom = DOMSnapshot(BLANK_PAGE)
+        self.session_id = None
+
+
+def run_offline_scrape(fixtures_dir=DEFAULT_FIXTURES_DIR, keywords="IT Recruiter", location=None,
+                       max_results=10, scrape_details=True, skip_delays=True, output_sink=None,
+                       profile_store=None, checkpoint=None, dedup_index=None, search_cache=None,
+                       tracer=None, metrics=None, session_store=None, snapshot_archive=None):
+    """Run login, search (with pagination) and detail scraping against saved fixtures"""
+    from scraper.scraper import LinkedInScraper
+
+    # Delays advance a virtual clock instead of sleeping; the clock keeps a trace of them
+    clock = VirtualClock() if skip_delays else SystemClock()
+    scraper = LinkedInScraper(headless=True, output_sink=output_sink, profile_store=profile_store,
+                              checkpoint=checkpoint, dedup_index=dedup_index, search_cache=search_cache,
+                              clock=clock, tracer=tracer, metrics=metrics,
+                              session_store=session_store, snapshot_archive=snapshot_archive)
+    # Offline runs must not overwrite the live selector rankings
+    scraper.selector_ranking.cache_file = None
+    driver = ReplayDriver(fixtures_dir)
+    start_time = time.perf_counter()
+    search_results = []
+    profiles = []
+
+    try:
+        scraper.attach_driver(driver)
+        logged_in = scraper.restore_session("replay@example.com")
+        if not logged_in and not scraper.login("replay@example.com", "replay-password"):
+            raise RuntimeError("Replay login failed; check the login fixture")
+
+        search_results = scraper.search_profiles(keywords=keywords, location=location, max_results=max_results)
+        if not output_sink:
+            scraper.scraped_data.append(search_results)
+
+        if scrape_details:
+            for profile in search_results:
+                detailed_profile = scraper.scrape_profile_details(profile['profile_url'], profile)
+                if detailed_profile and not output_sink:
+                    detailed_profile.update(profile)
+                    profiles.append(detailed_profile)
+                    scraper.scraped_data.append(detailed_profile)
+    finally:
+        scraper.close()
+
+    return {
+        'search_results': search_results,
+        'profiles': profiles,
+        'elapsed_seconds': round(time.perf_counter() - start_time, 4),
+        'skipped_sleep_seconds': round(clock.slept, 2) if skip_delays else 0.0,
+        'delay_summary': clock.summary() if skip_delays else {},
+        'driver_stats': driver.stats,
+        'session_stats': scraper.get_session_stats()
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the scraper offline against saved HTML fixtures")
+    parser.add_argument('fixtures_dir', nargs='?', default=DEFAULT_FIXTURES_DIR)
+    parser.add_argument('--keywords', default="IT Recruiter")
+    parser.add_argument('--max-results', type=int, default=10)
+    parser.add_argument('--no-details', action='store_true', help="Only run the search pass")
+    parser.add_argument('--output', help="Write the full result JSON here instead of printing a summary")
+    parser.add_argument('--trace', help="Write per-phase timing spans (Chrome trace-event JSONL) here")
+    cli_args = parser.parse_args()
+
+    result = run_offline_scrape(
+        cli_args.fixtures_dir,
+        keywords=cli_args.keywords,
+        max_results=cli_args.max_results,
+        scrape_details=not cli_args.no_details,
+        tracer=Tracer(cli_args.trace)
+    )
+    if cli_args.output:
+        with open(cli_args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False, default=json_default)
+    summary = {key: value for key, value in result.items() if key not in ('search_results', 'profiles')}
+    summary['search_results'] = len(result['search_results'])
+    summary['profiles'] = len(result['profiles'])
+    print(json.dumps(summary, indent=2))
@@ -8,18 +8,25 @@ import subprocess
 import platform
 import re
 import csv
-import pandas as pd
 from dotenv import load_dotenv
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-import undetected_chromedriver as uc
+from scraper.extractors import ProfileExtractor, SearchResultExtractor
+from scraper.models import SearchResult
 from utils.behaviour import HumanBehaviorSimulator
+from utils.clock import SystemClock
+from utils.dedup import canonicalize_profile_url
+from utils.dom_snapshot import DOMSnapshot
+from utils.element_locator import ElementLocator
+from utils.selector_cache import SelectorRankingCache
+from utils.snapshot_archive import search_page_key
 from utils.fingerprint import BrowserFingerprintManager
+from utils.output_sink import json_default
 from utils.throttler import RequestThrottler
+from utils.tracing import Tracer
 from utils.user_agent import UserAgentRotator
 
 CHROME_BIN = os.getenv('CHROME_BIN')
@@ -27,17 +34,70 @@ CHROMEDRIVER_PATH = os.getenv('CHROMEDRIVER_PATH')
 CHROME_BROWSER= os.getenv('CHROME_BROWSER')
 HEADLESS= os.getenv('HEADLESS')
 IS_DOCKER= os.getenv('IS_DOCKER')
+# Major Chrome version baked into the image; skips the version probe entirely
+CHROME_VERSION = os.getenv('CHROME_VERSION')
+
+# One probe per process; the installed browser does not change while we run
+_chrome_version_cache = {}
+
+# Implicit wait the driver used to run with; missed lookups are now free but are
+# still accounted against this value to report the time saved.
+LEGACY_IMPLICIT_WAIT = 10
+
+# Readiness predicates per page type: the DOM is usable once every selector group has a match
+READINESS_ANCHORS = {
+    'search': [[".search-results-container"], SearchResultExtractor.result_selectors],
+    'profile': [ProfileExtractor.name_selectors],
+    # Any list section; a profile may legitimately lack some of them
+    'profile_sections': [
+        ProfileExtractor.experience_selectors + ProfileExtractor.education_selectors + ProfileExtractor.skills_selectors
+    ]
+}
+READINESS_TIMEOUTS = {'search': 20, 'profile': 10, 'profile_sections': 3}
 
 
 class LinkedInScraper:
     """Advanced LinkedIn scraper with comprehensive anti-detection measures"""
     
-    def __init__(self, headless=False, proxy=None):
+    def __init__(self, headless=False, proxy=None, batch_search_extraction=True, output_sink=None,
+                 profile_store=None, checkpoint=None, dedup_index=None, search_cache=None, quota_ledger=None,
+                 clock=None, tracer=None, metrics=None, session_store=None, resource_policy=None,
+                 page_load_strategy='normal', snapshot_archive=None):
         self.headless = headless
+        # Every pacing sleep goes through this clock; offline runs pass a VirtualClock
+        self.clock = clock or SystemClock()
+        # Per-phase timing spans; a Tracer without a path records nothing
+        self.tracer = tracer or Tracer()
         self.proxy = proxy
+        # Optional JSONLSink; results are streamed to it as soon as they are extracted
+        self.output_sink = output_sink
+        # Optional ProfileStore; search results and profiles are upserted into SQLite
+        self.profile_store = profile_store
+        # Optional CrawlCheckpoint; interrupted searches and detail passes resume from it
+        self.checkpoint = checkpoint
+        # Optional ProfileDedupIndex; profiles detail-scraped in any earlier run are skipped
+        self.dedup_index = dedup_index
+        # Optional SearchResultCache; repeat queries within its TTL skip navigation entirely
+        self.search_cache = search_cache
+        # Optional SessionStore; a saved, still valid login session replaces the login flow
+        self.session_store = session_store
+        # Optional ResourcePolicy; blocks images/fonts/media/trackers and measures bytes per navigation
+        self.resource_policy = resource_policy
+        # 'eager' returns from driver.get at DOMContentLoaded; readiness predicates cover the rest
+        self.page_load_strategy = page_load_strategy
+        # Optional SnapshotArchive; raw HTML of every visited page is kept for offline re-extraction
+        self.snapshot_archive = snapshot_archive
+        # Harvest each search results page with one script call instead of per-card lookups
+        self.batch_search_extraction = batch_search_extraction
         self.driver = None
         self.wait = None
-        self.throttler = RequestThrottler(min_delay=2, max_delay=8, burst_protection=True)
+        self.locator = None
+        # A QuotaLedger makes the throttler's daily/hourly limits global to the host
+        self.throttler = self.tracer.instrument(
+            RequestThrottler(min_delay=2, max_delay=8, burst_protection=True, ledger=quota_ledger, clock=self.clock,
+                             metrics=metrics),
+            'throttle'
+        )
         self.fingerprint_manager = BrowserFingerprintManager()
         self.user_agent_rotator = UserAgentRotator()
         self.behavior_simulator = None
@@ -46,18 +106,32 @@ class LinkedInScraper:
             'searches_performed': 0,
             'session_start': time.time(),
             'errors': 0,
+            'profiles_skipped_fresh': 0,
+            'search_pages_cached': 0,
             'last_activity': time.time()
         }
+        # Navigation start to usable DOM, and to extracted data, per page type
+        self.page_timings = {}
+        self._page_started = None
         
         # Setup logging
         self._setup_logging()
         
+        # Fallback selectors are tried in order of recent success
+        self.selector_ranking = SelectorRankingCache()
+        
+        # In-process extraction over DOM snapshots
+        self.extractor = ProfileExtractor(self.logger, ranking=self.selector_ranking)
+        self.search_extractor = SearchResultExtractor(self.logger)
+        
         # Session management
         self.session_cookies = None
         self.session_headers = {}
         
         # Data storage
         self.scraped_data = []
+        self.search_keywords = None
+        self.seen_profile_urls = set()  # Canonical URLs already returned by a search this session
         self.failed_profiles = []
         
         # Rate limiting and health monitoring
@@ -68,6 +142,47 @@ class LinkedInScraper:
             'captcha_encounters': 0
         }
         
+        # Optional MetricsRegistry exposed over HTTP or as a node-exporter textfile
+        self.metrics = metrics
+        if metrics:
+            self._register_metrics(metrics)
+        
+    def _register_metrics(self, metrics):
+        """Expose the session counters and health monitor, plus page load and extraction latencies.
+
+        The registry may outlive this scraper (the handler shares one across warm invocations),
+        so counters are incremented as events happen and keep counting across scrapers.
+        """
+        self.counters = {
+            'profiles_scraped': metrics.counter('profiles_scraped', 'Profiles detail-scraped'),
+            'profiles_failed': metrics.counter('profiles_failed', 'Profiles whose detail scrape failed'),
+            'profiles_skipped_fresh': metrics.counter('profiles_skipped_fresh',
+                                                      'Profiles skipped as unchanged and fresh'),
+            'searches': metrics.counter('searches', 'Search result pages extracted live'),
+            'search_pages_cached': metrics.counter('search_pages_cached',
+                                                   'Search result pages served from the search cache'),
+            'errors': metrics.counter('errors', 'Failed logins, searches and profile scrapes'),
+            'captcha_encounters': metrics.counter('captcha_encounters', 'Login challenges and captchas seen')
+        }
+        metrics.gauge('consecutive_errors', 'Errors since the last successful profile scrape',
+                      source=lambda: self.health_monitor['consecutive_errors'])
+        self.page_load_histogram = metrics.histogram('page_load_seconds', 'driver.get duration per page type')
+        self.extraction_histogram = metrics.histogram(
+            'extraction_seconds', 'Snapshot and parse duration per page type'
+        )
+        self.time_to_extract_histogram = metrics.histogram(
+            'time_to_extract_seconds', 'Navigation start to extracted data per page type'
+        )
+    
+    def _count(self, name):
+        if self.metrics:
+            self.counters[name].inc()
+    
+    def _record_error(self):
+        self.session_data['errors'] += 1
+        self.health_monitor['consecutive_errors'] += 1
+        self._count('errors')
+    
     def _setup_logging(self):
         """Setup comprehensive logging system"""
         logs_dir = "logs"
@@ -84,6 +199,14 @@ class LinkedInScraper:
         self.logger = logging.getLogger(__name__)
     
     def get_chrome_version(self):
+        """Major version of the installed Chrome, probed once per process"""
+        if CHROME_VERSION:
+            return int(CHROME_VERSION)
+        if 'major' not in _chrome_version_cache:
+            _chrome_version_cache['major'] = self._probe_chrome_version()
+        return _chrome_version_cache['major']
+    
+    def _probe_chrome_version(self):
         try:
             system = platform.system()
 
@@ -118,6 +241,9 @@ class LinkedInScraper:
     def _create_advanced_driver(self):
         """Create advanced Chrome driver with comprehensive stealth configuration"""
         try:
+            # Imported here: it pulls in its patcher and distutils, which only a live browser needs
+            import undetected_chromedriver as uc
+            
             # Use undetected-chromedriver for better stealth
             options = uc.ChromeOptions()
             
@@ -165,6 +291,7 @@ class LinkedInScraper:
             # Conditional headless mode
             if HEADLESS:
                 options.add_argument('--headless=new')  # Use new headless mode
+            options.page_load_strategy = self.page_load_strategy
             
             # Proxy configuration
             if self.proxy:
@@ -189,6 +316,9 @@ class LinkedInScraper:
                 "webrtc.multiple_routes_enabled": False,
                 "webrtc.nonproxied_udp_enabled": False
             }
+            if self.resource_policy:
+                options.add_experimental_option("prefs", self.resource_policy.chrome_prefs(prefs))
+                self.resource_policy.configure_options(options)
             # options.add_experimental_option("prefs", prefs)
             # options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
             # options.add_experimental_option('useAutomationExtension', False)
@@ -205,18 +335,7 @@ class LinkedInScraper:
             # Apply browser fingerprinting
             self.fingerprint_manager.apply_fingerprint(self.driver)
             
-            # Initialize behavior simulator
-            self.behavior_simulator = HumanBehaviorSimulator(self.driver)
-            
-            # Set implicit wait and page load timeout
-            self.driver.implicitly_wait(10)
-            self.driver.set_page_load_timeout(30)
-            
-            # Create WebDriverWait instance
-            self.wait = WebDriverWait(self.driver, 20)
-            
-            # Execute additional stealth JavaScript
-            self._execute_stealth_scripts()
+            self.attach_driver(self.driver)
             
             self.logger.info(f"Advanced Chrome driver created successfully with UA: {user_agent[:50]}...")
             return True
@@ -225,6 +344,48 @@ class LinkedInScraper:
             self.logger.error(f"Failed to create driver: {e}")
             return False
     
+    def launch_options(self):
+        """Settings a browser launched by this scraper is started with; DriverPool only reuses on a match"""
+        policy = self.resource_policy
+        return {
+            'proxy': self.proxy,
+            'headless': self.headless,
+            'page_load_strategy': self.page_load_strategy,
+            # Blocked URLs, the images pref and the performance-log capability all come from the policy
+            'resource_policy': (policy.block_types, tuple(policy.patterns), policy.measure) if policy else None
+        }
+    
+    def attach_driver(self, driver):
+        """Wire an already created driver (Chrome or the offline ReplayDriver) into the scraper"""
+        self.driver = driver
+        
+        # Initialize behavior simulator
+        self.behavior_simulator = self.tracer.instrument(
+            HumanBehaviorSimulator(self.driver, clock=self.clock), 'behaviour'
+        )
+        
+        # No implicit wait: missing selectors fail fast and anchors use bounded explicit waits
+        self.driver.implicitly_wait(0)
+        self.driver.set_page_load_timeout(30)
+        
+        # Create WebDriverWait instance
+        self.wait = WebDriverWait(self.driver, 20)
+        
+        # Fast-fail lookup layer shared by every extraction method
+        self.locator = ElementLocator(
+            self.driver,
+            implicit_wait=LEGACY_IMPLICIT_WAIT,
+            anchor_timeout=20,
+            ranking=self.selector_ranking
+        )
+        
+        # Block resources the extractors never read before the first navigation
+        if self.resource_policy:
+            self.resource_policy.apply(self.driver)
+        
+        # Execute additional stealth JavaScript
+        self._execute_stealth_scripts()
+    
     def _execute_stealth_scripts(self):
         """Execute additional JavaScript for stealth browsing"""
         try:
@@ -297,10 +458,10 @@ class LinkedInScraper:
             self.logger.info("Starting LinkedIn login process...")
             
             # Navigate to LinkedIn login page
-            self.driver.get("https://www.linkedin.com/login")
+            self._navigate("https://www.linkedin.com/login", 'login')
             
             # Wait for page load and simulate reading time
-            time.sleep(random.uniform(2, 5))
+            self.clock.sleep(random.uniform(2, 5))
             self.behavior_simulator.simulate_page_interaction("casual")
             
             # Apply request throttling for login
@@ -314,26 +475,20 @@ class LinkedInScraper:
                 "#session_key"
             ]
             
-            email_element = None
-            for selector in email_selectors:
-                try:
-                    email_element = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                    break
-                except TimeoutException:
-                    continue
+            email_element = self.locator.wait_for_anchor(email_selectors)
             # print(email_element)
             if not email_element:
                 raise Exception("Could not find email input field")
             
             # Simulate human-like interaction with email field
             self.behavior_simulator.simulate_mouse_movement(email_element, "precise")
-            time.sleep(random.uniform(0.5, 1.5))
+            self.clock.sleep(random.uniform(0.5, 1.5))
             # print("...")
             # Type email with human-like behavior
             self.behavior_simulator.simulate_typing(email_element, email, "normal")
             # print("..")
             # Small delay before moving to password field
-            time.sleep(random.uniform(1, 3))
+            self.clock.sleep(random.uniform(1, 3))
             
             # Find password field
             password_selectors = [
@@ -343,26 +498,20 @@ class LinkedInScraper:
                 "#session_password"
             ]
             
-            password_element = None
-            for selector in password_selectors:
-                try:
-                    password_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    break
-                except NoSuchElementException:
-                    continue
+            password_element = self.locator.find_first(password_selectors, field='login_password')
             
             if not password_element:
                 raise Exception("Could not find password input field")
             
             # Simulate mouse movement to password field
             self.behavior_simulator.simulate_mouse_movement(password_element, "smooth")
-            time.sleep(random.uniform(0.5, 1.5))
+            self.clock.sleep(random.uniform(0.5, 1.5))
             
             # Type password with human-like behavior
             self.behavior_simulator.simulate_typing(password_element, password, "careful")
             
             # Simulate brief hesitation before clicking login
-            time.sleep(random.uniform(2, 4))
+            self.clock.sleep(random.uniform(2, 4))
             self.behavior_simulator.simulate_page_interaction("focused")
             
             # Find and click login button
@@ -373,25 +522,19 @@ class LinkedInScraper:
                 "input[type='submit']"
             ]
             
-            login_button = None
-            for selector in login_selectors:
-                try:
-                    login_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    break
-                except NoSuchElementException:
-                    continue
+            login_button = self.locator.find_first(login_selectors, field='login_button')
             
             if not login_button:
                 raise Exception("Could not find login button")
             
             # Simulate human-like click
             self.behavior_simulator.simulate_mouse_movement(login_button, "precise")
-            time.sleep(random.uniform(0.5, 1.0))
+            self.clock.sleep(random.uniform(0.5, 1.0))
             login_button.click()
             
             # Wait for login to complete
             self.logger.info("Waiting for login to complete...")
-            time.sleep(random.uniform(3, 7))
+            self.clock.sleep(random.uniform(3, 7))
             
             # Check for successful login or potential issues
             current_url = self.driver.current_url
@@ -399,7 +542,11 @@ class LinkedInScraper:
             if "challenge" in current_url or "checkpoint" in current_url:
                 self.logger.warning("Login challenge/checkpoint detected")
                 self.health_monitor['captcha_encounters'] += 1
-                return self._handle_login_challenge()
+                self._count('captcha_encounters')
+                if self._handle_login_challenge():
+                    self._save_session(email)
+                    return True
+                return False
             
             elif "feed" in current_url or "linkedin.com/in/" in current_url or self.driver.current_url == "https://www.linkedin.com/feed/":
                 self.logger.info("Login successful!")
@@ -407,6 +554,7 @@ class LinkedInScraper:
                 
                 # Save session cookies for later use
                 self.session_cookies = self.driver.get_cookies()
+                self._save_session(email)
                 
                 # Simulate post-login browsing behavior
                 self.behavior_simulator.simulate_human_scrolling("browsing")
@@ -419,7 +567,7 @@ class LinkedInScraper:
                 if error_elements:
                     error_text = error_elements[0].text
                     self.logger.error(f"Login failed with error: {error_text}")
-                    self.health_monitor['consecutive_errors'] += 1
+                    self._record_error()
                 else:
                     self.logger.error("Login failed - unknown error")
                 
@@ -427,9 +575,68 @@ class LinkedInScraper:
         
         except Exception as e:
             self.logger.error(f"Login failed: {e}")
-            self.health_monitor['consecutive_errors'] += 1
+            self._record_error()
+            return False
+    
+    def restore_session(self, email):
+        """Reuse the stored session for email, checked with one feed navigation.
+
+        Returns False when there is no usable session, in which case login() is needed.
+        """
+        if not self.session_store:
+            return False
+        cookies = self.session_store.load(email)
+        if not cookies:
+            return False
+        try:
+            self._set_cookies(cookies)
+            self.throttler.wait_for_next_request("login")
+            self._navigate("https://www.linkedin.com/feed/", 'feed')
+            
+            # An expired session is redirected to the login page, authwall or a checkpoint
+            if "feed" not in self.driver.current_url:
+                self.logger.info("Stored session has expired; a full login is needed")
+                self.session_store.clear(email)
+                self.driver.delete_all_cookies()
+                return False
+            
+            self.logger.info("Restored stored login session")
+            self.session_data['last_activity'] = time.time()
+            # LinkedIn rotates some cookies on every visit; keep the newest ones
+            self.session_cookies = self.driver.get_cookies()
+            self._save_session(email)
+            return True
+        
+        except Exception as e:
+            self.logger.warning(f"Could not restore stored session: {e}")
             return False
     
+    def _set_cookies(self, cookies):
+        """Install cookies through CDP, which unlike add_cookie does not need the domain loaded first"""
+        try:
+            self.driver.execute_cdp_cmd('Network.setCookies', {'cookies': [
+                {
+                    'name': c['name'],
+                    'value': c['value'],
+                    'domain': c.get('domain', '.linkedin.com'),
+                    'path': c.get('path', '/'),
+                    'secure': c.get('secure', False),
+                    'httpOnly': c.get('httpOnly', False),
+                    **({'sameSite': c['sameSite']} if c.get('sameSite') in ('Strict', 'Lax', 'None') else {}),
+                    **({'expires': c['expiry']} if 'expiry' in c else {})
+                }
+                for c in cookies
+            ]})
+        except Exception as e:
+            self.logger.debug(f"CDP cookie restore unavailable ({e}); loading the domain first")
+            self._navigate("https://www.linkedin.com/robots.txt", 'feed')
+            for cookie in cookies:
+                self.driver.add_cookie(cookie)
+    
+    def _save_session(self, email):
+        if self.session_store and self.session_cookies:
+            self.session_store.save(email, self.session_cookies)
+    
     def _handle_login_challenge(self):
         """Handle login challenges/captchas"""
         try:
@@ -438,7 +645,7 @@ class LinkedInScraper:
             # Wait longer for manual intervention if not headless
             if not self.headless:
                 self.logger.info("Please complete the challenge manually. Waiting...")
-                time.sleep(60)  # Wait 1 minute for manual completion
+                self.clock.sleep(60)  # Wait 1 minute for manual completion
                 
                 # Check if challenge was completed
                 if "feed" in self.driver.current_url or "linkedin.com/in/" in self.driver.current_url:
@@ -458,6 +665,7 @@ class LinkedInScraper:
         # print(max_results)
         try:
             self.logger.info(f"Starting profile search for: {keywords}")
+            self.search_keywords = keywords
             
             # Build search URL with parameters
             search_url = f"https://www.linkedin.com/search/results/people/?keywords={keywords.replace(' ', '%20')}"
@@ -469,48 +677,96 @@ class LinkedInScraper:
             if industry:
                 search_url += f"&industry=%5B%22{industry}%22%5D"
             
+            # Resume an interrupted search on the page after the last finished one
+            page_count = 0
+            page_url = search_url
+            resume = self.checkpoint.search_state(search_url) if self.checkpoint else None
+            if resume:
+                # Cards reloaded from the checkpoint file are plain dicts
+                resumed = [SearchResult.coerce(card) for card in resume['profiles']]
+                if resume['complete'] or len(resumed) >= max_results:
+                    self.logger.info(f"Search already completed in a previous run: {search_url}")
+                    return resumed[:max_results]
+                profiles = resumed
+                page_count = resume['page']
+                page_url = f"{search_url}&page={page_count + 1}"
+                self.logger.info(f"Resuming search at page {page_count + 1} with {len(profiles)} profiles")
+            
+            max_pages = min(10, (max_results // 10) + 1)
+            
+            # Answer pages a recent identical query already extracted without navigating
+            exhausted = False
+            while self.search_cache and len(profiles) < max_results and page_count < max_pages:
+                cached = self.search_cache.get(search_url, page_count + 1, max_results)
+                if cached is None:
+                    break
+                page_count += 1
+                self.logger.info(f"Search results page {page_count} served from cache")
+                page_profiles = self._dedupe_search_results([SearchResult.coerce(card) for card in cached['profiles']])
+                profiles.extend(page_profiles)
+                self._record_search_page(search_url, keywords, page_count, page_profiles)
+                self.session_data['search_pages_cached'] += 1
+                self._count('search_pages_cached')
+                if not cached['has_next']:
+                    exhausted = True
+                    break
+            
+            if exhausted or len(profiles) >= max_results or page_count >= max_pages:
+                if self.checkpoint:
+                    self.checkpoint.mark_search_complete(search_url)
+                self.logger.info(f"Found {len(profiles)} profiles from search")
+                return profiles[:max_results]
+            if page_count:
+                page_url = f"{search_url}&page={page_count + 1}"
+            
             # Apply request throttling
             self.throttler.wait_for_next_request("search")
             
             # Navigate to search page
-            self.driver.get(search_url)
-            self.logger.info(f"Navigated to search URL: {search_url}")
+            self._navigate(page_url, 'search')
+            self.logger.info(f"Navigated to search URL: {page_url}")
             
-            # Wait for search results to load
-            time.sleep(random.uniform(3, 6))
+            # Continue as soon as the results are in the DOM
+            if not self._wait_until_ready('search'):
+                self.logger.warning("No search results found or page didn't load properly")
+                return profiles
             
             # Simulate human reading behavior
             self.behavior_simulator.simulate_human_scrolling("search_results")
             # self.behavior_simulator.simulate_page_interaction("searching")
             
-            # Check for search results
-            try:
-                # self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".search-result__wrapper")))
-                self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".search-results-container")))
-
-            except TimeoutException:
-                self.logger.warning("No search results found or page didn't load properly")
-                return profiles
-            
-            page_count = 0
-            max_pages = min(10, (max_results // 10) + 1)
             # print(max_pages, max_results)
             while len(profiles) < max_results and page_count < max_pages:
                 page_count += 1
                 self.logger.info(f"Processing search results page {page_count}")
                 
                 # Get current page results
-                page_profiles = self._extract_search_results(max_results)
+                extract_start = time.perf_counter()
+                with self.tracer.span('extract.search_results', 'extract', page=page_count) as span:
+                    extracted = self._extract_search_results(max_results)
+                    span.set(results=len(extracted))
+                if self.metrics:
+                    self.extraction_histogram.observe(time.perf_counter() - extract_start, page_type='search')
+                self._record_page_timing('search', 'extract')
+                if self.snapshot_archive:
+                    self._archive_page('search', search_page_key(search_url, page_count), self.driver.page_source)
+                if self.search_cache:
+                    self.search_cache.put(search_url, page_count, extracted, max_results)
+                page_profiles = self._dedupe_search_results(extracted)
                 profiles.extend(page_profiles)
+                self._record_search_page(search_url, keywords, page_count, page_profiles)
                 
                 # Update session data
                 self.session_data['searches_performed'] += 1
+                self._count('searches')
                 
                 if len(profiles) >= max_results:
                     break
                 
                 # Navigate to next page with human-like behavior
                 if not self._go_to_next_page():
+                    if self.search_cache:
+                        self.search_cache.mark_last_page(search_url, page_count)
                     break
                 
                 # Random delay between pages
@@ -519,33 +775,54 @@ class LinkedInScraper:
                 # Simulate reading new page
                 self.behavior_simulator.simulate_human_scrolling("search_results")
             
+            if self.checkpoint:
+                self.checkpoint.mark_search_complete(search_url)
+            
             self.logger.info(f"Found {len(profiles)} profiles from search")
             return profiles[:max_results]
         
         except Exception as e:
             self.logger.error(f"Profile search failed: {e}")
-            self.health_monitor['consecutive_errors'] += 1
+            self._record_error()
             return profiles
     
+    def _record_search_page(self, search_url, keywords, page, page_profiles):
+        """Stream, store and checkpoint one finished results page"""
+        self._emit('search_page', {
+            'search_url': search_url,
+            'keywords': keywords,
+            'page': page,
+            'profiles': page_profiles
+        })
+        self._store(page_profiles)
+        if self.checkpoint:
+            self.checkpoint.record_page(search_url, page, page_profiles)
+    
+    def _dedupe_search_results(self, page_profiles):
+        """Drop profiles already returned this session (same person under another tracking URL)"""
+        unique = []
+        for profile in page_profiles:
+            key = canonicalize_profile_url(profile.get('profile_url'))
+            if key and key in self.seen_profile_urls:
+                continue
+            self.seen_profile_urls.add(key)
+            unique.append(profile)
+        if len(unique) < len(page_profiles):
+            self.logger.info(f"Dropped {len(page_profiles) - len(unique)} duplicate search results")
+        return unique
+    
     def _extract_search_results(self, max_results):
         """Extract profile data from search results page"""
         profiles = []
         
+        if self.batch_search_extraction:
+            batch_profiles = self._extract_search_results_batch(max_results)
+            if batch_profiles is not None:
+                return batch_profiles
+            self.logger.info("Batch search extraction unavailable, falling back to per-card extraction")
+        
         try:
-            # Multiple selectors for different LinkedIn layouts
-            result_selectors = [
-                # ".search-result__wrapper",
-                # ".search-results__result-item",
-                # ".reusable-search__result-container",
-                # ".search-entity-result-universal-template",
-                "div[data-view-name='search-entity-result-universal-template']"
-            ]
-           
-            search_results = []
-            for selector in result_selectors:
-                search_results = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if search_results:
-                    break
+            search_results = self.locator.find_all(SearchResultExtractor.result_selectors, field='search_results')
             
             if not search_results:
                 self.logger.warning("No search result elements found")
@@ -569,7 +846,7 @@ class LinkedInScraper:
                         # Occasional mouse movement for realism
                         if i % 3 == 0:
                             self.behavior_simulator.simulate_mouse_movement(result, "casual")
-                            time.sleep(random.uniform(0.5, 1.5))
+                            self.clock.sleep(random.uniform(0.5, 1.5))
                     
                 except Exception as e:
                     self.logger.debug(f"Failed to extract profile from result {i}: {e}")
@@ -581,10 +858,46 @@ class LinkedInScraper:
             self.logger.error(f"Failed to extract search results: {e}")
             return profiles
     
+    def _extract_search_results_batch(self, max_results, retries=1):
+        """Harvest every card on the page with a single execute_script call; None means fall back"""
+        try:
+            result_selectors = self.selector_ranking.rank('search_results', SearchResultExtractor.result_selectors)
+            script_args = self.search_extractor.batch_script_args(result_selectors, max_results)
+            
+            harvest = self.driver.execute_script(SearchResultExtractor.BATCH_SCRIPT, *script_args)
+            # Cards whose name span has not rendered yet get one short grace period
+            while retries > 0 and harvest and any(card and card.get('pending') for card in harvest['cards']):
+                retries -= 1
+                self.clock.sleep(random.uniform(0.5, 1.5))
+                harvest = self.driver.execute_script(SearchResultExtractor.BATCH_SCRIPT, *script_args)
+            
+            if not harvest or harvest['index'] < 0:
+                self.selector_ranking.record('search_results', result_selectors, None)
+                self.logger.warning("No search result elements found")
+                return []
+            
+            self.selector_ranking.record('search_results', result_selectors, result_selectors[harvest['index']])
+            self.locator.record_misses(harvest['index'])
+            
+            raw_cards = harvest['cards']
+            self.logger.info(f"Harvested {len(raw_cards)} search result cards in one call")
+            profiles = self.search_extractor.build_records(raw_cards, self.clock.now().isoformat())
+            
+            # Occasional mouse movement for realism
+            for _ in range(0, len(profiles), 3):
+                self.behavior_simulator.simulate_mouse_movement(style="casual")
+                self.clock.sleep(random.uniform(0.5, 1.5))
+            
+            return profiles
+            
+        except Exception as e:
+            self.logger.debug(f"Batch search extraction failed: {e}")
+            return None
+    
     def _extract_profile_from_search_result(self, result_element):
         """Extract individual profile data from search result element"""
         try:
-            profile_data = {}
+            profile_data = SearchResult()
             # print("-----------")
             # Extract name
             # name_selectors = [
@@ -624,8 +937,8 @@ class LinkedInScraper:
                 
                 # name_element = anchor_element.find_element(By.CSS_SELECTOR, "span[aria-hidden='true']")
                 
-                profile_data['name'] = name_element.text.strip()
-                profile_data['profile_url'] = anchor_element.get_attribute('href')
+                profile_data.name = name_element.text.strip()
+                profile_data.profile_url = anchor_element.get_attribute('href')
                 # print("''''''''", profile_data)
             except NoSuchElementException:
                 print("some error")
@@ -633,32 +946,16 @@ class LinkedInScraper:
 
             
             # Extract headline/title
-            headline_selectors = [
-                ".t-14.t-black.t-normal",
-            ]
-            
-            for selector in headline_selectors:
-                try:
-                    headline_elem = result_element.find_element(By.CSS_SELECTOR, selector)
-                    profile_data['headline'] = headline_elem.text.strip()
-                    break
-                except NoSuchElementException:
-                    continue
+            headline_elem = self.locator.find_first(SearchResultExtractor.headline_selectors, root=result_element, field='search_headline')
+            if headline_elem:
+                profile_data.headline = headline_elem.text.strip()
             
             # Extract location
-            location_selectors = [
-                "div.t-14.t-normal:not(.t-black)",
-            ]
-            
-            for selector in location_selectors:
-                try:
-                    location_elem = result_element.find_element(By.CSS_SELECTOR, selector)
-                    location_text = location_elem.text.strip()
-                    if location_text and len(location_text) < 100:  # Reasonable location length
-                        profile_data['location'] = location_text
-                    break
-                except NoSuchElementException:
-                    continue
+            location_elem = self.locator.find_first(SearchResultExtractor.location_selectors, root=result_element, field='search_location')
+            if location_elem:
+                location_text = location_elem.text.strip()
+                if location_text and len(location_text) < 100:  # Reasonable location length
+                    profile_data.location = location_text
             
             # Extract mutual connections if available
             # try:
@@ -668,14 +965,11 @@ class LinkedInScraper:
             #     profile_data['mutual_connections'] = None
             
             # Extract company if visible
-            try:
-                company_elem = result_element.find_element(By.CSS_SELECTOR, ".entity-result__summary--2-lines")
-                profile_data['current_company'] = company_elem.text.strip()
-            except NoSuchElementException:
-                profile_data['current_company'] = None
+            company_elem = self.locator.find_first(SearchResultExtractor.company_selectors, root=result_element)
+            profile_data.current_company = company_elem.text.strip() if company_elem else None
             
             # Add extraction timestamp
-            profile_data['scraped_at'] = datetime.datetime.now().isoformat()
+            profile_data.scraped_at = self.clock.now().isoformat()
             
             return profile_data
             
@@ -694,16 +988,7 @@ class LinkedInScraper:
                 ".pv2 button[aria-label='Next']"
             ]
             
-            next_button = None
-            for selector in next_selectors:
-                try:
-                    next_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if next_button.is_enabled():
-                        break
-                    else:
-                        next_button = None
-                except NoSuchElementException:
-                    continue
+            next_button = self.locator.find_first(next_selectors, condition="enabled", field='next_button')
             
             if not next_button:
                 self.logger.info("No next page button found or disabled")
@@ -711,24 +996,45 @@ class LinkedInScraper:
             
             # Scroll to button and simulate human interaction
             self.driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
-            time.sleep(random.uniform(1, 2))
+            self.clock.sleep(random.uniform(1, 2))
             
             self.behavior_simulator.simulate_mouse_movement(next_button, "precise")
-            time.sleep(random.uniform(0.5, 1.5))
+            self.clock.sleep(random.uniform(0.5, 1.5))
             
+            previous_url = self.driver.current_url
+            previous_card = self._first_result_anchor()
+            self._page_started = time.perf_counter()
             next_button.click()
             
-            # Wait for new page to load
-            time.sleep(random.uniform(3, 6))
-            
-            return True
+            # Results are replaced client-side: wait for the URL to move on, the old cards to go and the new ones to render
+            return self._wait_until_ready('search', previous_url=previous_url, previous_card=previous_card)
             
         except Exception as e:
             self.logger.error(f"Failed to go to next page: {e}")
             return False
     
-    def scrape_profile_details(self, profile_url):
-        """Enhanced profile scraping with comprehensive data extraction"""
+    def scrape_profile_details(self, profile_url, search_result=None):
+        """Enhanced profile scraping with comprehensive data extraction.
+
+        Passing the search_result the URL came from lets the profile store skip
+        profiles whose card is unchanged and whose details are still fresh.
+        """
+        if self.checkpoint and self.checkpoint.should_skip(profile_url):
+            self.logger.info(f"Skipping profile handled in a previous run: {profile_url}")
+            return None
+        # With a freshness window the profile store decides when a profile is due again;
+        # the dedup index would otherwise skip every profile it has ever seen
+        incremental = self.profile_store and self.profile_store.freshness_window
+        if self.dedup_index and not incremental and self.dedup_index.contains(profile_url):
+            self.logger.info(f"Skipping already scraped profile: {profile_url}")
+            return None
+        if self.profile_store and search_result and self.profile_store.is_fresh(search_result):
+            self.logger.info(f"Skipping unchanged profile scraped within the freshness window: {profile_url}")
+            self.session_data['profiles_skipped_fresh'] += 1
+            self._count('profiles_skipped_fresh')
+            return None
+        
+        self.tracer.begin('profile', 'profile', url=profile_url)
         try:
             self.logger.info(f"Scraping profile: {profile_url}")
             
@@ -737,408 +1043,237 @@ class LinkedInScraper:
             
             # Navigate to profile
             start_time = time.time()
-            self.driver.get(profile_url)
+            self._navigate(profile_url, 'profile')
             page_load_time = time.time() - start_time
             
-            # Wait for profile to load completely
-            time.sleep(random.uniform(3, 6))
+            # Bounded explicit wait for the top card; everything else fails fast
+            if not self._wait_until_ready('profile'):
+                self.logger.warning(f"Profile top card did not render: {profile_url}")
             
             # Simulate human reading behavior
             self.behavior_simulator.simulate_human_scrolling("profile_reading")
             self.behavior_simulator.simulate_page_interaction("focused")
             
+            # Scroll through the sections so lazily rendered lists are in the DOM
+            self.behavior_simulator.simulate_human_scrolling("section_reading")
+            if not self._wait_until_ready('profile_sections'):
+                self.logger.debug(f"No list sections attached on {profile_url}")
+            
             # Initialize profile data structure
-            profile_data = {
-                'url': profile_url,
-                'scraped_at': datetime.datetime.now().isoformat(),
-                'page_load_time': page_load_time,
-                'personal_info': {},
-                'experience': [],
-                'education': [],
-                'skills': [],
-                'recommendations': [],
-                'connections': None,
-                'about': None,
-                'contact_info': {},
-                'languages': [],
-                'certifications': [],
-                'publications': [],
-                'projects': [],
-                'honors_awards': []
-            }
+            profile_data = ProfileExtractor.new_profile_data(
+                profile_url, self.clock.now().isoformat(), page_load_time
+            )
+            
+            # Expand the truncated about text before the DOM is captured
+            about_expanded = self._expand_about_section()
+            
+            # Take a single DOM snapshot; every section below is parsed in-process
+            extract_start = time.perf_counter()
+            snapshot = self._take_snapshot()
+            self._archive_page('profile', canonicalize_profile_url(profile_url), snapshot.page_source)
             
             # Extract basic profile information
-            self._extract_basic_profile_info(profile_data)
+            self._extract_basic_profile_info(profile_data, snapshot)
             
             # Extract about section
-            self._extract_about_section(profile_data)
+            self._extract_about_section(profile_data, snapshot, about_expanded)
             
             # Extract experience section
-            self._extract_experience_section(profile_data)
+            self._extract_experience_section(profile_data, snapshot)
             
             # Extract education section
-            self._extract_education_section(profile_data)
+            self._extract_education_section(profile_data, snapshot)
             
             # Extract skills section
-            self._extract_skills_section(profile_data)
-            
-            # Extract contact information if available
-            self._extract_contact_info(profile_data)
+            self._extract_skills_section(profile_data, snapshot)
             
             # Extract additional sections
-            self._extract_additional_sections(profile_data)
+            self._extract_additional_sections(profile_data, snapshot)
+            self.locator.record_misses(snapshot.misses)
+            if self.metrics:
+                self.extraction_histogram.observe(time.perf_counter() - extract_start, page_type='profile')
+            self._record_page_timing('profile', 'extract')
+            
+            # Extract contact information if available (opens a modal, so it is not counted as parsing)
+            with self.tracer.span('extract.contact_info', 'extract'):
+                self._extract_contact_info(profile_data)
             
             # Update session statistics
             self.session_data['profiles_scraped'] += 1
+            self._count('profiles_scraped')
             self.session_data['last_activity'] = time.time()
             self.health_monitor['last_successful_scrape'] = time.time()
             self.health_monitor['consecutive_errors'] = 0
             
-            self.logger.info(f"Successfully scraped profile: {profile_data['personal_info'].get('name', 'Unknown')}")
+            self._emit('profile', profile_data)
+            self._store([profile_data])
+            if self.profile_store and search_result:
+                self.profile_store.record_search_card(search_result)
+            if self.checkpoint:
+                self.checkpoint.mark_completed(profile_url)
+            if self.dedup_index:
+                self.dedup_index.add(profile_url)
+            
+            self.logger.info(f"Successfully scraped profile: {profile_data.name or 'Unknown'}")
             return profile_data
             
         except Exception as e:
             self.logger.error(f"Failed to scrape profile {profile_url}: {e}")
-            self.health_monitor['consecutive_errors'] += 1
+            self._record_error()
             self.failed_profiles.append(profile_url)
+            self._count('profiles_failed')
+            if self.checkpoint:
+                self.checkpoint.mark_failed(profile_url)
             return None
+        finally:
+            self.tracer.end('profile', 'profile')
     
-    def _extract_basic_profile_info(self, profile_data):
-        """Extract basic profile information (name, headline, location, etc.)"""
-        try:
-            # Extract name
-            name_selectors = [
-                "h1.text-heading-xlarge",
-                ".pv-text-details__left-panel h1",
-                ".ph5 h1",
-                ".pv-top-card .pv-top-card__name",
-                "h1[data-anonymize='person-name']"
-            ]
-            
-            for selector in name_selectors:
-                try:
-                    name_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    profile_data['personal_info']['name'] = name_elem.text.strip()
-                    break
-                except NoSuchElementException:
-                    continue
-            
-            # Extract headline
-            headline_selectors = [
-                ".text-body-medium.break-words",
-                ".pv-text-details__left-panel .text-body-medium",
-                ".pv-top-card .pv-top-card__headline",
-                "[data-anonymize='headline']"
-            ]
-            
-            for selector in headline_selectors:
-                try:
-                    headline_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    profile_data['personal_info']['headline'] = headline_elem.text.strip()
-                    break
-                except NoSuchElementException:
-                    continue
-            
-            # Extract location
-            location_selectors = [
-                ".text-body-small.inline.t-black--light.break-words",
-                ".pv-text-details__left-panel .text-body-small",
-                ".pv-top-card .pv-top-card__location",
-                "[data-anonymize='location']"
-            ]
-            
-            for selector in location_selectors:
-                try:
-                    location_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    location_text = location_elem.text.strip()
-                    if "connections" not in location_text.lower():
-                        profile_data['personal_info']['location'] = location_text
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            # Extract connection count
-            connections_selectors = [
-                ".pv-top-card .pv-top-card__connections",
-                "a[href*='overlay/connections'] span",
-                ".pv-text-details__left-panel button span"
-            ]
-            
-            for selector in connections_selectors:
-                try:
-                    connections_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    connections_text = connections_elem.text.strip()
-                    if "connection" in connections_text.lower():
-                        profile_data['connections'] = connections_text
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            # Extract profile picture URL
+    def _navigate(self, url, page_type):
+        """Load a page, timed as a navigation span and a page load observation"""
+        if self.resource_policy:
+            self.resource_policy.before_navigation(self.driver)
+        start = self._page_started = time.perf_counter()
+        with self.tracer.span('navigate', 'navigation', url=url, page_type=page_type):
+            self.driver.get(url)
+        load_seconds = time.perf_counter() - start
+        if self.metrics:
+            self.page_load_histogram.observe(load_seconds, page_type=page_type)
+        if self.resource_policy:
+            self.resource_policy.record_navigation(self.driver, url, page_type, load_seconds)
+    
+    def _wait_until_ready(self, page_type, previous_url=None, previous_card=None):
+        """Return as soon as the page type's readiness predicate holds (False on timeout).
+
+        After a client-side page change, previous_url and previous_card (the first result's
+        profile link before the click) must both be replaced first; otherwise the old page's
+        cards would satisfy the predicate immediately.
+        """
+        timeout = READINESS_TIMEOUTS[page_type]
+        with self.tracer.span('ready', 'navigation', page_type=page_type) as span:
+            waits = []
+            if previous_url is not None:
+                waits.append(lambda d: d.current_url != previous_url)
+            if previous_card is not None:
+                previous_href = self._element_href(previous_card)
+                waits.append(lambda d: self._results_replaced(previous_card, previous_href))
             try:
-                img_elem = self.driver.find_element(By.CSS_SELECTOR, ".pv-top-card__photo img, .profile-photo-edit__preview img")
-                profile_data['personal_info']['profile_picture'] = img_elem.get_attribute('src')
-            except NoSuchElementException:
-                profile_data['personal_info']['profile_picture'] = None
-            
-        except Exception as e:
-            self.logger.debug(f"Error extracting basic profile info: {e}")
+                for condition in waits:
+                    WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(condition)
+            except TimeoutException:
+                span.set(ready=False)
+                return False
+            ready = self.locator.wait_until_ready(READINESS_ANCHORS[page_type], timeout)
+            span.set(ready=ready)
+        if page_type in ('search', 'profile'):
+            self._record_page_timing(page_type, 'ready')
+        return ready
     
-    def _extract_about_section(self, profile_data):
-        """Extract the about/summary section"""
+    def _first_result_anchor(self):
+        """Profile link of the first search result card currently in the DOM, or None"""
+        return self.locator.find_first(
+            [f"{selector} {SearchResultExtractor.anchor_selector}" for selector in SearchResultExtractor.result_selectors]
+        )
+    
+    @staticmethod
+    def _element_href(element):
         try:
-            # Scroll to about section
-            self.behavior_simulator.simulate_human_scrolling("section_reading")
-            
-            about_selectors = [
-                "#about ~ .pv-shared-text-with-see-more .inline-show-more-text",
-                ".pv-about-section .pv-about__summary-text",
-                "[data-section='summary'] .pv-about__summary-text",
-                ".summary-section .pv-about__summary-text"
-            ]
-            
-            for selector in about_selectors:
-                try:
-                    about_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    profile_data['about'] = about_elem.text.strip()
-                    break
-                except NoSuchElementException:
-                    continue
-            
-            # Try to click "Show more" if available
-            try:
-                show_more_btn = self.driver.find_element(By.CSS_SELECTOR, ".inline-show-more-text__button")
-                if show_more_btn.is_displayed():
-                    self.behavior_simulator.simulate_mouse_movement(show_more_btn, "precise")
-                    show_more_btn.click()
-                    time.sleep(random.uniform(1, 2))
-                    # Re-extract the expanded text
-                    about_elem = self.driver.find_element(By.CSS_SELECTOR, ".inline-show-more-text__text")
-                    profile_data['about'] = about_elem.text.strip()
-            except NoSuchElementException:
-                pass
-            
+            return element.get_attribute('href')
+        except StaleElementReferenceException:
+            return None
+    
+    def _results_replaced(self, previous_card, previous_href):
+        """The card captured before a page change is detached, or the first card links elsewhere"""
+        try:
+            previous_card.get_attribute('href')
+        except StaleElementReferenceException:
+            return True
+        current = self._first_result_anchor()
+        return current is not None and self._element_href(current) != previous_href
+    
+    def _record_page_timing(self, page_type, phase):
+        """Accumulate seconds from the last navigation start to this phase ('ready' or 'extract')"""
+        if self._page_started is None:
+            return
+        elapsed = time.perf_counter() - self._page_started
+        timings = self.page_timings.setdefault(page_type, {'ready': [0, 0.0], 'extract': [0, 0.0]})
+        timings[phase][0] += 1
+        timings[phase][1] += elapsed
+        if phase == 'extract' and self.metrics:
+            self.time_to_extract_histogram.observe(elapsed, page_type=page_type)
+    
+    def _emit(self, record_type, data):
+        """Stream one result to the output sink, if one is attached"""
+        if not self.output_sink:
+            return
+        try:
+            with self.tracer.span('save.stream', 'save', record_type=record_type):
+                self.output_sink.write(record_type, data)
         except Exception as e:
-            self.logger.debug(f"Error extracting about section: {e}")
+            self.logger.error(f"Failed to stream {record_type} record: {e}")
     
-    def _extract_experience_section(self, profile_data):
-        """Extract work experience information"""
+    def _store(self, records):
+        """Queue results for the profile store, if one is attached"""
+        if not self.profile_store:
+            return
         try:
-            # Scroll to experience section
-            self.behavior_simulator.simulate_human_scrolling("section_reading")
-            time.sleep(random.uniform(1, 3))
-            
-            experience_selectors = [
-                "#experience ~ .pvs-list__container .pvs-list__item",
-                ".pv-profile-section[data-section='experience'] .pv-entity__summary-info",
-                ".experience-section .pv-entity__summary-info"
-            ]
-            
-            experience_items = []
-            for selector in experience_selectors:
-                try:
-                    experience_items = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if experience_items:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            if not experience_items:
-                self.logger.debug("No experience items found")
-                return
-            
-            for item in experience_items[:10]:  # Limit to first 10 experiences
-                try:
-                    experience_data = {}
-                    
-                    # Extract job title
-                    title_selectors = [
-                        ".mr1.hoverable-link-text.t-bold span[aria-hidden='true']",
-                        ".pv-entity__summary-info h3",
-                        ".pvs-entity__summary-title"
-                    ]
-                    
-                    for selector in title_selectors:
-                        try:
-                            title_elem = item.find_element(By.CSS_SELECTOR, selector)
-                            experience_data['title'] = title_elem.text.strip()
-                            break
-                        except NoSuchElementException:
-                            continue
-                    
-                    # Extract company name
-                    company_selectors = [
-                        ".t-14.t-normal span[aria-hidden='true']",
-                        ".pv-entity__secondary-title",
-                        ".pvs-entity__summary-subtitle"
-                    ]
-                    
-                    for selector in company_selectors:
-                        try:
-                            company_elem = item.find_element(By.CSS_SELECTOR, selector)
-                            experience_data['company'] = company_elem.text.strip()
-                            break
-                        except NoSuchElementException:
-                            continue
-                    
-                    # Extract duration
-                    duration_selectors = [
-                        ".t-14.t-normal.t-black--light span[aria-hidden='true']",
-                        ".pv-entity__bullet-item-v2",
-                        ".pvs-entity__caption-wrapper"
-                    ]
-                    
-                    for selector in duration_selectors:
-                        try:
-                            duration_elem = item.find_element(By.CSS_SELECTOR, selector)
-                            duration_text = duration_elem.text.strip()
-                            if any(keyword in duration_text.lower() for keyword in ['year', 'month', 'present', 'yr', 'mo']):
-                                experience_data['duration'] = duration_text
-                                break
-                        except NoSuchElementException:
-                            continue
-                    
-                    # Extract location
-                    try:
-                        location_elem = item.find_element(By.CSS_SELECTOR, ".pv-entity__location span")
-                        experience_data['location'] = location_elem.text.strip()
-                    except NoSuchElementException:
-                        experience_data['location'] = None
-                    
-                    # Extract description if available
-                    try:
-                        desc_elem = item.find_element(By.CSS_SELECTOR, ".pv-entity__description")
-                        experience_data['description'] = desc_elem.text.strip()
-                    except NoSuchElementException:
-                        experience_data['description'] = None
-                    
-                    if experience_data.get('title') or experience_data.get('company'):
-                        profile_data['experience'].append(experience_data)
-                
-                except Exception as e:
-                    self.logger.debug(f"Error extracting individual experience: {e}")
-                    continue
-            
+            with self.tracer.span('save.profile_store', 'save', records=len(records)):
+                for record in records:
+                    self.profile_store.add(record)
         except Exception as e:
-            self.logger.debug(f"Error extracting experience section: {e}")
+            self.logger.error(f"Failed to store {len(records)} records: {e}")
     
-    def _extract_education_section(self, profile_data):
-        """Extract education information"""
+    def _archive_page(self, page_type, url, html):
+        """Keep a visited page's HTML in the snapshot archive, if one is attached"""
+        if not self.snapshot_archive:
+            return
         try:
-            # Scroll to education section
-            self.behavior_simulator.simulate_human_scrolling("section_reading")
-            
-            education_selectors = [
-                "#education ~ .pvs-list__container .pvs-list__item",
-                ".pv-profile-section[data-section='education'] .pv-entity__summary-info",
-                ".education-section .pv-entity__summary-info"
-            ]
-            
-            education_items = []
-            for selector in education_selectors:
-                try:
-                    education_items = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if education_items:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            for item in education_items[:5]:  # Limit to first 5 education entries
-                try:
-                    education_data = {}
-                    
-                    # Extract school name
-                    school_selectors = [
-                        ".mr1.hoverable-link-text.t-bold span[aria-hidden='true']",
-                        ".pv-entity__school-name",
-                        ".pvs-entity__summary-title"
-                    ]
-                    
-                    for selector in school_selectors:
-                        try:
-                            school_elem = item.find_element(By.CSS_SELECTOR, selector)
-                            education_data['school'] = school_elem.text.strip()
-                            break
-                        except NoSuchElementException:
-                            continue
-                    
-                    # Extract degree
-                    degree_selectors = [
-                        ".t-14.t-normal span[aria-hidden='true']",
-                        ".pv-entity__degree-name",
-                        ".pvs-entity__summary-subtitle"
-                    ]
-                    
-                    for selector in degree_selectors:
-                        try:
-                            degree_elem = item.find_element(By.CSS_SELECTOR, selector)
-                            education_data['degree'] = degree_elem.text.strip()
-                            break
-                        except NoSuchElementException:
-                            continue
-                    
-                    # Extract duration
-                    try:
-                        duration_elem = item.find_element(By.CSS_SELECTOR, ".pv-entity__dates span")
-                        education_data['duration'] = duration_elem.text.strip()
-                    except NoSuchElementException:
-                        education_data['duration'] = None
-                    
-                    if education_data.get('school'):
-                        profile_data['education'].append(education_data)
-                
-                except Exception as e:
-                    self.logger.debug(f"Error extracting individual education: {e}")
-                    continue
-            
+            with self.tracer.span('save.snapshot_archive', 'save', page_type=page_type):
+                self.snapshot_archive.add(page_type, url, html, captured_at=self.clock.time())
         except Exception as e:
-            self.logger.debug(f"Error extracting education section: {e}")
+            self.logger.error(f"Failed to archive {page_type} page {url}: {e}")
     
-    def _extract_skills_section(self, profile_data):
-        """Extract skills information"""
+    def _take_snapshot(self, root_selector=None):
+        """Capture the current DOM (or one subtree) in a single WebDriver call"""
+        with self.tracer.span('snapshot', 'extract'):
+            return DOMSnapshot.from_driver(self.driver, root_selector)
+    
+    def _expand_about_section(self):
+        """Click the about section's "Show more" button if present; returns True when expanded"""
         try:
-            # Scroll to skills section
-            self.behavior_simulator.simulate_human_scrolling("section_reading")
-            
-            skills_selectors = [
-                "#skills ~ .pvs-list__container .pvs-list__item",
-                ".pv-profile-section[data-section='skills'] .pv-skill-category-entity",
-                ".skills-section .pv-skill-category-entity"
-            ]
-            
-            skills_items = []
-            for selector in skills_selectors:
-                try:
-                    skills_items = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if skills_items:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            for item in skills_items[:20]:  # Limit to first 20 skills
-                try:
-                    skill_name_selectors = [
-                        ".mr1.hoverable-link-text.t-bold span[aria-hidden='true']",
-                        ".pv-skill-category-entity__name",
-                        ".pvs-entity__summary-title"
-                    ]
-                    
-                    for selector in skill_name_selectors:
-                        try:
-                            skill_elem = item.find_element(By.CSS_SELECTOR, selector)
-                            skill_name = skill_elem.text.strip()
-                            if skill_name and skill_name not in profile_data['skills']:
-                                profile_data['skills'].append(skill_name)
-                            break
-                        except NoSuchElementException:
-                            continue
-                
-                except Exception as e:
-                    self.logger.debug(f"Error extracting individual skill: {e}")
-                    continue
-            
+            show_more_btn = self.locator.find_first([".inline-show-more-text__button"], condition="displayed")
+            if show_more_btn:
+                self.behavior_simulator.simulate_mouse_movement(show_more_btn, "precise")
+                show_more_btn.click()
+                self.clock.sleep(random.uniform(1, 2))
+                return True
         except Exception as e:
-            self.logger.debug(f"Error extracting skills section: {e}")
+            self.logger.debug(f"Could not expand about section: {e}")
+        return False
+    
+    def _extract_basic_profile_info(self, profile_data, snapshot):
+        """Extract basic profile information (name, headline, location, etc.)"""
+        with self.tracer.span('extract.basic_info', 'extract'):
+            self.extractor.extract_basic_profile_info(snapshot, profile_data)
+    
+    def _extract_about_section(self, profile_data, snapshot, expanded=False):
+        """Extract the about/summary section"""
+        with self.tracer.span('extract.about', 'extract'):
+            self.extractor.extract_about_section(snapshot, profile_data, expanded)
+    
+    def _extract_experience_section(self, profile_data, snapshot):
+        """Extract work experience information"""
+        with self.tracer.span('extract.experience', 'extract'):
+            self.extractor.extract_experience_section(snapshot, profile_data)
+    
+    def _extract_education_section(self, profile_data, snapshot):
+        """Extract education information"""
+        with self.tracer.span('extract.education', 'extract'):
+            self.extractor.extract_education_section(snapshot, profile_data)
+    
+    def _extract_skills_section(self, profile_data, snapshot):
+        """Extract skills information"""
+        with self.tracer.span('extract.skills', 'extract'):
+            self.extractor.extract_skills_section(snapshot, profile_data)
     
     def _extract_contact_info(self, profile_data):
         """Extract contact information if available"""
@@ -1150,113 +1285,50 @@ class LinkedInScraper:
                 "button[aria-label*='Contact']"
             ]
             
-            contact_button = None
-            for selector in contact_selectors:
-                try:
-                    contact_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if contact_button.is_displayed():
-                        break
-                    else:
-                        contact_button = None
-                except NoSuchElementException:
-                    continue
+            contact_button = self.locator.find_first(contact_selectors, condition="displayed", field='contact_button')
             
             if contact_button:
                 self.behavior_simulator.simulate_mouse_movement(contact_button, "precise")
                 contact_button.click()
-                time.sleep(random.uniform(2, 4))
+                self.clock.sleep(random.uniform(2, 4))
                 
-                # Extract contact information from modal
-                contact_info_selectors = [
-                    ".pv-contact-info__contact-type",
-                    ".ci-email a",
-                    ".ci-phone",
-                    ".ci-websites a"
-                ]
-                
-                for selector in contact_info_selectors:
-                    try:
-                        contact_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        for elem in contact_elements:
-                            text = elem.text.strip()
-                            if "@" in text:
-                                profile_data['contact_info']['email'] = text
-                            elif text.startswith(('http', 'www')):
-                                if 'websites' not in profile_data['contact_info']:
-                                    profile_data['contact_info']['websites'] = []
-                                profile_data['contact_info']['websites'].append(text)
-                            elif any(char.isdigit() for char in text) and len(text) > 5:
-                                profile_data['contact_info']['phone'] = text
-                    except NoSuchElementException:
-                        continue
+                # Parse the contact information modal from one snapshot
+                self.extractor.extract_contact_info(self._take_snapshot(), profile_data)
                 
                 # Close contact info modal
-                try:
-                    close_button = self.driver.find_element(By.CSS_SELECTOR, ".artdeco-modal__dismiss")
+                close_button = self.locator.find_first([".artdeco-modal__dismiss"])
+                if close_button:
                     close_button.click()
-                    time.sleep(random.uniform(1, 2))
-                except NoSuchElementException:
+                    self.clock.sleep(random.uniform(1, 2))
+                else:
                     # Press Escape to close modal
                     ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
             
         except Exception as e:
             self.logger.debug(f"Error extracting contact info: {e}")
     
-    def _extract_additional_sections(self, profile_data):
+    def _extract_additional_sections(self, profile_data, snapshot):
         """Extract additional profile sections (certifications, languages, etc.)"""
-        try:
-            # Extract certifications
-            cert_selectors = [
-                "#licenses_and_certifications ~ .pvs-list__container .pvs-list__item",
-                ".pv-profile-section[data-section='certifications'] .pv-entity__summary-info"
-            ]
-            
-            for selector in cert_selectors:
-                try:
-                    cert_items = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for item in cert_items[:5]:
-                        try:
-                            cert_name = item.find_element(By.CSS_SELECTOR, ".mr1.hoverable-link-text.t-bold span").text.strip()
-                            cert_issuer = item.find_element(By.CSS_SELECTOR, ".t-14.t-normal span").text.strip()
-                            profile_data['certifications'].append({
-                                'name': cert_name,
-                                'issuer': cert_issuer
-                            })
-                        except NoSuchElementException:
-                            continue
-                    break
-                except NoSuchElementException:
-                    continue
-            
-            # Extract languages
-            lang_selectors = [
-                "#languages ~ .pvs-list__container .pvs-list__item",
-                ".pv-profile-section[data-section='languages'] .pv-entity__summary-info"
-            ]
-            
-            for selector in lang_selectors:
-                try:
-                    lang_items = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for item in lang_items[:5]:
-                        try:
-                            lang_name = item.find_element(By.CSS_SELECTOR, ".mr1.hoverable-link-text.t-bold span").text.strip()
-                            profile_data['languages'].append(lang_name)
-                        except NoSuchElementException:
-                            continue
-                    break
-                except NoSuchElementException:
-                    continue
-            
-        except Exception as e:
-            self.logger.debug(f"Error extracting additional sections: {e}")
+        with self.tracer.span('extract.additional_sections', 'extract'):
+            self.extractor.extract_additional_sections(snapshot, profile_data)
     
-    def save_data(self, filename=None, format='json'):
+    def save_data(self, filename=None, format='json', keywords=None):
         """Save scraped data to file"""
+        self.tracer.begin('save', 'save', format=format, records=len(self.scraped_data))
         try:
             filepath = ""
             output_dir = "output"
             os.makedirs(output_dir, exist_ok=True)
 
+            if format.lower() == 'parquet':
+                from utils.columnar_export import write_parquet_dataset
+                
+                # Partitioned datasets accumulate under one root instead of one file per run
+                filepath = os.path.join(output_dir, filename or "parquet")
+                write_parquet_dataset(self.scraped_data, filepath, keywords or self.search_keywords)
+                self.logger.info(f"Data saved to {filepath}")
+                return filepath
+
             if not filename:
                 timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"linkedin_profiles_{timestamp}"
@@ -1265,7 +1337,7 @@ class LinkedInScraper:
                 filename += '.json'
                 filepath = os.path.join(output_dir, filename)
                 with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(self.scraped_data, f, indent=2, ensure_ascii=False)
+                    json.dump(self.scraped_data, f, indent=2, ensure_ascii=False, default=json_default)
             
             elif format.lower() == 'csv':
                 filename += '.csv'
@@ -1280,10 +1352,7 @@ class LinkedInScraper:
                     # flattened_data = []
                     for profile in self.scraped_data[0]:
                         print(profile)
-                        writer.writerow([
-                            profile['name'], profile['headline'], profile['location'], profile['profile_url'],
-                            profile['current_company'], profile['scraped_at']
-                        ])
+                        writer.writerow(SearchResult.coerce(profile).to_row())
                         # flat_profile = {
                         #     'name': profile['name'],
                         #     'headline': profile['headline'],
@@ -1309,6 +1378,8 @@ class LinkedInScraper:
         except Exception as e:
             self.logger.error(f"Failed to save data: {e}")
             return None
+        finally:
+            self.tracer.end('save', 'save')
     
     def get_session_stats(self):
         """Get current session statistics"""
@@ -1319,6 +1390,8 @@ class LinkedInScraper:
             'session_duration_minutes': round(session_duration / 60, 2),
             'profiles_scraped': self.session_data['profiles_scraped'],
             'searches_performed': self.session_data['searches_performed'],
+            'profiles_skipped_fresh': self.session_data['profiles_skipped_fresh'],
+            'search_pages_cached': self.session_data['search_pages_cached'],
             'failed_profiles': len(self.failed_profiles),
             'success_rate': (self.session_data['profiles_scraped'] / max(1, self.session_data['profiles_scraped'] + len(self.failed_profiles))) * 100,
             'average_time_per_profile': round(session_duration / max(1, self.session_data['profiles_scraped']), 2),
@@ -1327,19 +1400,86 @@ class LinkedInScraper:
             'captcha_encounters': self.health_monitor['captcha_encounters']
         }
         
+        if self.locator:
+            stats['lookup_stats'] = self.locator.get_stats()
+        stats['selector_cache'] = self.selector_ranking.get_stats()
+        if self.checkpoint:
+            stats['checkpoint'] = self.checkpoint.get_stats()
+        if self.dedup_index:
+            stats['dedup'] = self.dedup_index.get_stats()
+        if self.profile_store:
+            stats['profile_store'] = dict(self.profile_store.stats)
+        if self.search_cache:
+            stats['search_cache'] = self.search_cache.get_stats()
+        if self.throttler.ledger:
+            stats['quota_ledger'] = self.throttler.ledger.get_stats()
+        if self.session_store:
+            stats['session_store'] = self.session_store.get_stats()
+        if self.resource_policy:
+            stats['resource_policy'] = self.resource_policy.get_stats()
+        if self.snapshot_archive and self.snapshot_archive.conn:
+            stats['snapshot_archive'] = self.snapshot_archive.get_stats()
+        stats['time_to_extract'] = {
+            page_type: {
+                f'avg_{phase}_seconds': round(total / count, 4) if count else None
+                for phase, (count, total) in timings.items()
+            }
+            for page_type, timings in self.page_timings.items()
+        }
+        
         return stats
     
     def close(self):
-        """Clean up and close the scraper"""
+        """Clean up and close the scraper.
+
+        Results and progress are flushed before the browser is quit, and every step is
+        guarded on its own, so a crashed driver cannot keep the rest from reaching disk.
+        """
+        if self.output_sink:
+            self._safe_close(self.output_sink.close, "output sink")
+        
+        if self.profile_store:
+            self._safe_close(self.profile_store.close, "profile store")
+        
+        if self.checkpoint:
+            self._safe_close(self.checkpoint.close, "checkpoint")
+        
+        if self.driver:
+            self._safe_close(self._quit_driver, "browser")
+        
+        # Persist which fallback selectors are currently winning
+        self._safe_close(self.selector_ranking.close, "selector rankings")
+        
+        if self.dedup_index:
+            self._safe_close(self.dedup_index.close, "dedup index")
+        
+        if self.snapshot_archive:
+            # Closed after the final stats below, which read its index
+            self._safe_close(self.snapshot_archive.flush, "snapshot archive")
+        
+        if self.throttler.ledger:
+            self._safe_close(self.throttler.ledger.close, "quota ledger")
+        
+        self._safe_close(self.tracer.close, "tracer")
+        
+        if self.metrics and self.metrics.textfile_path:
+            # The exporters belong to whoever built the registry; leave the end-of-job values
+            self._safe_close(self.metrics.write_textfile, "metrics textfile")
+        
+        # Print final session statistics
+        self._safe_close(lambda: self.logger.info(f"Final session stats: {self.get_session_stats()}"), "session stats")
+        
+        if self.snapshot_archive:
+            self._safe_close(self.snapshot_archive.close, "snapshot archive")
+    
+    def _quit_driver(self):
+        self.driver.quit()
+        self.logger.info("Browser closed successfully")
+    
+    def _safe_close(self, close, what):
+        """Run one cleanup step; a failure is logged and the remaining steps still run"""
         try:
-            if self.driver:
-                self.driver.quit()
-                self.logger.info("Browser closed successfully")
-            
-            # Print final session statistics
-            stats = self.get_session_stats()
-            self.logger.info(f"Final session stats: {stats}")
-            
+            close()
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            self.logger.error(f"Error closing {what}: {e}")
 
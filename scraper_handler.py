@@ -1,8 +1,41 @@
 import json
 from scraper.scraper import LinkedInScraper  # Make sure this import path matches
+from utils.checkpoint import CrawlCheckpoint
+from utils.dedup import ProfileDedupIndex
+from utils.driver_pool import DriverPool
+from utils.metrics import MetricsRegistry
+from utils.output_sink import JSONLSink
+from utils.profile_store import ProfileStore
+from utils.quota_ledger import QuotaLedger
+from utils.resource_policy import ResourcePolicy
+from utils.search_cache import SearchResultCache
+from utils.session_store import SessionStore
+from utils.snapshot_archive import SnapshotArchive
+from utils.tracing import Tracer
 from dotenv import load_dotenv
+import logging
 import os
 
+# Survives between warm invocations of the same Lambda/container process
+DRIVER_POOL = DriverPool()
+# Likewise created once per process, on the first invocation that asks for metrics, so the
+# counters keep counting across warm invocations and the port is bound only once
+METRICS = None
+
+def get_metrics(port, textfile):
+    """The process-wide MetricsRegistry, starting its exporters the first time"""
+    global METRICS
+    if METRICS is None and (port or textfile):
+        METRICS = MetricsRegistry()
+        if port:
+            try:
+                METRICS.serve(port)
+            except OSError as e:
+                logging.warning(f"Metrics endpoint could not bind port {port}: {e}")
+        if textfile:
+            METRICS.start_textfile_writer(textfile)
+    return METRICS
+
 def scrape_linkedin_handler(event, context):
     """
     AWS Lambda handler function to scrape LinkedIn profiles.
@@ -15,28 +48,107 @@ def scrape_linkedin_handler(event, context):
     SEARCH_KEYWORDS = event.get("keywords", "IT Recruiter")
     SEARCH_LOCATION = event.get("location", "United States")
     MAX_PROFILES = event.get("max_profiles", 2)
+    # Stream results to a JSONL file as they are extracted instead of holding them until the end
+    STREAM_OUTPUT = event.get("stream_output", os.getenv("STREAM_OUTPUT", "").lower() in ("1", "true", "zstd"))
+    COMPRESS_STREAM = event.get("compress_stream", os.getenv("STREAM_OUTPUT", "").lower() == "zstd")
+    # Upsert every result into a SQLite profile store (e.g. output/linkedin_profiles.db)
+    PROFILE_DB = event.get("profile_db", os.getenv("PROFILE_DB"))
+    # Profiles detail-scraped this many days ago with an unchanged search card are not revisited
+    FRESHNESS_DAYS = float(event.get("freshness_days", os.getenv("FRESHNESS_DAYS", 0)))
+    # Also write partitioned Parquet datasets under output/parquet (requires pyarrow)
+    EXPORT_PARQUET = event.get("export_parquet", os.getenv("EXPORT_PARQUET", "").lower() in ("1", "true"))
+    # Resume interrupted runs (e.g. after a Lambda timeout) from this checkpoint file
+    CHECKPOINT_FILE = event.get("checkpoint_file", os.getenv("CHECKPOINT_FILE"))
+    # Skip detail scraping for profiles recorded in this dedup index by any earlier run
+    # (ignored for detail skips when FRESHNESS_DAYS is set; the profile store decides then)
+    DEDUP_DB = event.get("dedup_db", os.getenv("DEDUP_DB"))
+    # Reuse search pages extracted within this many hours instead of navigating again (0 disables)
+    SEARCH_CACHE_HOURS = float(event.get("search_cache_hours", os.getenv("SEARCH_CACHE_HOURS", 0)))
+    # Share the throttler's daily/hourly limits with every worker on this host through one SQLite file
+    QUOTA_LEDGER_DB = event.get("quota_ledger_db", os.getenv("QUOTA_LEDGER_DB"))
+    # Write per-phase timing spans (Chrome trace-event JSONL) to this file, e.g. logs/trace.jsonl
+    TRACE_FILE = event.get("trace_file", os.getenv("TRACE_FILE"))
+    # Expose live metrics on http://127.0.0.1:<port>/metrics and/or as a node-exporter textfile
+    METRICS_PORT = int(event.get("metrics_port", os.getenv("METRICS_PORT", 0)))
+    METRICS_TEXTFILE = event.get("metrics_textfile", os.getenv("METRICS_TEXTFILE"))
+    # Keep the browser and its login session for the next warm invocation instead of quitting it
+    REUSE_DRIVER = event.get("reuse_driver", os.getenv("REUSE_DRIVER", "true").lower() in ("1", "true"))
+    # Restore the encrypted login session saved by an earlier run (needs SESSION_STORE_KEY)
+    SESSION_DIR = event.get("session_dir", os.getenv("SESSION_DIR", "cache/sessions"))
+    USE_SESSION_STORE = bool(os.getenv("SESSION_STORE_KEY")) and SESSION_DIR
+    # "block" skips images, fonts, media and trackers; "measure" only records bytes per page (baseline)
+    RESOURCE_POLICY = event.get("resource_policy", os.getenv("RESOURCE_POLICY", "")).lower()
+    # "eager" stops waiting for subresources; per-page readiness predicates decide when to extract
+    PAGE_LOAD_STRATEGY = event.get("page_load_strategy", os.getenv("PAGE_LOAD_STRATEGY", "normal"))
+    # Keep every visited page's HTML (zstd, dictionary per page type) under this directory for re-extraction
+    SNAPSHOT_ARCHIVE = event.get("snapshot_archive", os.getenv("SNAPSHOT_ARCHIVE"))
 
     # Initialize scraper
-    scraper = LinkedInScraper(headless=True, proxy=None)
+    output_sink = JSONLSink(compress=COMPRESS_STREAM) if STREAM_OUTPUT else None
+    profile_store = ProfileStore(PROFILE_DB, freshness_window=FRESHNESS_DAYS * 86400) if PROFILE_DB else None
+    checkpoint = CrawlCheckpoint(CHECKPOINT_FILE) if CHECKPOINT_FILE else None
+    dedup_index = ProfileDedupIndex(DEDUP_DB) if DEDUP_DB else None
+    search_cache = SearchResultCache(ttl=SEARCH_CACHE_HOURS * 3600) if SEARCH_CACHE_HOURS else None
+    quota_ledger = QuotaLedger(QUOTA_LEDGER_DB) if QUOTA_LEDGER_DB else None
+    session_store = SessionStore(SESSION_DIR) if USE_SESSION_STORE else None
+    resource_policy = {"block": ResourcePolicy, "measure": ResourcePolicy.measure_only}.get(RESOURCE_POLICY)
+    metrics = get_metrics(METRICS_PORT, METRICS_TEXTFILE)
+    scraper = LinkedInScraper(headless=True, proxy=None, output_sink=output_sink, profile_store=profile_store,
+                              checkpoint=checkpoint, dedup_index=dedup_index, search_cache=search_cache,
+                              quota_ledger=quota_ledger, tracer=Tracer(TRACE_FILE), metrics=metrics,
+                              session_store=session_store,
+                              resource_policy=resource_policy() if resource_policy else None,
+                              page_load_strategy=PAGE_LOAD_STRATEGY,
+                              snapshot_archive=SnapshotArchive(SNAPSHOT_ARCHIVE) if SNAPSHOT_ARCHIVE else None)
+
+    if not REUSE_DRIVER:
+        DRIVER_POOL.discard()
 
     try:
-        if not scraper._create_advanced_driver():
+        acquired = DRIVER_POOL.acquire(scraper, EMAIL)
+        if not acquired:
             return {"statusCode": 500, "body": json.dumps("Failed to create browser driver")}
 
-        if not scraper.login(EMAIL, PASSWORD):
-            return {"statusCode": 401, "body": json.dumps("Login failed")}
+        if not acquired["logged_in"]:
+            if not scraper.restore_session(EMAIL) and not scraper.login(EMAIL, PASSWORD):
+                return {"statusCode": 401, "body": json.dumps("Login failed")}
+            DRIVER_POOL.mark_logged_in(EMAIL)
+
+        # Launch/health-check plus login time, reported separately for warm and cold starts
+        startup = DRIVER_POOL.startup_report()
+        startup["session_reused"] = acquired["logged_in"]
+        startup["pool"] = DRIVER_POOL.get_stats()
+        if metrics:
+            metrics.histogram("startup_seconds", "Browser launch or reuse plus login time").observe(
+                startup["seconds"], start=startup["start"]
+            )
 
         search_results = scraper.search_profiles(
             keywords=SEARCH_KEYWORDS,
             location=SEARCH_LOCATION,
             max_results=MAX_PROFILES
         )
+
+        if output_sink:
+            # Every search page has already been written to the stream
+            if checkpoint and checkpoint.is_finished():
+                checkpoint.clear()
+            return {
+                "statusCode": 200,
+                "body": json.dumps({
+                    "message": f"Scraped {len(search_results)} profiles",
+                    "stream_file": output_sink.path,
+                    "startup": startup,
+                    "stats": scraper.get_session_stats()
+                })
+            }
+
         scraper.scraped_data.append(search_results)
 
         # OPTIONAL: detailed scraping
         # scraped_profiles = []
         # for profile in search_results:
-        #     detailed_profile = scraper.scrape_profile_details(profile['profile_url'])
+        #     detailed_profile = scraper.scrape_profile_details(profile['profile_url'], profile)
         #     if detailed_profile:
         #         detailed_profile.update(profile)
         #         scraped_profiles.append(detailed_profile)
@@ -46,6 +158,10 @@ def scrape_linkedin_handler(event, context):
         # Save to JSON and CSV
         json_file = scraper.save_data(format='json')
         csv_file = scraper.save_data(format='csv')
+        parquet_dir = scraper.save_data(format='parquet') if EXPORT_PARQUET else None
+        if checkpoint and checkpoint.is_finished() and json_file:
+            # Output is saved; the next run with this config starts fresh
+            checkpoint.clear()
 
         return {
             "statusCode": 200,
@@ -53,6 +169,8 @@ def scrape_linkedin_handler(event, context):
                 "message": f"Scraped {len(search_results)} profiles",
                 "json_file": json_file,
                 "csv_file": csv_file,
+                "parquet_dir": parquet_dir,
+                "startup": startup,
                 "stats": scraper.get_session_stats()
             })
         }
@@ -61,6 +179,10 @@ def scrape_linkedin_handler(event, context):
         return {"statusCode": 500, "body": json.dumps(str(e))}
 
     finally:
+        # A browser that kept failing or hit a challenge is not handed to the next invocation
+        healthy = (REUSE_DRIVER and scraper.health_monitor['consecutive_errors'] < 3
+                   and scraper.health_monitor['captcha_encounters'] == 0)
+        DRIVER_POOL.release(scraper, healthy=healthy)
         scraper.close()
 
 
@@ -0,0 +1,58 @@
+import json
+from scraper.replay import DEFAULT_FIXTURES_DIR, run_offline_scrape
+from utils.checkpoint import CrawlCheckpoint
+
+
+
+def test_keys_are_canonical_profile_urls(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path / 'checkpoint.json'))
+    checkpoint.mark_completed('https://uk.linkedin.com/in/Jane-Doe?miniProfileUrn=abc&trk=x')
+
+    assert checkpoint.should_skip('https://www.linkedin.com/in/jane-doe/')
+    assert checkpoint.should_skip('https://www.linkedin.com/in/jane-doe/details/experience/#main')
+    assert not checkpoint.should_skip('https://www.linkedin.com/in/john-doe/')
+
+
+def test_profile_marks_are_batched_until_close(tmp_path):
+    checkpoint_file = tmp_path / 'checkpoint.json'
+    checkpoint = CrawlCheckpoint(str(checkpoint_file), save_interval=3600)
+    for i in range(20):
+        checkpoint.mark_completed(f'https://www.linkedin.com/in/person-{i}/')
+    checkpoint.mark_failed('https://www.linkedin.com/in/broken/')
+    assert not checkpoint_file.exists()
+
+    checkpoint.close()
+    data = json.loads(checkpoint_file.read_text(encoding='utf-8'))
+    assert len(data['completed']) == 20
+    assert data['failed'] == {'https://www.linkedin.com/in/broken/': 1}
+
+
+def test_raw_urls_from_an_older_checkpoint_are_canonicalized(tmp_path):
+    checkpoint_file = tmp_path / 'checkpoint.json'
+    checkpoint_file.write_text(json.dumps({
+        'searches': {},
+        'completed': {'https://www.linkedin.com/in/Jane-Doe?trk=x': 1.0},
+        'failed': {'https://www.linkedin.com/in/john-doe?a=1': 1, 'https://fr.linkedin.com/in/john-doe/': 2}
+    }), encoding='utf-8')
+
+    checkpoint = CrawlCheckpoint(str(checkpoint_file))
+    assert checkpoint.should_skip('https://www.linkedin.com/in/jane-doe/')
+    assert checkpoint.should_skip('https://www.linkedin.com/in/john-doe/')
+
+
+def test_interrupted_run_resumes_without_rescraping(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    checkpoint_file = str(tmp_path / 'checkpoint.json')
+
+    first = run_offline_scrape(DEFAULT_FIXTURES_DIR, max_results=6, checkpoint=CrawlCheckpoint(checkpoint_file))
+    assert len(first['profiles']) == 6
+
+    resumed = CrawlCheckpoint(checkpoint_file)
+    assert resumed.is_finished()
+    assert resumed.get_stats()['profiles_completed'] == 6
+
+    second = run_offline_scrape(DEFAULT_FIXTURES_DIR, max_results=6, checkpoint=resumed)
+    assert second['profiles'] == []
+    assert [r['profile_url'] for r in second['search_results']] == [r['profile_url'] for r in first['search_results']]
+    # Only the login pages are revisited: the finished search and the six profiles are not
+    assert second['driver_stats']['navigations'] == first['driver_stats']['navigations'] - 7
@@ -0,0 +1,82 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+from utils.dedup import ProfileDedupIndex, canonicalize_profile_url
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def profile_url(i):
+    return f"https://www.linkedin.com/in/person-{i}/"
+
+
+def small_index(path):
+    return ProfileDedupIndex(str(path), expected_items=10_000, batch_size=100)
+
+
+def add_then_crash(path, start, stop):
+    """Add URLs in a separate process that commits them and then dies without close()"""
+    script = textwrap.dedent(f"""
+        import os
+        from tests.test_dedup import small_index, profile_url
+        index = small_index({str(path)!r})
+        for i in range({start}, {stop}):
+            index.add(profile_url(i))
+        index.commit()
+        os._exit(0)
+    """)
+    subprocess.run([sys.executable, '-c', script], cwd=REPO_ROOT, check=True)
+
+
+def test_canonical_variants_are_duplicates(tmp_path):
+    with small_index(tmp_path / "dedup.db") as index:
+        assert index.add("https://www.linkedin.com/in/Jane-Doe?miniProfileUrn=abc")
+        assert not index.add("https://uk.linkedin.com/in/jane-doe/details/experience/")
+        assert index.contains("https://www.linkedin.com/in/jane-doe")
+    assert canonicalize_profile_url("https://www.linkedin.com/in/Jane-Doe/#top") == "https://www.linkedin.com/in/jane-doe/"
+
+
+def test_clean_close_reuses_saved_bloom(tmp_path):
+    path = tmp_path / "dedup.db"
+    with small_index(path) as index:
+        for i in range(50):
+            index.add(profile_url(i))
+    reopened = small_index(path)
+    try:
+        assert all(reopened.contains(profile_url(i)) for i in range(50))
+        assert not reopened.contains(profile_url(999))
+    finally:
+        reopened.close()
+
+
+def test_unclean_shutdown_rebuilds_stale_bloom(tmp_path):
+    path = tmp_path / "dedup.db"
+    with small_index(path) as index:
+        index.add(profile_url(0))
+
+    # Killed after committing rows but before close(): the rows sit in the WAL, the filter is never saved
+    add_then_crash(path, 1, 501)
+
+    recovered = small_index(path)
+    try:
+        assert recovered.count() == 501
+        assert all(recovered.contains(profile_url(i)) for i in range(501))
+    finally:
+        recovered.close()
+
+
+def test_unclean_shutdown_after_reusing_bloom(tmp_path):
+    path = tmp_path / "dedup.db"
+    with small_index(path) as index:
+        index.add(profile_url(0))
+
+    # This run trusts the saved filter, then dies; the next one must not trust it again
+    add_then_crash(path, 1, 2)
+
+    recovered = small_index(path)
+    try:
+        assert recovered.contains(profile_url(1))
+    finally:
+        recovered.close()
@@ -0,0 +1,79 @@
+import time
+
+import pytest
+
+from scraper.replay import ReplayDriver
+from scraper.scraper import LinkedInScraper
+from utils.driver_pool import DriverPool
+from utils.resource_policy import ResourcePolicy
+
+
+def session_cookie(value):
+    return {'name': 'li_at', 'value': value, 'domain': '.linkedin.com', 'expiry': int(time.time()) + 86400}
+
+
+@pytest.fixture
+def pool_and_scraper(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    scraper = LinkedInScraper(headless=True)
+    driver = ReplayDriver()
+    driver.add_cookie(session_cookie('alice-session'))
+    pool = DriverPool()
+    pool.entry = {'driver': driver, 'options': scraper.launch_options(), 'account': 'alice@example.com',
+                  'created_at': time.time(), 'uses': 1}
+    return pool, scraper, driver
+
+
+def test_same_account_reuses_session(pool_and_scraper):
+    pool, scraper, driver = pool_and_scraper
+    assert pool.acquire(scraper, 'alice@example.com') == {'warm': True, 'logged_in': True}
+    assert driver.get_cookie('li_at')['value'] == 'alice-session'
+
+
+def test_other_account_gets_a_clean_browser(pool_and_scraper):
+    pool, scraper, driver = pool_and_scraper
+    assert pool.acquire(scraper, 'bob@example.com') == {'warm': True, 'logged_in': False}
+    assert driver.get_cookie('li_at') is None
+    assert pool.entry['account'] is None
+    assert pool.get_stats()['account_switches'] == 1
+
+    # Bob logs in; handing the browser back to Alice must not reuse Bob's session either
+    driver.add_cookie(session_cookie('bob-session'))
+    pool.mark_logged_in('bob@example.com')
+    assert pool.acquire(scraper, 'alice@example.com') == {'warm': True, 'logged_in': False}
+    assert driver.get_cookie('li_at') is None
+
+
+def test_dead_browser_is_relaunched(pool_and_scraper, monkeypatch):
+    pool, scraper, driver = pool_and_scraper
+    driver.quit()
+    monkeypatch.setattr(scraper, '_create_advanced_driver', lambda: False)
+    assert pool.acquire(scraper, 'alice@example.com') is None
+    assert pool.get_stats()['health_check_failures'] == 1
+
+
+@pytest.mark.parametrize('option, value', [
+    ('resource_policy', ResourcePolicy()),
+    ('page_load_strategy', 'eager'),
+    ('proxy', 'http://10.0.0.2:3128'),
+    ('headless', False),
+])
+def test_browser_launched_with_other_options_is_relaunched(pool_and_scraper, monkeypatch, option, value):
+    pool, scraper, driver = pool_and_scraper
+    setattr(scraper, option, value)
+    monkeypatch.setattr(scraper, '_create_advanced_driver', lambda: False)
+    assert pool.acquire(scraper, 'alice@example.com') is None
+    # The old browser was quit rather than handed out
+    assert driver.session_id is None
+    assert pool.entry is None
+
+
+def test_blocking_browser_is_not_reused_without_a_policy(pool_and_scraper, monkeypatch):
+    pool, scraper, driver = pool_and_scraper
+    scraper.resource_policy = ResourcePolicy()
+    pool.entry['options'] = scraper.launch_options()
+    scraper.resource_policy = None
+    monkeypatch.setattr(scraper, '_create_advanced_driver', lambda: False)
+    # Its blocked URLs would otherwise stay active for an invocation that set no policy
+    assert pool.acquire(scraper, 'alice@example.com') is None
+    assert driver.session_id is None
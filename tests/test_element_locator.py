@@ -0,0 +1,33 @@
+from scraper.replay import ReplayDriver
+from utils.dom_snapshot import DOMSnapshot
+from utils.element_locator import ElementLocator
+
+PAGE = """<html><body>
+<button class="next" disabled>Next</button>
+<a class="contact" style="display:none">Contact</a>
+<span class="location">500+ connections</span>
+<span class="location-fallback">Austin, Texas</span>
+</body></html>"""
+
+
+def test_snapshot_counts_only_selectors_without_matches():
+    snapshot = DOMSnapshot(PAGE)
+    text = snapshot.first_text(['.missing', '.location', '.location-fallback'],
+                               predicate=lambda value: 'connections' not in value)
+    assert text == "Austin, Texas"
+    # .location matched and was rejected by the predicate; find_element would not have waited on it
+    assert snapshot.misses == 1
+
+
+def test_locator_counts_only_selectors_without_matches():
+    driver = ReplayDriver()
+    driver.dom = DOMSnapshot(PAGE)
+    locator = ElementLocator(driver, implicit_wait=10)
+
+    assert locator.find_first(['.missing', '.next', 'button'], condition='enabled') is None
+    assert locator.find_first(['.contact', '.also-missing', '.location'], condition='displayed') is not None
+    assert locator.find_first(['.location-fallback']) is not None
+
+    stats = locator.get_stats()
+    assert stats['fallback_misses'] == 2
+    assert stats['time_saved_seconds'] == 20
@@ -0,0 +1,44 @@
+import socket
+import urllib.request
+
+from scraper.replay import DEFAULT_FIXTURES_DIR, run_offline_scrape
+from utils.metrics import MetricsRegistry
+
+
+def sample(text, name):
+    [line] = [line for line in text.splitlines() if line.startswith(f"linkedin_scraper_{name} ")]
+    return float(line.split()[1])
+
+
+def test_shared_registry_keeps_counting_across_scrapers(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    registry = MetricsRegistry()
+    port = registry.serve(0)
+    try:
+        run_offline_scrape(DEFAULT_FIXTURES_DIR, max_results=3, metrics=registry)
+        run_offline_scrape(DEFAULT_FIXTURES_DIR, max_results=3, metrics=registry)
+
+        # scraper.close() leaves the shared endpoint running
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+            text = response.read().decode('utf-8')
+        assert sample(text, 'profiles_scraped_total') == 6
+        assert sample(text, 'searches_total') == 2
+        assert sample(text, 'consecutive_errors') == 0
+    finally:
+        registry.close()
+
+
+def test_handler_builds_one_registry_per_process(monkeypatch):
+    import scraper_handler
+
+    monkeypatch.setattr(scraper_handler, 'METRICS', None)
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+    registry = scraper_handler.get_metrics(port, None)
+    try:
+        # A warm invocation must not try to bind the port again
+        assert scraper_handler.get_metrics(port, None) is registry
+        assert registry._server.server_port == port
+    finally:
+        registry.close()
@@ -0,0 +1,86 @@
+import datetime
+
+import pytest
+
+from scraper.models import Experience, Profile, SearchResult
+from scraper.replay import DEFAULT_FIXTURES_DIR, run_offline_scrape
+from utils.clock import VirtualClock
+from utils.dedup import ProfileDedupIndex
+from utils.profile_store import ProfileStore
+
+URL = "https://www.linkedin.com/in/jane-doe/"
+
+
+def detailed_profile(headline="Recruiter", about="Hiring engineers", connections="500+ connections", skills=('Sourcing',)):
+    profile = Profile(url=URL, scraped_at="2026-03-02T10:00:00", name="Jane Doe", headline=headline,
+                      location="Austin", about=about, connections=connections)
+    profile.add('experience', Experience(title="Recruiter", company="Northwind"))
+    for skill in skills:
+        profile.add('skills', skill)
+    return profile
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ProfileStore(str(tmp_path / "profiles.db"), batch_size=1) as store:
+        yield store
+
+
+def test_cleared_sections_are_written_through(store):
+    store.upsert_many([detailed_profile()])
+    store.upsert_many([detailed_profile(headline=None, about=None, connections=None, skills=())])
+
+    stored = store.get(URL)
+    assert stored['headline'] is None
+    assert stored['about'] is None
+    assert stored['connections'] is None
+    assert stored['skills'] == []
+    assert stored['name'] == "Jane Doe"
+
+
+def test_unchanged_sections_are_not_rewritten(store):
+    store.upsert_many([detailed_profile()])
+    store.upsert_many([detailed_profile()])
+    assert store.stats['sections_unchanged'] == 5
+    assert store.get(URL)['about'] == "Hiring engineers"
+
+
+def test_search_hit_does_not_blank_detail_columns(store):
+    store.upsert_many([detailed_profile()])
+    store.upsert_many([SearchResult(name="Jane Doe", profile_url=URL + "?miniProfileUrn=x",
+                                    current_company="Northwind", scraped_at="2026-03-03T10:00:00")])
+    stored = store.get(URL)
+    assert stored['headline'] == "Recruiter"
+    assert stored['about'] == "Hiring engineers"
+    assert stored['connections'] == "500+ connections"
+    assert stored['experience'][0]['company'] == "Northwind"
+
+
+def test_freshness_window_follows_the_store_clock(tmp_path):
+    clock = VirtualClock(start=datetime.datetime(2026, 3, 2, 10, 0).timestamp(), record_trace=False)
+    card = SearchResult(name="Jane Doe", profile_url=URL, headline="Recruiter")
+    with ProfileStore(str(tmp_path / "profiles.db"), batch_size=1, freshness_window=3600, clock=clock) as store:
+        store.upsert_many([detailed_profile()])
+        store.record_search_card(card)
+        assert store.is_fresh(card)
+
+        clock.advance(3599)
+        assert store.is_fresh(card)
+        clock.advance(2)
+        assert not store.is_fresh(card)
+
+
+@pytest.mark.parametrize('freshness_window, rescraped', [(3600, 3), (None, 0)])
+def test_freshness_window_takes_precedence_over_the_dedup_index(tmp_path, monkeypatch, freshness_window, rescraped):
+    monkeypatch.chdir(tmp_path)
+    clock = VirtualClock(record_trace=False)
+
+    def run():
+        with ProfileStore(str(tmp_path / "profiles.db"), freshness_window=freshness_window, clock=clock) as store:
+            dedup_index = ProfileDedupIndex(str(tmp_path / "dedup.db"))
+            return run_offline_scrape(DEFAULT_FIXTURES_DIR, max_results=3, profile_store=store, dedup_index=dedup_index)
+
+    assert len(run()['profiles']) == 3
+    # Past the window the profiles are due again, although the dedup index has seen them
+    clock.advance(7200)
+    assert len(run()['profiles']) == rescraped
@@ -0,0 +1,47 @@
+import pytest
+
+from scraper.reextract import reextract_archive
+from scraper.replay import DEFAULT_FIXTURES_DIR, run_offline_scrape
+from utils.dedup import canonicalize_profile_url
+from utils.snapshot_archive import SnapshotArchive
+
+pytest.importorskip('zstandard')
+
+# Not taken from the page HTML: capture metadata, and contact details read from an overlay
+UNARCHIVED_FIELDS = ('url', 'scraped_at', 'page_load_time', 'contact_info')
+CARD_FIELDS = ('name', 'profile_url', 'headline', 'location', 'current_company')
+
+
+class ListSink:
+    def __init__(self):
+        self.records = []
+
+    def write(self, record_type, data):
+        self.records.append((record_type, data))
+
+
+def page_fields(profile):
+    data = profile.to_dict()
+    return {key: value for key, value in data.items() if key not in UNARCHIVED_FIELDS + CARD_FIELDS}
+
+
+def test_reextracted_archive_matches_the_live_scrape(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    archive_dir = str(tmp_path / 'archive')
+    live = run_offline_scrape(DEFAULT_FIXTURES_DIR, max_results=6, snapshot_archive=SnapshotArchive(archive_dir))
+
+    sink = ListSink()
+    stats = reextract_archive(archive_dir, sink, workers=2, chunk_size=2)
+    assert stats['failed'] == 0
+    assert stats['by_type'] == {'search_page': 1, 'profile': 6}
+
+    # The live run stopped at max_results; the archived page holds every card
+    [search_page] = [data for record_type, data in sink.records if record_type == 'search_page']
+    cards = search_page['profiles'][:len(live['search_results'])]
+    assert [[card[key] for key in CARD_FIELDS] for card in cards] == \
+        [[card[key] for key in CARD_FIELDS] for card in live['search_results']]
+
+    reextracted = {profile.url: profile for record_type, profile in sink.records if record_type == 'profile'}
+    assert len(live['profiles']) == 6
+    for profile in live['profiles']:
+        assert page_fields(reextracted[canonicalize_profile_url(profile.url)]) == page_fields(profile)
@@ -0,0 +1,65 @@
+import json
+
+from utils.resource_policy import TYPICAL_BYTES, ResourcePolicy
+
+
+class LogDriver:
+    """Hands out one navigation's worth of performance-log entries per get_log call"""
+
+    def __init__(self, *pages):
+        self.pages = list(pages)
+
+    def get_log(self, log_type):
+        return self.pages.pop(0) if self.pages else []
+
+
+def event(method, **params):
+    return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+def test_measured_bytes_and_estimated_savings_are_reported_apart():
+    page = [
+        event('Network.requestWillBeSent', requestId='1', type='Document'),
+        event('Network.loadingFinished', requestId='1', encodedDataLength=120_000),
+        event('Network.requestWillBeSent', requestId='2', type='Image'),
+        event('Network.loadingFailed', requestId='2', blockedReason='inspector'),
+        event('Network.requestWillBeSent', requestId='3', type='Font'),
+        event('Network.loadingFailed', requestId='3', type='Font', blockedReason='inspector'),
+    ]
+    policy = ResourcePolicy()
+    policy.record_navigation(LogDriver(page), 'https://www.linkedin.com/in/jane-doe/', 'profile', 1.5)
+
+    stats = policy.get_stats()
+    profile = stats['page_types']['profile']
+    assert stats['traffic_measured'] is True
+    assert stats['bytes_saved_basis'].startswith('estimate')
+    assert profile['avg_bytes'] == 120_000
+    assert profile['avg_blocked_requests'] == 2
+    assert profile['avg_bytes_saved_estimate'] == TYPICAL_BYTES['Image'] + TYPICAL_BYTES['Font']
+
+
+def test_images_stay_requestable_while_measuring():
+    image_pref = "profile.managed_default_content_settings.images"
+    # Blocked image requests have to reach the performance log to be counted
+    assert image_pref not in ResourcePolicy().chrome_prefs({})
+    assert ResourcePolicy(measure=False).chrome_prefs({})[image_pref] == 2
+    assert image_pref not in ResourcePolicy(block_types=('Font',), measure=False).chrome_prefs({image_pref: 2})
+
+
+def test_totals_are_kept_per_page_type_instead_of_per_navigation():
+    policy = ResourcePolicy()
+    for i in range(1000):
+        page = [
+            event('Network.requestWillBeSent', requestId=f'{i}', type='Document'),
+            event('Network.loadingFinished', requestId=f'{i}', encodedDataLength=1000),
+        ]
+        lazy = [event('Network.loadingFinished', requestId=f'lazy-{i}', encodedDataLength=500)]
+        driver = LogDriver(lazy, page) if i else LogDriver(page)
+        # Traffic after the previous page settled is charged to that page
+        policy.before_navigation(driver)
+        policy.record_navigation(driver, f'https://www.linkedin.com/in/person-{i}/', 'profile', 1.0)
+
+    profile = policy.get_stats()['page_types']['profile']
+    assert profile['navigations'] == 1000
+    assert profile['avg_bytes'] == round((1000 * 1000 + 999 * 500) / 1000)
+    assert list(policy.totals) == ['profile']
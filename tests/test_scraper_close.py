@@ -0,0 +1,34 @@
+import json
+
+from scraper.models import SearchResult
+from scraper.scraper import LinkedInScraper
+from utils.checkpoint import CrawlCheckpoint
+from utils.output_sink import JSONLSink
+from utils.profile_store import ProfileStore
+
+
+class CrashedDriver:
+    def quit(self):
+        raise ConnectionRefusedError("chromedriver is gone")
+
+
+def test_results_reach_disk_when_the_browser_crashed(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    stream_file = tmp_path / 'results.jsonl'
+    sink = JSONLSink(path=str(stream_file))
+    store = ProfileStore(str(tmp_path / 'profiles.db'))
+    checkpoint = CrawlCheckpoint(str(tmp_path / 'checkpoint.json'), save_interval=3600)
+    scraper = LinkedInScraper(headless=True, output_sink=sink, profile_store=store, checkpoint=checkpoint)
+
+    card = SearchResult(name="Jane Doe", profile_url="https://www.linkedin.com/in/jane-doe/")
+    scraper._emit('search_result', card)
+    scraper._store([card])
+    checkpoint.mark_completed(card.profile_url)
+    scraper.driver = CrashedDriver()
+    scraper.close()
+
+    [line] = stream_file.read_text(encoding='utf-8').splitlines()
+    assert json.loads(line)['data']['name'] == "Jane Doe"
+    assert sink._file is None
+    assert store.conn is None
+    assert CrawlCheckpoint(str(tmp_path / 'checkpoint.json')).should_skip(card.profile_url)
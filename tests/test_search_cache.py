@@ -0,0 +1,64 @@
+import datetime
+
+from utils.clock import VirtualClock
+from utils.search_cache import SearchResultCache
+
+START = datetime.datetime(2026, 3, 2, 6, 0).timestamp()
+SEARCH_URL = "https://www.linkedin.com/search/results/people/?keywords=IT%20Recruiter&origin=GLOBAL_SEARCH_HEADER"
+
+
+def cards(count):
+    return [{'name': f"Person {i}", 'profile_url': f"https://www.linkedin.com/in/person-{i}/"} for i in range(count)]
+
+
+def test_entries_expire_after_the_ttl(tmp_path):
+    clock = VirtualClock(start=START, record_trace=False)
+    cache = SearchResultCache(str(tmp_path / 'search.json'), ttl=3600, clock=clock)
+    cache.put(SEARCH_URL, 1, cards(10), max_results=20)
+
+    clock.advance(3600)
+    assert cache.get(SEARCH_URL, 1)['profiles'] == cards(10)
+    clock.advance(1)
+    assert cache.get(SEARCH_URL, 1) is None
+    assert cache.stats['expired'] == 1
+
+
+def test_expired_entries_are_dropped_on_load(tmp_path):
+    clock = VirtualClock(start=START, record_trace=False)
+    cache_file = str(tmp_path / 'search.json')
+    cache = SearchResultCache(cache_file, ttl=3600, clock=clock)
+    cache.put(SEARCH_URL, 1, cards(10), max_results=20)
+    clock.advance(1800)
+    cache.put(SEARCH_URL, 2, cards(10), max_results=20)
+
+    clock.advance(2000)
+    reloaded = SearchResultCache(cache_file, ttl=3600, clock=clock)
+    assert reloaded.get_stats()['entries'] == 1
+    assert reloaded.get(SEARCH_URL, 1) is None
+    assert reloaded.get(SEARCH_URL, 2) is not None
+
+
+def test_least_recently_used_page_is_evicted(tmp_path):
+    cache = SearchResultCache(str(tmp_path / 'search.json'), max_entries=2,
+                              clock=VirtualClock(start=START, record_trace=False))
+    cache.put(SEARCH_URL, 1, cards(10), max_results=20)
+    cache.put(SEARCH_URL, 2, cards(10), max_results=20)
+    assert cache.get(SEARCH_URL, 1) is not None
+
+    cache.put(SEARCH_URL, 3, cards(10), max_results=20)
+    assert cache.get(SEARCH_URL, 2) is None
+    assert cache.get(SEARCH_URL, 1) is not None
+    assert cache.get(SEARCH_URL, 3) is not None
+    assert cache.stats['evictions'] == 1
+
+
+def test_key_ignores_parameter_order_case_and_tracking():
+    assert SearchResultCache.key(SEARCH_URL, 1) == SearchResultCache.key(
+        "https://www.linkedin.com/search/results/people?origin=FACETED_SEARCH&keywords=it%20recruiter&sid=x1", 1)
+
+
+def test_truncated_page_does_not_answer_a_larger_request(tmp_path):
+    cache = SearchResultCache(str(tmp_path / 'search.json'), clock=VirtualClock(start=START, record_trace=False))
+    cache.put(SEARCH_URL, 1, cards(5), max_results=5)
+    assert cache.get(SEARCH_URL, 1, max_results=5) is not None
+    assert cache.get(SEARCH_URL, 1, max_results=10) is None
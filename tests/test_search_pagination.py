@@ -0,0 +1,69 @@
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+import scraper.scraper as scraper_module
+from scraper.scraper import LinkedInScraper
+
+
+class FakeAnchor:
+    def __init__(self, href, stale_after=None):
+        self.href = href
+        self.reads = 0
+        self.stale_after = stale_after
+
+    def get_attribute(self, name):
+        self.reads += 1
+        if self.stale_after is not None and self.reads > self.stale_after:
+            raise StaleElementReferenceException("detached")
+        return self.href
+
+
+class FakeDriver:
+    current_url = "https://www.linkedin.com/search/results/people/?keywords=x&page=2"
+
+
+class ReadyLocator:
+    """The new page's result cards are already present"""
+
+    def wait_until_ready(self, anchor_groups, timeout=None):
+        return True
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setitem(scraper_module.READINESS_TIMEOUTS, 'search', 0.5)
+    instance = LinkedInScraper(headless=True)
+    instance.driver = FakeDriver()
+    instance.locator = ReadyLocator()
+    return instance
+
+
+def serve_first_cards(monkeypatch, scraper, cards):
+    """_first_result_anchor returns each card in turn, then keeps returning the last one"""
+    calls = iter(cards)
+    last = {'card': None}
+
+    def first_result_anchor():
+        last['card'] = next(calls, last['card'])
+        return last['card']
+    monkeypatch.setattr(scraper, '_first_result_anchor', first_result_anchor)
+
+
+def test_waits_until_first_card_links_elsewhere(scraper, monkeypatch):
+    old = FakeAnchor("https://www.linkedin.com/in/page-one-first/")
+    # Page 1's cards stay in the DOM for two polls after the URL already changed
+    serve_first_cards(monkeypatch, scraper, [old, old, FakeAnchor("https://www.linkedin.com/in/page-two-first/")])
+    assert scraper._wait_until_ready('search', previous_url="https://example.invalid/page1", previous_card=old)
+
+
+def test_detached_previous_card_counts_as_replaced(scraper, monkeypatch):
+    old = FakeAnchor("https://www.linkedin.com/in/page-one-first/", stale_after=1)
+    serve_first_cards(monkeypatch, scraper, [old])
+    assert scraper._wait_until_ready('search', previous_card=old)
+
+
+def test_times_out_while_previous_page_is_still_shown(scraper, monkeypatch):
+    old = FakeAnchor("https://www.linkedin.com/in/page-one-first/")
+    serve_first_cards(monkeypatch, scraper, [old])
+    assert not scraper._wait_until_ready('search', previous_url="https://example.invalid/page1", previous_card=old)
@@ -0,0 +1,39 @@
+import json
+import os
+from utils.selector_cache import SelectorRankingCache
+
+
+def test_record_does_not_write_until_close(tmp_path):
+    cache_file = str(tmp_path / 'selector_ranking.json')
+    cache = SelectorRankingCache(cache_file=cache_file)
+
+    for _ in range(500):
+        cache.record('name', ['h1.a', 'h1.b'], 'h1.b')
+    assert not os.path.exists(cache_file)
+
+    cache.close()
+    with open(cache_file, encoding='utf-8') as f:
+        assert 'h1.b' in json.load(f)['fields']['name']
+    assert SelectorRankingCache(cache_file=cache_file).rank('name', ['h1.a', 'h1.b']) == ['h1.b', 'h1.a']
+
+
+def test_record_saves_once_the_interval_has_passed(tmp_path, monkeypatch):
+    cache_file = str(tmp_path / 'selector_ranking.json')
+    now = [1000.0]
+    monkeypatch.setattr('utils.selector_cache.time.monotonic', lambda: now[0])
+    cache = SelectorRankingCache(cache_file=cache_file, autosave_interval=60)
+
+    cache.record('name', ['h1.a'], 'h1.a')
+    now[0] += 59
+    cache.record('name', ['h1.a'], 'h1.a')
+    assert not os.path.exists(cache_file)
+
+    now[0] += 1
+    cache.record('name', ['h1.a'], 'h1.a')
+    assert os.path.exists(cache_file)
+
+
+def test_close_without_records_leaves_the_file_alone(tmp_path):
+    cache_file = str(tmp_path / 'selector_ranking.json')
+    SelectorRankingCache(cache_file=cache_file).close()
+    assert not os.path.exists(cache_file)
@@ -0,0 +1,81 @@
+import pytest
+
+from utils.snapshot_archive import SnapshotArchive
+
+pytest.importorskip('zstandard')
+
+
+def profile_page(i):
+    rows = ''.join(f'<li class="experience-item"><span>Role {j} at Company {i * j}</span></li>' for j in range(40))
+    return f'<html><body><h1 class="text-heading-xlarge">Person {i}</h1><ul>{rows}</ul></body></html>'
+
+
+def url(i):
+    return f"https://www.linkedin.com/in/person-{i}/"
+
+
+def test_dictionary_is_trained_from_pages_on_disk(tmp_path):
+    with SnapshotArchive(str(tmp_path), train_samples=10, batch_size=3) as archive:
+        for i in range(25):
+            archive.add('profile', url(i), profile_page(i))
+        assert archive.stats['dictionaries_trained'] == 1
+        # Only a count is kept per page type while waiting for a dictionary
+        assert archive._untrained == {'profile': 0}
+
+        dict_ids = [entry['dict_id'] for entry in archive.entries()]
+        assert dict_ids[:10] == [0] * 10
+        assert set(dict_ids[10:]) == {1}
+        assert [archive.read(entry) for entry in archive.entries()] == [profile_page(i) for i in range(25)]
+
+
+def test_pages_from_an_earlier_run_count_towards_training(tmp_path):
+    with SnapshotArchive(str(tmp_path), train_samples=10) as archive:
+        for i in range(6):
+            archive.add('profile', url(i), profile_page(i))
+        assert archive.stats['dictionaries_trained'] == 0
+
+    with SnapshotArchive(str(tmp_path), train_samples=10) as archive:
+        for i in range(6, 10):
+            archive.add('profile', url(i), profile_page(i))
+        assert archive.stats['dictionaries_trained'] == 1
+        assert archive.conn.execute("SELECT samples FROM dictionaries").fetchone()[0] == 10
+
+
+def test_training_samples_stay_within_the_byte_budget(tmp_path):
+    page_bytes = len(profile_page(0).encode('utf-8'))
+    with SnapshotArchive(str(tmp_path), train_samples=20, train_sample_bytes=page_bytes * 12) as archive:
+        for i in range(20):
+            archive.add('profile', url(i), profile_page(i))
+        assert archive.conn.execute("SELECT samples FROM dictionaries").fetchone()[0] <= 12
+
+
+def test_missing_dictionary_file_does_not_break_opening(tmp_path):
+    with SnapshotArchive(str(tmp_path), train_samples=10) as archive:
+        for i in range(12):
+            archive.add('profile', url(i), profile_page(i))
+    # A crash between indexing a dictionary and writing its file, as older archives could do
+    (tmp_path / 'dicts' / 'dict-0001.zdict').unlink()
+
+    with SnapshotArchive(str(tmp_path), train_samples=10) as archive:
+        assert archive.read(next(archive.entries())) == profile_page(0)
+        archive.add('profile', url(12), profile_page(12))
+        assert archive.latest(url(12)) == profile_page(12)
+
+    with SnapshotArchive(str(tmp_path), readonly=True) as archive:
+        assert archive.count() == 13
+
+
+def test_dictionary_file_is_written_before_its_row(tmp_path, monkeypatch):
+    with SnapshotArchive(str(tmp_path), train_samples=10) as archive:
+        def no_space(*args):
+            raise OSError(28, "No space left on device")
+
+        monkeypatch.setattr('utils.snapshot_archive.os.replace', no_space)
+        for i in range(10):
+            archive.add('profile', url(i), profile_page(i))
+        monkeypatch.undo()
+        assert archive.conn.execute("SELECT COUNT(*) FROM dictionaries").fetchone()[0] == 0
+        assert not list((tmp_path / 'dicts').iterdir())
+
+    with SnapshotArchive(str(tmp_path), readonly=True) as archive:
+        assert [archive.read(entry) for entry in archive.entries()] == [profile_page(i) for i in range(10)]
@@ -0,0 +1,65 @@
+import datetime
+
+import pytest
+
+from utils.clock import VirtualClock
+from utils.quota_ledger import QuotaLedger
+from utils.throttler import RequestThrottler
+
+START = datetime.datetime(2026, 3, 2, 6, 0).timestamp()
+
+
+def run_searches(throttler, clock, count):
+    for _ in range(count):
+        throttler.wait_for_next_request("search")
+    return (clock.time() - START) / 3600
+
+
+@pytest.fixture
+def clock():
+    return VirtualClock(start=START, record_trace=False)
+
+
+def test_hourly_search_limit_without_ledger(clock):
+    throttler = RequestThrottler(min_delay=0, max_delay=0, clock=clock)
+    # 20 searches per hour: the 21st and 41st wait for the next window
+    assert run_searches(throttler, clock, 45) >= 2.0
+
+
+@pytest.mark.parametrize('ledger_has_clock', [True, False])
+def test_hourly_search_limit_with_ledger_follows_injected_clock(tmp_path, clock, ledger_has_clock):
+    ledger = QuotaLedger(str(tmp_path / "ledger.db"), clock=clock if ledger_has_clock else None)
+    throttler = RequestThrottler(min_delay=0, max_delay=0, ledger=ledger, clock=clock)
+    try:
+        assert run_searches(throttler, clock, 45) >= 2.0
+        # Slots are stamped with simulated time, so the last window holds only the last 5 searches
+        assert ledger.usage('searches', clock.time() - 3600, now=clock.time()) == 5
+    finally:
+        ledger.close()
+
+
+def test_ledger_is_shared_between_throttlers(tmp_path, clock):
+    ledger_path = str(tmp_path / "ledger.db")
+    first = QuotaLedger(ledger_path, clock=clock)
+    second = QuotaLedger(ledger_path, clock=clock)
+    try:
+        run_searches(RequestThrottler(min_delay=0, max_delay=0, ledger=first, clock=clock), clock, 15)
+        # Another worker only gets the 5 slots left in this hour before it has to wait
+        assert run_searches(RequestThrottler(min_delay=0, max_delay=0, ledger=second, clock=clock), clock, 5) < 1.0
+        assert run_searches(RequestThrottler(min_delay=0, max_delay=0, ledger=second, clock=clock), clock, 1) >= 1.0
+    finally:
+        first.close()
+        second.close()
+
+
+def test_daily_limit_raises_across_workers(tmp_path, clock):
+    ledger = QuotaLedger(str(tmp_path / "ledger.db"), clock=clock)
+    throttler = RequestThrottler(min_delay=0, max_delay=0, ledger=ledger, clock=clock)
+    throttler.daily_request_limit = 3
+    try:
+        for _ in range(3):
+            throttler.wait_for_next_request("normal")
+        with pytest.raises(Exception, match="Daily request limit"):
+            throttler.wait_for_next_request("normal")
+    finally:
+        ledger.close()
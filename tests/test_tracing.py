@@ -0,0 +1,21 @@
+import json
+
+from utils.throttler import RequestThrottler
+from utils.tracing import Tracer
+
+
+def test_instrumented_proxy_forwards_attribute_assignment(tmp_path):
+    trace_file = tmp_path / 'trace.jsonl'
+    tracer = Tracer(str(trace_file))
+    throttler = RequestThrottler()
+    proxy = tracer.instrument(throttler, 'throttle')
+
+    proxy.daily_request_limit = 7
+    assert throttler.daily_request_limit == 7
+    assert proxy.daily_request_limit == 7
+    assert 'daily_request_limit' not in vars(proxy)
+
+    proxy.reset_hourly_counters()
+    tracer.close()
+    events = [json.loads(line) for line in trace_file.read_text(encoding='utf-8').splitlines()]
+    assert [event['name'] for event in events] == ['throttle.reset_hourly_counters']
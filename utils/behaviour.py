@@ -1,17 +1,18 @@
 
 import random
-import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 import logging
+from utils.clock import SystemClock
 
 
 class HumanBehaviorSimulator:
     """Advanced simulation of human-like behavior during web browsing"""
     
-    def __init__(self, driver):
+    def __init__(self, driver, clock=None):
         self.driver = driver
+        self.clock = clock or SystemClock()
         self.actions = ActionChains(driver)
         self.reading_patterns = ['focused', 'scanning', 'detailed', 'distracted']
         self.mouse_movement_styles = ['smooth', 'jittery', 'precise', 'casual']
@@ -42,7 +43,7 @@ class HumanBehaviorSimulator:
                             random.randint(-10, 10),
                             random.randint(-10, 10)
                         ).perform()
-                        time.sleep(random.uniform(0.05, 0.2))
+                        self.clock.sleep(random.uniform(0.05, 0.2))
                 elif style == "precise":
                     # Very precise movement to center of element
                     self.actions.move_to_element(element).perform()
@@ -53,7 +54,7 @@ class HumanBehaviorSimulator:
                     self.actions.move_to_element_with_offset(
                         element, overshoot_x, overshoot_y
                     ).perform()
-                    time.sleep(random.uniform(0.1, 0.3))
+                    self.clock.sleep(random.uniform(0.1, 0.3))
                     # Correction movement
                     self.actions.move_to_element(element).perform()
             else:
@@ -68,14 +69,14 @@ class HumanBehaviorSimulator:
                         x = random.randint(50, viewport_width - 50)
                         y = random.randint(50, viewport_height - 50)
                         self.actions.move_to_element_with_offset(body, x, y).perform()
-                        time.sleep(random.uniform(0.2, 0.5))
+                        self.clock.sleep(random.uniform(0.2, 0.5))
                 else:
                     # Single random movement
                     x = random.randint(100, viewport_width - 100)
                     y = random.randint(100, viewport_height - 100)
                     self.actions.move_to_element_with_offset(body, x, y).perform()
             
-            time.sleep(random.uniform(0.1, 0.5))
+            self.clock.sleep(random.uniform(0.1, 0.5))
             
         except Exception as e:
             logging.debug(f"Mouse movement simulation failed: {e}")
@@ -92,27 +93,27 @@ class HumanBehaviorSimulator:
                     for _ in range(random.randint(5, 10)):
                         scroll_amount = random.randint(80, 200)
                         self.driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-                        time.sleep(random.uniform(2, 5))  # Longer pauses for focused reading
+                        self.clock.sleep(random.uniform(2, 5))  # Longer pauses for focused reading
                         
                 elif reading_pattern == "scanning":
                     # Quick scanning - faster scrolls with shorter pauses
                     for _ in range(random.randint(8, 15)):
                         scroll_amount = random.randint(150, 400)
                         self.driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-                        time.sleep(random.uniform(0.5, 1.5))
+                        self.clock.sleep(random.uniform(0.5, 1.5))
                         
                 elif reading_pattern == "detailed":
                     # Detailed reading - very slow with frequent back-scrolling
                     for _ in range(random.randint(6, 12)):
                         scroll_amount = random.randint(60, 150)
                         self.driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-                        time.sleep(random.uniform(3, 8))
+                        self.clock.sleep(random.uniform(3, 8))
                         
                         # Frequent back-scrolling for re-reading
                         if random.random() < 0.5:
                             back_scroll = random.randint(30, 100)
                             self.driver.execute_script(f"window.scrollBy(0, -{back_scroll});")
-                            time.sleep(random.uniform(1, 3))
+                            self.clock.sleep(random.uniform(1, 3))
                             
                 else:  # distracted
                     # Distracted reading - irregular patterns
@@ -122,15 +123,15 @@ class HumanBehaviorSimulator:
                         
                         # Random long pauses (getting distracted)
                         if random.random() < 0.3:
-                            time.sleep(random.uniform(5, 15))
+                            self.clock.sleep(random.uniform(5, 15))
                         else:
-                            time.sleep(random.uniform(1, 4))
+                            self.clock.sleep(random.uniform(1, 4))
                         
                         # Sometimes scroll in wrong direction (lost focus)
                         if random.random() < 0.2:
                             wrong_scroll = random.randint(50, 200)
                             self.driver.execute_script(f"window.scrollBy(0, -{wrong_scroll});")
-                            time.sleep(random.uniform(0.5, 2))
+                            self.clock.sleep(random.uniform(0.5, 2))
             
             elif scroll_type == "browsing":
                 # Faster scrolling for general browsing
@@ -146,16 +147,16 @@ class HumanBehaviorSimulator:
                         for _ in range(random.randint(2, 5)):
                             small_scroll = scroll_amount // random.randint(3, 6)
                             self.driver.execute_script(f"window.scrollBy(0, {small_scroll});")
-                            time.sleep(random.uniform(0.05, 0.15))
+                            self.clock.sleep(random.uniform(0.05, 0.15))
                     else:
                         self.driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
                     
                     current_height += scroll_amount
-                    time.sleep(random.uniform(0.3, 1.2))
+                    self.clock.sleep(random.uniform(0.3, 1.2))
                     
                     # Sometimes pause to "look" at something
                     if random.random() < 0.2:
-                        time.sleep(random.uniform(2, 6))
+                        self.clock.sleep(random.uniform(2, 6))
                     
                     # Update total height for dynamic content
                     total_height = self.driver.execute_script("return document.body.scrollHeight")
@@ -168,15 +169,15 @@ class HumanBehaviorSimulator:
                     
                     # Pause to examine search results
                     if i % 2 == 0:  # Every other scroll
-                        time.sleep(random.uniform(2, 5))
+                        self.clock.sleep(random.uniform(2, 5))
                     else:
-                        time.sleep(random.uniform(0.5, 1.5))
+                        self.clock.sleep(random.uniform(0.5, 1.5))
                     
                     # Sometimes go back to re-examine previous results
                     if random.random() < 0.3:
                         back_amount = random.randint(100, 300)
                         self.driver.execute_script(f"window.scrollBy(0, -{back_amount});")
-                        time.sleep(random.uniform(1, 3))
+                        self.clock.sleep(random.uniform(1, 3))
         
         except Exception as e:
             logging.debug(f"Scrolling simulation failed: {e}")
@@ -236,19 +237,19 @@ class HumanBehaviorSimulator:
                 if random.random() < 0.05 and i > 0:  # 5% chance of typo
                     wrong_char = random.choice('abcdefghijklmnopqrstuvwxyz')
                     element.send_keys(wrong_char)
-                    time.sleep(random.uniform(0.2, 0.8))
+                    self.clock.sleep(random.uniform(0.2, 0.8))
                     element.send_keys(Keys.BACKSPACE)  # Delete typo
-                    time.sleep(random.uniform(0.1, 0.5))
+                    self.clock.sleep(random.uniform(0.1, 0.5))
                 
                 # Type the actual character
                 element.send_keys(char)
-                time.sleep(base_delay)
+                self.clock.sleep(base_delay)
                 
                 i += 1
             
                 # Occasional longer pauses (distraction or thinking)
                 if random.random() < 0.02:  # 2% chance
-                    time.sleep(random.uniform(1, 4))
+                    self.clock.sleep(random.uniform(1, 4))
         
         except Exception as e:
             logging.debug(f"Typing simulation failed: {e}")
@@ -270,18 +271,18 @@ class HumanBehaviorSimulator:
                 for _ in range(random.randint(1, 3)):
                     action = random.choice(actions)
                     action()
-                    time.sleep(random.uniform(0.5, 2.0))
+                    self.clock.sleep(random.uniform(0.5, 2.0))
             
             elif interaction_type == "focused":
                 # More focused interactions for profile viewing
                 self._simulate_highlight_text()
-                time.sleep(random.uniform(1, 3))
+                self.clock.sleep(random.uniform(1, 3))
                 self._simulate_scroll_and_pause()
                 
             elif interaction_type == "searching":
                 # Search-related interactions
                 self._simulate_tab_navigation()
-                time.sleep(random.uniform(0.5, 1.5))
+                self.clock.sleep(random.uniform(0.5, 1.5))
                 self._simulate_page_focus_loss()
         
         except Exception as e:
@@ -307,7 +308,7 @@ class HumanBehaviorSimulator:
                             random.randint(50, 200), 0
                         ).release().perform()
                     
-                    time.sleep(random.uniform(0.5, 2.0))
+                    self.clock.sleep(random.uniform(0.5, 2.0))
                     # Deselect by clicking elsewhere
                     body = self.driver.find_element(By.TAG_NAME, "body")
                     ActionChains(self.driver).click(body).perform()
@@ -321,7 +322,7 @@ class HumanBehaviorSimulator:
             if elements:
                 element = random.choice(elements)
                 ActionChains(self.driver).context_click(element).perform()
-                time.sleep(random.uniform(0.5, 1.5))
+                self.clock.sleep(random.uniform(0.5, 1.5))
                 # Press Escape to close context menu
                 ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
         except:
@@ -332,7 +333,7 @@ class HumanBehaviorSimulator:
         try:
             for _ in range(random.randint(1, 4)):
                 ActionChains(self.driver).send_keys(Keys.TAB).perform()
-                time.sleep(random.uniform(0.2, 0.8))
+                self.clock.sleep(random.uniform(0.2, 0.8))
         except:
             pass
     
@@ -345,7 +346,7 @@ class HumanBehaviorSimulator:
             else:
                 ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('-').key_up(Keys.CONTROL).perform()
             
-            time.sleep(random.uniform(0.5, 1.5))
+            self.clock.sleep(random.uniform(0.5, 1.5))
             
             # Reset zoom
             ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('0').key_up(Keys.CONTROL).perform()
@@ -357,7 +358,7 @@ class HumanBehaviorSimulator:
         try:
             # Simulate Alt+Tab (switching windows)
             ActionChains(self.driver).key_down(Keys.ALT).send_keys(Keys.TAB).key_up(Keys.ALT).perform()
-            time.sleep(random.uniform(2, 8))  # Time "away" from page
+            self.clock.sleep(random.uniform(2, 8))  # Time "away" from page
             # Click to regain focus
             body = self.driver.find_element(By.TAG_NAME, "body")
             ActionChains(self.driver).click(body).perform()
@@ -369,9 +370,9 @@ class HumanBehaviorSimulator:
         try:
             # Small scroll down
             self.driver.execute_script("window.scrollBy(0, 100);")
-            time.sleep(random.uniform(2, 5))
+            self.clock.sleep(random.uniform(2, 5))
             # Small scroll up (re-reading)
             self.driver.execute_script("window.scrollBy(0, -50);")
-            time.sleep(random.uniform(1, 3))
+            self.clock.sleep(random.uniform(1, 3))
         except:
             pass
@@ -0,0 +1,125 @@
+import json
+import logging
+import os
+import time
+from utils.dedup import canonicalize_profile_url
+from utils.output_sink import json_default
+
+
+class CrawlCheckpoint:
+    """Persisted crawl progress so an interrupted run resumes instead of starting over.
+
+    Per search URL it keeps the last finished results page and the profiles collected so
+    far; across searches it keeps the profile URLs already scraped and the ones that failed,
+    keyed by canonical profile URL so tracking parameters and subdomains do not defeat resume.
+
+    Finished results pages are written straight away. Per-profile marks are written at most
+    once per save_interval seconds and on close(), so a crash loses at most that window of
+    marks and those profiles are scraped again.
+    """
+
+    def __init__(self, checkpoint_file="cache/crawl_checkpoint.json", max_attempts=2, save_interval=30):
+        self.checkpoint_file = checkpoint_file
+        self.max_attempts = max_attempts  # Failed profiles are retried until this many attempts
+        self.save_interval = save_interval
+        self.searches = {}
+        self.completed = {}
+        self.failed = {}
+        self._dirty = False
+        self._last_save = time.monotonic()
+        self.load()
+
+    def search_state(self, search_url):
+        """Return {'page', 'profiles', 'complete'} for a search that was already started, or None"""
+        return self.searches.get(search_url)
+
+    def record_page(self, search_url, page, page_profiles):
+        """Record that a results page was fully processed"""
+        state = self.searches.setdefault(search_url, {'page': 0, 'profiles': [], 'complete': False})
+        state['page'] = page
+        state['profiles'].extend(page_profiles)
+        state['updated_at'] = time.time()
+        self.save()
+
+    def mark_search_complete(self, search_url):
+        state = self.searches.setdefault(search_url, {'page': 0, 'profiles': [], 'complete': False})
+        state['complete'] = True
+        state['updated_at'] = time.time()
+        self.save()
+
+    def should_skip(self, profile_url):
+        """True when the profile was already scraped or has used up its attempts"""
+        key = canonicalize_profile_url(profile_url)
+        return key in self.completed or self.failed.get(key, 0) >= self.max_attempts
+
+    def mark_completed(self, profile_url):
+        key = canonicalize_profile_url(profile_url)
+        self.completed[key] = time.time()
+        self.failed.pop(key, None)
+        self._save_soon()
+
+    def mark_failed(self, profile_url):
+        key = canonicalize_profile_url(profile_url)
+        self.failed[key] = self.failed.get(key, 0) + 1
+        self._save_soon()
+
+    def is_finished(self):
+        """True when every recorded search ran to completion"""
+        return all(state.get('complete') for state in self.searches.values())
+
+    def clear(self):
+        """Forget all progress, e.g. once a run has finished and its output is saved"""
+        self.searches = {}
+        self.completed = {}
+        self.failed = {}
+        self.save()
+
+    def get_stats(self):
+        return {
+            'searches': len(self.searches),
+            'searches_complete': sum(1 for state in self.searches.values() if state.get('complete')),
+            'profiles_completed': len(self.completed),
+            'profiles_failed': len(self.failed)
+        }
+
+    def close(self):
+        """Write profile marks still waiting for the save interval"""
+        if self._dirty:
+            self.save()
+
+    def _save_soon(self):
+        self._dirty = True
+        if time.monotonic() - self._last_save >= self.save_interval:
+            self.save()
+
+    def load(self):
+        if not self.checkpoint_file or not os.path.exists(self.checkpoint_file):
+            return
+        try:
+            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.searches = data.get('searches', {})
+            # Checkpoints written before keys were canonicalized hold raw profile URLs
+            self.completed = {canonicalize_profile_url(url): at for url, at in data.get('completed', {}).items()}
+            self.failed = {}
+            for url, attempts in data.get('failed', {}).items():
+                key = canonicalize_profile_url(url)
+                self.failed[key] = max(self.failed.get(key, 0), attempts)
+            logging.info(f"Resuming from checkpoint {self.checkpoint_file}: {self.get_stats()}")
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not load crawl checkpoint {self.checkpoint_file}: {e}")
+
+    def save(self):
+        """Write the checkpoint atomically so a crash mid-write keeps the previous one"""
+        self._dirty = False
+        self._last_save = time.monotonic()
+        if not self.checkpoint_file:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.checkpoint_file) or '.', exist_ok=True)
+            tmp_file = f"{self.checkpoint_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'searches': self.searches, 'completed': self.completed, 'failed': self.failed}, f, default=json_default)
+            os.replace(tmp_file, self.checkpoint_file)
+        except OSError as e:
+            logging.warning(f"Could not save crawl checkpoint {self.checkpoint_file}: {e}")
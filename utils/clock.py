@@ -0,0 +1,71 @@
+import datetime
+import sys
+import time
+from collections import defaultdict
+
+
+class SystemClock:
+    """Wall-clock time and real sleeps; the default for live scraping"""
+
+    def time(self):
+        return time.time()
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def now(self):
+        return datetime.datetime.now()
+
+    def today(self):
+        return datetime.date.today()
+
+
+class VirtualClock:
+    """Simulated time for offline runs and tests: sleep() advances the clock instantly.
+
+    Every sleep is recorded with the function that requested it, so the pacing a live
+    run would have applied (hours of throttling) can be inspected in milliseconds.
+    """
+
+    def __init__(self, start=None, record_trace=True):
+        self._now = time.time() if start is None else start
+        self.start = self._now
+        self.record_trace = record_trace
+        self.trace = []
+        self.slept = 0.0
+
+    def time(self):
+        return self._now
+
+    def sleep(self, seconds):
+        seconds = max(0.0, seconds)
+        if self.record_trace:
+            self.trace.append({
+                'at': round(self._now - self.start, 3),
+                'seconds': round(seconds, 3),
+                'caller': sys._getframe(1).f_code.co_name
+            })
+        self._now += seconds
+        self.slept += seconds
+
+    def advance(self, seconds):
+        """Move time forward without recording a delay (e.g. to cross an hour or day boundary)"""
+        self._now += seconds
+
+    def now(self):
+        return datetime.datetime.fromtimestamp(self._now)
+
+    def today(self):
+        return self.now().date()
+
+    def summary(self):
+        """Total simulated delay and call count per requesting function"""
+        totals = defaultdict(lambda: {'calls': 0, 'seconds': 0.0})
+        for entry in self.trace:
+            totals[entry['caller']]['calls'] += 1
+            totals[entry['caller']]['seconds'] += entry['seconds']
+        return {
+            caller: {'calls': t['calls'], 'seconds': round(t['seconds'], 2)}
+            for caller, t in sorted(totals.items(), key=lambda item: -item[1]['seconds'])
+        }
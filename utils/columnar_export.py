@@ -0,0 +1,181 @@
+import datetime
+import logging
+import os
+import re
+from collections.abc import Mapping
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Columnar export is optional; JSON/CSV keep working without it
+    pa = None
+    pq = None
+
+
+PARTITION_COLUMNS = ['scrape_date', 'keywords']
+
+
+def _schemas():
+    experience = pa.struct([
+        ('title', pa.string()),
+        ('company', pa.string()),
+        ('duration', pa.string()),
+        ('location', pa.string()),
+        ('description', pa.string())
+    ])
+    education = pa.struct([('school', pa.string()), ('degree', pa.string()), ('duration', pa.string())])
+    certification = pa.struct([('name', pa.string()), ('issuer', pa.string())])
+    contact_info = pa.struct([('email', pa.string()), ('phone', pa.string()), ('websites', pa.list_(pa.string()))])
+
+    search_results = pa.schema([
+        ('profile_url', pa.string()),
+        ('name', pa.string()),
+        ('headline', pa.string()),
+        ('location', pa.string()),
+        ('current_company', pa.string()),
+        ('scraped_at', pa.timestamp('us')),
+        ('scrape_date', pa.string()),
+        ('keywords', pa.string())
+    ])
+    profiles = pa.schema([
+        ('profile_url', pa.string()),
+        ('name', pa.string()),
+        ('headline', pa.string()),
+        ('location', pa.string()),
+        ('current_company', pa.string()),
+        ('profile_picture', pa.string()),
+        ('connections', pa.string()),
+        ('about', pa.string()),
+        ('page_load_time', pa.float64()),
+        ('experience', pa.list_(experience)),
+        ('education', pa.list_(education)),
+        ('skills', pa.list_(pa.string())),
+        ('languages', pa.list_(pa.string())),
+        ('certifications', pa.list_(certification)),
+        ('contact_info', contact_info),
+        ('scraped_at', pa.timestamp('us')),
+        ('scrape_date', pa.string()),
+        ('keywords', pa.string())
+    ])
+    return search_results, profiles
+
+
+def _timestamp(value):
+    if not value:
+        return None
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _partition_value(value):
+    """Keep partition directory names filesystem-safe"""
+    return re.sub(r'[^A-Za-z0-9._-]+', '_', value.strip()) if value else 'unknown'
+
+
+def split_scraped_data(scraped_data):
+    """Separate LinkedInScraper.scraped_data into (search results, detailed profiles)"""
+    search_results = []
+    profiles = []
+    for item in scraped_data:
+        if isinstance(item, list):
+            search_results.extend(item)
+        elif isinstance(item, Mapping) and 'personal_info' in item:
+            profiles.append(item)
+        elif isinstance(item, Mapping):
+            search_results.append(item)
+    return search_results, profiles
+
+
+def search_result_rows(records, keywords=None):
+    for record in records:
+        scraped_at = _timestamp(record.get('scraped_at'))
+        yield {
+            'profile_url': record.get('profile_url'),
+            'name': record.get('name'),
+            'headline': record.get('headline'),
+            'location': record.get('location'),
+            'current_company': record.get('current_company'),
+            'scraped_at': scraped_at,
+            'scrape_date': scraped_at.date().isoformat() if scraped_at else 'unknown',
+            'keywords': _partition_value(keywords)
+        }
+
+
+def profile_rows(profiles, keywords=None):
+    for profile in profiles:
+        if hasattr(profile, 'to_dict'):
+            # One conversion instead of a dict view per field (scraper.models.Profile)
+            profile = profile.to_dict()
+        personal_info = profile.get('personal_info') or {}
+        experience = profile.get('experience') or []
+        contact_info = profile.get('contact_info') or {}
+        scraped_at = _timestamp(profile.get('scraped_at'))
+        current_company = profile.get('current_company')
+        if current_company is None and experience:
+            current_company = experience[0].get('company')
+        yield {
+            'profile_url': profile.get('url') or profile.get('profile_url'),
+            'name': personal_info.get('name') or profile.get('name'),
+            'headline': personal_info.get('headline') or profile.get('headline'),
+            'location': personal_info.get('location') or profile.get('location'),
+            'current_company': current_company,
+            'profile_picture': personal_info.get('profile_picture'),
+            'connections': profile.get('connections'),
+            'about': profile.get('about'),
+            'page_load_time': profile.get('page_load_time'),
+            'experience': experience,
+            'education': profile.get('education') or [],
+            'skills': profile.get('skills') or [],
+            'languages': profile.get('languages') or [],
+            'certifications': profile.get('certifications') or [],
+            'contact_info': {
+                'email': contact_info.get('email'),
+                'phone': contact_info.get('phone'),
+                'websites': contact_info.get('websites') or []
+            },
+            'scraped_at': scraped_at,
+            'scrape_date': scraped_at.date().isoformat() if scraped_at else 'unknown',
+            'keywords': _partition_value(keywords)
+        }
+
+
+def to_tables(scraped_data, keywords=None):
+    """Build typed Arrow tables (search_results, profiles) from scraper output"""
+    if pa is None:
+        raise ImportError("pyarrow is required for columnar export")
+    search_schema, profile_schema = _schemas()
+    search_results, profiles = split_scraped_data(scraped_data)
+    return (
+        pa.Table.from_pylist(list(search_result_rows(search_results, keywords)), schema=search_schema),
+        pa.Table.from_pylist(list(profile_rows(profiles, keywords)), schema=profile_schema)
+    )
+
+
+def write_parquet_dataset(scraped_data, output_dir, keywords=None, compression='zstd'):
+    """Write search results and profiles as Parquet datasets partitioned by scrape date and keyword.
+
+    Layout: <output_dir>/<dataset>/scrape_date=YYYY-MM-DD/keywords=<kw>/part-<ts>-<n>.parquet
+    Returns the dataset directories that received rows.
+    """
+    if pq is None:
+        raise ImportError("pyarrow is required for Parquet export")
+    search_table, profile_table = to_tables(scraped_data, keywords)
+    basename = f"part-{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}-{{i}}.parquet"
+    written = []
+    for name, table in (('search_results', search_table), ('profiles', profile_table)):
+        if table.num_rows == 0:
+            continue
+        root_path = os.path.join(output_dir, name)
+        pq.write_to_dataset(
+            table,
+            root_path=root_path,
+            partition_cols=PARTITION_COLUMNS,
+            basename_template=basename,
+            compression=compression,
+            existing_data_behavior='overwrite_or_ignore'
+        )
+        logging.info(f"Wrote {table.num_rows} {name} rows to {root_path}")
+        written.append(root_path)
+    return written
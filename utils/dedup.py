@@ -0,0 +1,182 @@
+import hashlib
+import logging
+import math
+import os
+import sqlite3
+import uuid
+from urllib.parse import unquote, urlsplit
+
+
+def canonicalize_profile_url(url):
+    """Reduce any LinkedIn profile link to https://www.linkedin.com/in/<slug>/.
+
+    Drops tracking query strings (miniProfileUrn, trk, ...), fragments, country
+    subdomains, sub-pages like /details/experience/ and case differences in the slug.
+    Non-profile URLs only lose their query string and fragment.
+    """
+    if not url:
+        return None
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    segments = [s for s in parts.path.split('/') if s]
+    if host.endswith('linkedin.com') and len(segments) >= 2 and segments[0].lower() in ('in', 'pub'):
+        slug = unquote(segments[1]).lower()
+        return f"https://www.linkedin.com/{segments[0].lower()}/{slug}/"
+    path = '/'.join(segments)
+    return f"{parts.scheme or 'https'}://{host}/{path}/" if path else f"{parts.scheme or 'https'}://{host}/"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over a bytearray using double hashing"""
+
+    def __init__(self, expected_items, false_positive_rate):
+        self.size = max(8, int(-expected_items * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / expected_items * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, key):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class ProfileDedupIndex:
+    """On-disk set of canonical profile URLs with an in-memory Bloom filter in front.
+
+    A Bloom miss answers "new profile" without touching disk; only Bloom hits are
+    confirmed against the SQLite primary key. Memory is bounded by the filter size
+    (about 18 MB for 10M URLs at a 0.1% false-positive rate), not by the URL count.
+
+    The filter is saved on close() with a random token that is also stored in the
+    database. Opening the index consumes the token, so after a run that never reached
+    close() (killed, timed out) the saved filter no longer matches and is rebuilt.
+    """
+
+    def __init__(self, db_path="cache/profile_dedup.db", expected_items=10_000_000,
+                 false_positive_rate=0.001, batch_size=500):
+        self.db_path = db_path
+        self.bloom_file = f"{db_path}.bloom" if db_path != ":memory:" else None
+        self.batch_size = batch_size
+        self.bloom = BloomFilter(expected_items, false_positive_rate)
+        self._pending = 0
+        self.stats = {'lookups': 0, 'bloom_negatives': 0, 'exact_lookups': 0, 'duplicates': 0, 'added': 0}
+
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(db_path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS seen (url TEXT PRIMARY KEY) WITHOUT ROWID")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._load_bloom()
+
+    def __contains__(self, url):
+        return self.contains(url)
+
+    def contains(self, url):
+        """True if the canonical form of url was added before"""
+        key = canonicalize_profile_url(url)
+        self.stats['lookups'] += 1
+        if key not in self.bloom:
+            self.stats['bloom_negatives'] += 1
+            return False
+        self.stats['exact_lookups'] += 1
+        found = self.conn.execute("SELECT 1 FROM seen WHERE url = ?", (key,)).fetchone() is not None
+        if found:
+            self.stats['duplicates'] += 1
+        return found
+
+    def add(self, url):
+        """Record url; returns False if it was already known"""
+        if self.contains(url):
+            return False
+        key = canonicalize_profile_url(url)
+        self.conn.execute("INSERT OR IGNORE INTO seen (url) VALUES (?)", (key,))
+        self.bloom.add(key)
+        self.stats['added'] += 1
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.commit()
+        return True
+
+    def commit(self):
+        self.conn.commit()
+        self._pending = 0
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def get_stats(self):
+        return dict(self.stats)
+
+    def close(self):
+        """Commit pending URLs and persist the Bloom filter next to the database"""
+        if self.conn is None:
+            return
+        self.commit()
+        token = self._save_bloom()
+        if token:
+            # Written only after the filter file is complete; a crash in between means a rebuild
+            with self.conn:
+                self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('bloom_token', ?)", (token,))
+        self.conn.close()
+        self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _load_bloom(self):
+        """Reuse the filter saved by the last clean close(), otherwise rebuild it from the table"""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'bloom_token'").fetchone()
+        # Until this index is closed cleanly, the saved filter must not be trusted again
+        with self.conn:
+            self.conn.execute("DELETE FROM meta WHERE key = 'bloom_token'")
+        if row and self._read_bloom(row[0]):
+            return
+        count = 0
+        for (url,) in self.conn.execute("SELECT url FROM seen"):
+            self.bloom.add(url)
+            count += 1
+        if count:
+            logging.info(f"Rebuilt dedup Bloom filter from {count} stored URLs")
+
+    def _read_bloom(self, token):
+        """Load the saved filter if it carries token and matches this filter's size"""
+        if not self.bloom_file or not os.path.exists(self.bloom_file):
+            return False
+        if os.path.getsize(self.bloom_file) != len(token) + len(self.bloom.bits):
+            return False
+        with open(self.bloom_file, 'rb') as f:
+            if f.read(len(token)) != token.encode('ascii'):
+                return False
+            f.readinto(self.bloom.bits)
+        return True
+
+    def _save_bloom(self):
+        """Write the filter prefixed with a fresh token; returns the token, or None if not saved"""
+        if not self.bloom_file:
+            return None
+        token = uuid.uuid4().hex
+        try:
+            tmp_file = f"{self.bloom_file}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(token.encode('ascii'))
+                f.write(self.bloom.bits)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.bloom_file)
+            return token
+        except OSError as e:
+            logging.warning(f"Could not save dedup Bloom filter {self.bloom_file}: {e}")
+            return None
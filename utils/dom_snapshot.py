@@ -0,0 +1,129 @@
+import logging
+from functools import lru_cache
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+from cssselect import SelectorError
+
+
+# Tags whose text never shows up in WebElement.text
+INVISIBLE_TAGS = {'script', 'style', 'noscript', 'template', 'head', 'title', 'meta', 'link'}
+
+# Tags that start a new line in rendered text
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt', 'fieldset',
+    'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'tr', 'ul'
+}
+
+
+# Returns the outerHTML of the first element matching arguments[0], or null
+OUTER_HTML_SCRIPT = "var el = document.querySelector(arguments[0]); return el ? el.outerHTML : null;"
+
+
+@lru_cache(maxsize=1024)
+def compile_selector(selector):
+    """Compile a CSS selector once and reuse it across snapshots"""
+    return CSSSelector(selector, translator='html')
+
+
+class DOMSnapshot:
+    """In-process copy of a page's DOM, queried with CSS selectors through lxml"""
+
+    def __init__(self, page_source, url=None):
+        self.url = url
+        self.page_source = page_source or ''
+        # Fallback selectors that matched nothing; a match rejected by a predicate is not a
+        # miss, since find_element would have returned it without the implicit wait
+        self.misses = 0
+        self.root = lxml_html.fromstring(self.page_source) if self.page_source.strip() else lxml_html.fromstring('<html></html>')
+
+    @classmethod
+    def from_driver(cls, driver, root_selector=None):
+        """Take a snapshot with a single WebDriver round trip"""
+        if root_selector:
+            page_source = driver.execute_script(OUTER_HTML_SCRIPT, root_selector)
+        else:
+            page_source = driver.page_source
+        return cls(page_source, url=driver.current_url)
+
+    def select(self, selector, root=None):
+        """Return all elements matching a selector, in document order"""
+        try:
+            return compile_selector(selector)(self.root if root is None else root)
+        except SelectorError as e:
+            logging.debug(f"Unsupported selector {selector!r}: {e}")
+            return []
+
+    def select_first(self, selectors, root=None, predicate=None):
+        """Return (element, selector) for the first selector with a match accepted by predicate"""
+        for selector in selectors:
+            matches = self.select(selector, root)
+            if not matches:
+                self.misses += 1
+            elif predicate is None or predicate(matches[0]):
+                return matches[0], selector
+        return None, None
+
+    def select_all(self, selectors, root=None):
+        """Return (elements, selector) for the first selector that matches anything"""
+        for selector in selectors:
+            matches = self.select(selector, root)
+            if matches:
+                return matches, selector
+            self.misses += 1
+        return [], None
+
+    def text(self, element):
+        """Approximate WebElement.text: visible text with block-level line breaks"""
+        if element is None:
+            return ''
+        parts = []
+        self._collect_text(element, parts)
+        lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+        return '\n'.join(line for line in lines if line)
+
+    def first_text(self, selectors, root=None, predicate=None):
+        """Return the stripped text of the first matching element, or None"""
+        if predicate is None:
+            element, _ = self.select_first(selectors, root)
+        else:
+            element, _ = self.select_first(selectors, root, lambda el: predicate(self.text(el)))
+        return self.text(element) if element is not None else None
+
+    def attr(self, element, name):
+        """Return an attribute value, or None if the element or attribute is missing"""
+        if element is None:
+            return None
+        return element.get(name)
+
+    def _collect_text(self, element, parts):
+        tag = element.tag if isinstance(element.tag, str) else ''
+        if tag in INVISIBLE_TAGS or self._is_hidden(element):
+            if element.tail:
+                parts.append(element.tail)
+            return
+
+        block = tag in BLOCK_TAGS
+        if block:
+            parts.append('\n')
+        if tag == 'br':
+            parts.append('\n')
+        if element.text:
+            parts.append(element.text)
+        for child in element:
+            self._collect_text(child, parts)
+        if block:
+            parts.append('\n')
+        if element.tail:
+            parts.append(element.tail)
+
+    @staticmethod
+    def _is_hidden(element):
+        if not isinstance(element.tag, str):
+            return True
+        if element.get('hidden') is not None:
+            return True
+        if 'visually-hidden' in (element.get('class') or '').split():
+            return True
+        style = (element.get('style') or '').replace(' ', '').lower()
+        return 'display:none' in style or 'visibility:hidden' in style
@@ -0,0 +1,161 @@
+import logging
+import time
+
+
+# LinkedIn's authentication cookie; present and unexpired while a login session is valid
+SESSION_COOKIE = 'li_at'
+
+
+class DriverPool:
+    """Keeps one browser, and its logged-in session, alive between invocations of the same process.
+
+    Lambda and long-lived containers reuse the module that holds the pool, so a warm
+    invocation can skip launching Chrome and logging in. The pooled driver is health-checked
+    before every reuse and replaced when it is dead, too old or has served max_uses jobs, or
+    when the scraper wants different launch options (proxy, resource policy, load strategy).
+    """
+
+    def __init__(self, max_uses=50, max_age=3600):
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.entry = None
+        self.stats = {
+            'launches': 0,
+            'reuses': 0,
+            'session_reuses': 0,
+            'health_check_failures': 0,
+            'retired': 0,
+            'account_switches': 0,
+            'cold_start_seconds': [],
+            'warm_start_seconds': []
+        }
+        self._started = None
+        self._warm = False
+
+    def acquire(self, scraper, account):
+        """Attach a healthy pooled driver to scraper or launch a new one.
+
+        Returns {'warm', 'logged_in'} or None when no driver could be created. When
+        logged_in is False the caller logs in and then calls mark_logged_in().
+        """
+        self._started = time.perf_counter()
+        entry = self.entry
+        if entry and self._reusable(entry, scraper):
+            scraper.attach_driver(entry['driver'])
+            entry['uses'] += 1
+            self.stats['reuses'] += 1
+            logged_in = False
+            if entry['account'] == account:
+                logged_in = self.has_session(entry['driver'])
+            elif entry['account'] is not None:
+                # Never log in on top of another account's live session
+                self.clear_session(entry['driver'])
+                entry['account'] = None
+                self.stats['account_switches'] += 1
+                logging.info("Pooled browser was logged in as another account; cleared its cookies")
+            if logged_in:
+                self.stats['session_reuses'] += 1
+            self._warm = True
+            logging.info(f"Reusing pooled browser (use {entry['uses']}, session {'valid' if logged_in else 'missing'})")
+            return {'warm': True, 'logged_in': logged_in}
+
+        self.discard()
+        if not scraper._create_advanced_driver():
+            return None
+        self.entry = {
+            'driver': scraper.driver,
+            'options': scraper.launch_options(),
+            'account': None,
+            'created_at': time.time(),
+            'uses': 1
+        }
+        self.stats['launches'] += 1
+        self._warm = False
+        return {'warm': False, 'logged_in': False}
+
+    def mark_logged_in(self, account):
+        if self.entry:
+            self.entry['account'] = account
+
+    def startup_report(self):
+        """Seconds from acquire() until the session was ready, recorded as a warm or cold start"""
+        seconds = round(time.perf_counter() - self._started, 3)
+        kind = 'warm' if self._warm else 'cold'
+        self.stats[f'{kind}_start_seconds'].append(seconds)
+        return {'start': kind, 'seconds': seconds}
+
+    def release(self, scraper, healthy=True):
+        """Keep the scraper's driver for the next invocation; scraper.close() will then not quit it"""
+        if not self.entry or scraper.driver is not self.entry['driver']:
+            return
+        if healthy:
+            scraper.driver = None
+        else:
+            # Let scraper.close() quit it
+            self.entry = None
+            self.stats['retired'] += 1
+
+    def discard(self):
+        if not self.entry:
+            return
+        try:
+            self.entry['driver'].quit()
+        except Exception as e:
+            logging.debug(f"Pooled driver did not quit cleanly: {e}")
+        self.entry = None
+        self.stats['retired'] += 1
+
+    def get_stats(self):
+        stats = {key: value for key, value in self.stats.items() if not key.endswith('_start_seconds')}
+        for kind in ('cold', 'warm'):
+            samples = self.stats[f'{kind}_start_seconds']
+            stats[f'{kind}_starts'] = len(samples)
+            stats[f'avg_{kind}_start_seconds'] = round(sum(samples) / len(samples), 3) if samples else None
+        return stats
+
+    def _reusable(self, entry, scraper):
+        options = scraper.launch_options()
+        changed = [name for name, value in options.items() if entry['options'].get(name) != value]
+        if changed:
+            logging.info(f"Pooled browser was launched with a different {', '.join(changed)}; relaunching")
+            return False
+        if entry['uses'] >= self.max_uses or time.time() - entry['created_at'] > self.max_age:
+            logging.info("Pooled browser reached its use/age limit; relaunching")
+            return False
+        if not self.is_healthy(entry['driver']):
+            self.stats['health_check_failures'] += 1
+            logging.warning("Pooled browser failed its health check; relaunching")
+            return False
+        return True
+
+    @staticmethod
+    def is_healthy(driver):
+        """The browser process and its current tab still answer WebDriver commands"""
+        try:
+            return bool(driver.window_handles) and driver.current_url is not None
+        except Exception:
+            return False
+
+    @staticmethod
+    def clear_session(driver):
+        """Drop every cookie in the browser, not just those of the current page's domain"""
+        try:
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        except Exception as e:
+            logging.debug(f"CDP cookie clear unavailable: {e}")
+        try:
+            driver.delete_all_cookies()
+        except Exception as e:
+            logging.warning(f"Could not clear pooled browser cookies: {e}")
+
+    @staticmethod
+    def has_session(driver):
+        """The login cookie is present and not about to expire, without navigating anywhere"""
+        try:
+            cookie = driver.get_cookie(SESSION_COOKIE)
+        except Exception:
+            return False
+        if not cookie:
+            return False
+        expiry = cookie.get('expiry')
+        return expiry is None or expiry > time.time() + 300
@@ -0,0 +1,161 @@
+import time
+import logging
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+# Probes every fallback selector inside the browser and returns [element, index, empty]
+# for the first one that matches and satisfies the optional condition ([null, -1, empty]
+# when none does). empty counts the selectors before it that matched no element at all.
+FIND_FIRST_SCRIPT = """
+var selectors = arguments[0];
+var root = arguments[1] || document;
+var condition = arguments[2];
+function accepted(el) {
+    if (condition === 'displayed') {
+        return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    }
+    if (condition === 'enabled') {
+        return !el.disabled;
+    }
+    return true;
+}
+var empty = 0;
+for (var i = 0; i < selectors.length; i++) {
+    var el = null;
+    try { el = root.querySelector(selectors[i]); } catch (e) { continue; }
+    if (!el) {
+        empty++;
+    } else if (accepted(el)) {
+        return [el, i, empty];
+    }
+}
+return [null, -1, empty];
+"""
+
+# Returns [elements, index] for the first selector that matches anything, or null.
+FIND_ALL_SCRIPT = """
+var selectors = arguments[0];
+var root = arguments[1] || document;
+for (var i = 0; i < selectors.length; i++) {
+    var els = [];
+    try { els = root.querySelectorAll(selectors[i]); } catch (e) { continue; }
+    if (els.length) {
+        return [Array.prototype.slice.call(els), i];
+    }
+}
+return null;
+"""
+
+
+class ElementLocator:
+    """Fast-fail element lookups: all fallbacks probed in one call, no implicit wait"""
+
+    def __init__(self, driver, implicit_wait=10, anchor_timeout=10, ranking=None):
+        self.driver = driver
+        # Optional SelectorRankingCache; lookups that pass a field are reordered by it
+        self.ranking = ranking
+        # The implicit wait every missed find_element used to block for; only used
+        # to report how much time the zero-wait lookups saved.
+        self.implicit_wait = implicit_wait
+        self.anchor_timeout = anchor_timeout
+        self.stats = {
+            'lookups': 0,
+            'fallback_misses': 0,
+            'time_saved_seconds': 0.0,
+            'anchor_waits': 0,
+            'anchor_timeouts': 0,
+            'anchor_wait_seconds': 0.0
+        }
+
+    def find_first(self, selectors, root=None, condition=None, field=None):
+        """Return the first element matching any selector, or None without waiting"""
+        selectors = self._ordered(field, selectors)
+        self.stats['lookups'] += 1
+        try:
+            result = self.driver.execute_script(FIND_FIRST_SCRIPT, selectors, root, condition)
+        except WebDriverException as e:
+            logging.debug(f"Element lookup failed for {selectors}: {e}")
+            result = None
+
+        element, index, empty = result or (None, -1, 0)
+        # Only selectors that matched nothing would have sat out the implicit wait
+        self.record_misses(empty)
+        self._record_rank(field, selectors, index if element is not None else None)
+        return element
+
+    def find_all(self, selectors, root=None, field=None):
+        """Return all elements for the first selector that matches anything, or []"""
+        selectors = self._ordered(field, selectors)
+        self.stats['lookups'] += 1
+        try:
+            result = self.driver.execute_script(FIND_ALL_SCRIPT, selectors, root)
+        except WebDriverException as e:
+            logging.debug(f"Element lookup failed for {selectors}: {e}")
+            result = None
+
+        if result:
+            elements, index = result
+            self.record_misses(index)
+            self._record_rank(field, selectors, index)
+            return elements
+
+        self.record_misses(len(selectors))
+        self._record_rank(field, selectors, None)
+        return []
+
+    def wait_for_anchor(self, selectors, timeout=None):
+        """Bounded explicit wait for a section anchor; returns the element or None"""
+        timeout = self.anchor_timeout if timeout is None else timeout
+        start_time = time.time()
+        self.stats['anchor_waits'] += 1
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(
+                lambda d: self._probe(selectors)
+            )
+        except TimeoutException:
+            self.stats['anchor_timeouts'] += 1
+            logging.debug(f"Anchor not found within {timeout}s: {selectors}")
+            return None
+        finally:
+            self.stats['anchor_wait_seconds'] += time.time() - start_time
+
+    def wait_until_ready(self, anchor_groups, timeout=None):
+        """Wait until every group of selectors has a match, sharing one deadline; True when all did"""
+        timeout = self.anchor_timeout if timeout is None else timeout
+        deadline = time.time() + timeout
+        for selectors in anchor_groups:
+            if not self.wait_for_anchor(selectors, timeout=max(0.0, deadline - time.time())):
+                return False
+        return True
+    
+    def record_misses(self, count):
+        """Account for fallback selectors that matched no element and would each have hit the implicit wait"""
+        if count <= 0:
+            return
+        self.stats['fallback_misses'] += count
+        self.stats['time_saved_seconds'] += count * self.implicit_wait
+
+    def get_stats(self):
+        """Return lookup counters, including the implicit-wait time saved"""
+        stats = dict(self.stats)
+        stats['time_saved_seconds'] = round(stats['time_saved_seconds'], 2)
+        stats['anchor_wait_seconds'] = round(stats['anchor_wait_seconds'], 2)
+        return stats
+
+    def _probe(self, selectors):
+        try:
+            result = self.driver.execute_script(FIND_FIRST_SCRIPT, list(selectors), None, None)
+        except WebDriverException:
+            return False
+        return result[0] if result and result[0] is not None else False
+
+    def _ordered(self, field, selectors):
+        if self.ranking is None or field is None:
+            return list(selectors)
+        return self.ranking.rank(field, selectors)
+
+    def _record_rank(self, field, selectors, index):
+        if self.ranking is None or field is None:
+            return
+        self.ranking.record(field, selectors, selectors[index] if index is not None else None)
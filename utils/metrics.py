@@ -0,0 +1,228 @@
+import logging
+import math
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+OPENMETRICS_CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Seconds; spans sub-second extraction up to multi-minute throttle waits
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+
+def _format_value(value):
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels) + '}'
+
+
+class _Metric:
+    metric_type = None
+
+    def __init__(self, registry, name, documentation, source=None):
+        self._lock = registry.lock
+        self.name = name
+        self.documentation = documentation
+        # Optional callable read at exposition time, e.g. a counter the scraper already keeps
+        self.source = source
+        self._values = {}
+
+    @staticmethod
+    def _key(labels):
+        return tuple(sorted(labels.items()))
+
+    def _samples(self):
+        if self.source is not None:
+            return [('', (), self.source())]
+        return [('', key, value) for key, value in self._values.items()]
+
+
+class Counter(_Metric):
+    metric_type = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _samples(self):
+        return [('_total', key, value) for _, key, value in super()._samples()]
+
+
+class Gauge(_Metric):
+    metric_type = 'gauge'
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Histogram(_Metric):
+    metric_type = 'histogram'
+
+    def __init__(self, registry, name, documentation, buckets=DEFAULT_BUCKETS):
+        super().__init__(registry, name, documentation)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {'counts': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state['counts'][i] += 1
+                    break
+            state['sum'] += value
+            state['count'] += 1
+
+    def _samples(self):
+        samples = []
+        for key, state in self._values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, state['counts']):
+                cumulative += count
+                le = '+Inf' if bound == math.inf else repr(float(bound))
+                samples.append(('_bucket', key + (('le', le),), cumulative))
+            samples.append(('_count', key, state['count']))
+            samples.append(('_sum', key, state['sum']))
+        return samples
+
+
+class MetricsRegistry:
+    """In-process counters, gauges and histograms exposed in the OpenMetrics text format.
+
+    Updates only take a short lock; exposition happens on a background HTTP thread
+    (serve) or a background textfile writer (start_textfile_writer), never in the scrape loop.
+    """
+
+    def __init__(self, namespace='linkedin_scraper'):
+        self.namespace = namespace
+        self.lock = threading.Lock()
+        self.metrics = {}
+        self._server = None
+        self._writer = None
+        self._writer_stop = threading.Event()
+        self.textfile_path = None
+
+    def counter(self, name, documentation, source=None):
+        return self._register(Counter(self, self._full_name(name), documentation, source=source))
+
+    def gauge(self, name, documentation, source=None):
+        return self._register(Gauge(self, self._full_name(name), documentation, source=source))
+
+    def histogram(self, name, documentation, buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(self, self._full_name(name), documentation, buckets=buckets))
+
+    def render(self, openmetrics=True):
+        """Exposition text; openmetrics=False gives the Prometheus 0.0.4 format node-exporter reads"""
+        lines = []
+        with self.lock:
+            snapshot = [(metric, metric._samples()) for metric in self.metrics.values()]
+        for metric, samples in snapshot:
+            family = metric.name
+            if not openmetrics and metric.metric_type == 'counter':
+                family += '_total'
+            lines.append(f"# HELP {family} {metric.documentation}")
+            lines.append(f"# TYPE {family} {metric.metric_type}")
+            for suffix, labels, value in samples:
+                lines.append(f"{metric.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        if openmetrics:
+            lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, path=None):
+        """Atomically replace a node-exporter textfile collector file"""
+        path = path or self.textfile_path
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            tmp_file = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(self.render(openmetrics=False))
+            os.replace(tmp_file, path)
+        except OSError as e:
+            logging.warning(f"Could not write metrics textfile {path}: {e}")
+
+    def start_textfile_writer(self, path, interval=15):
+        """Rewrite the textfile every interval seconds from a daemon thread"""
+        self.textfile_path = path
+
+        def run():
+            while not self._writer_stop.wait(interval):
+                self.write_textfile()
+
+        self._writer = threading.Thread(target=run, name='metrics-textfile', daemon=True)
+        self._writer.start()
+
+    def serve(self, port=9464, host='127.0.0.1'):
+        """Serve /metrics from a daemon thread; returns the bound port"""
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                openmetrics = 'application/openmetrics-text' in self.headers.get('Accept', '')
+                body = registry.render(openmetrics=openmetrics).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name='metrics-http', daemon=True).start()
+        logging.info(f"Metrics endpoint listening on http://{host}:{self._server.server_port}/metrics")
+        return self._server.server_port
+
+    def close(self):
+        """Stop the exporters, leaving a final textfile with the end-of-run values"""
+        if self._writer:
+            self._writer_stop.set()
+            self._writer.join(timeout=5)
+            self._writer = None
+            self.write_textfile()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def _full_name(self, name):
+        return f"{self.namespace}_{name}" if self.namespace else name
+
+    def _register(self, metric):
+        with self.lock:
+            existing = self.metrics.get(metric.name)
+            if existing is not None:
+                # Components sharing a registry get the same family back; a gauge read from
+                # an object follows the newest one (the current job's scraper or throttler)
+                if metric.source is not None:
+                    existing.source = metric.source
+                return existing
+            self.metrics[metric.name] = metric
+        return metric
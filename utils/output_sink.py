@@ -0,0 +1,119 @@
+import datetime
+import io
+import json
+import logging
+import os
+import time
+
+
+def json_default(value):
+    """json fallback: records (scraper.models) serialize as their dict form, anything else as str"""
+    to_dict = getattr(value, 'to_dict', None)
+    return to_dict() if callable(to_dict) else str(value)
+
+
+class JSONLSink:
+    """Append-only JSON Lines output: one record per line, written as soon as it is extracted.
+
+    Lines are buffered in memory up to buffer_bytes or flush_interval seconds, flushed to the
+    OS, and fsync'ed every fsync_interval seconds so a crash loses at most that window.
+    With compress=True the stream is zstd-compressed; every flush ends a zstd block, so the
+    file stays decodable up to the last flush even if the process dies.
+    """
+
+    def __init__(self, path=None, output_dir="output", compress=False, compression_level=3,
+                 buffer_bytes=64 * 1024, flush_interval=1.0, fsync_interval=10.0):
+        if not path:
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = os.path.join(output_dir, f"linkedin_stream_{timestamp}.jsonl")
+        if compress and not path.endswith('.zst'):
+            path += '.zst'
+        self.path = path
+        self.compress = compress
+        self.compression_level = compression_level
+        self.buffer_bytes = buffer_bytes
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+
+        self._buffer = []
+        self._buffered_bytes = 0
+        self._last_flush = time.time()
+        self._last_fsync = time.time()
+        self.records_written = 0
+        self.bytes_written = 0
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._file = open(self.path, 'ab')
+        self._writer = self._file
+        if compress:
+            import zstandard
+            self._writer = zstandard.ZstdCompressor(level=compression_level).stream_writer(self._file, closefd=False)
+
+    def write(self, record_type, data):
+        """Queue one record; it reaches disk at the next flush"""
+        line = json.dumps({'type': record_type, 'data': data}, ensure_ascii=False, separators=(',', ':'), default=json_default)
+        encoded = line.encode('utf-8') + b'\n'
+        self._buffer.append(encoded)
+        self._buffered_bytes += len(encoded)
+        self.records_written += 1
+
+        if self._buffered_bytes >= self.buffer_bytes or time.time() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self, fsync=False):
+        """Write buffered lines to the OS, and fsync if requested or the fsync interval elapsed"""
+        if self._file is None:
+            return
+        if self._buffer:
+            payload = b''.join(self._buffer)
+            self._writer.write(payload)
+            self.bytes_written += len(payload)
+            self._buffer = []
+            self._buffered_bytes = 0
+        if self.compress:
+            import zstandard
+            self._writer.flush(zstandard.FLUSH_BLOCK)
+        self._file.flush()
+        self._last_flush = time.time()
+
+        if fsync or time.time() - self._last_fsync >= self.fsync_interval:
+            try:
+                os.fsync(self._file.fileno())
+            except OSError as e:
+                logging.warning(f"fsync failed for {self.path}: {e}")
+            self._last_fsync = time.time()
+
+    def close(self):
+        """Flush, fsync and close the stream"""
+        if self._file is None:
+            return
+        self.flush(fsync=True)
+        if self.compress:
+            self._writer.close()
+        self._file.close()
+        self._file = None
+        logging.info(f"Stream closed: {self.records_written} records written to {self.path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @staticmethod
+    def read_records(path):
+        """Yield (type, data) for every complete record in a plain or .zst JSONL stream"""
+        with open(path, 'rb') as raw:
+            if path.endswith('.zst'):
+                import zstandard
+                stream = io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True), encoding='utf-8')
+            else:
+                stream = io.TextIOWrapper(raw, encoding='utf-8')
+            try:
+                for line in stream:
+                    if not line.endswith('\n'):
+                        break  # Truncated tail from an interrupted run
+                    record = json.loads(line)
+                    yield record['type'], record['data']
+            except Exception as e:
+                logging.warning(f"Stopped reading {path} at a damaged record: {e}")
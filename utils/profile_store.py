@@ -0,0 +1,366 @@
+import datetime
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from utils.clock import SystemClock
+from utils.dedup import canonicalize_profile_url
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    profile_url TEXT PRIMARY KEY,
+    name TEXT,
+    headline TEXT COLLATE NOCASE,
+    location TEXT COLLATE NOCASE,
+    current_company TEXT COLLATE NOCASE,
+    connections TEXT,
+    about TEXT,
+    profile_picture TEXT,
+    contact_info TEXT,
+    certifications TEXT,
+    languages TEXT,
+    page_load_time REAL,
+    scraped_at TEXT,
+    detailed_at TEXT,
+    first_seen TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_profiles_headline ON profiles (headline);
+CREATE INDEX IF NOT EXISTS idx_profiles_location ON profiles (location);
+CREATE INDEX IF NOT EXISTS idx_profiles_company ON profiles (current_company);
+
+CREATE TABLE IF NOT EXISTS experience (
+    profile_url TEXT NOT NULL REFERENCES profiles (profile_url) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    title TEXT,
+    company TEXT COLLATE NOCASE,
+    duration TEXT,
+    location TEXT,
+    description TEXT,
+    PRIMARY KEY (profile_url, position)
+);
+CREATE INDEX IF NOT EXISTS idx_experience_company ON experience (company);
+
+CREATE TABLE IF NOT EXISTS education (
+    profile_url TEXT NOT NULL REFERENCES profiles (profile_url) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    school TEXT,
+    degree TEXT,
+    duration TEXT,
+    PRIMARY KEY (profile_url, position)
+);
+
+CREATE TABLE IF NOT EXISTS skills (
+    profile_url TEXT NOT NULL REFERENCES profiles (profile_url) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    skill TEXT COLLATE NOCASE,
+    PRIMARY KEY (profile_url, position)
+);
+CREATE INDEX IF NOT EXISTS idx_skills_skill ON skills (skill);
+
+CREATE TABLE IF NOT EXISTS content_hashes (
+    profile_url TEXT NOT NULL,
+    section TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    changed_at TEXT NOT NULL,
+    PRIMARY KEY (profile_url, section)
+) WITHOUT ROWID;
+"""
+
+# Sections of a detailed profile that are hashed and only rewritten when they change
+HASHED_SECTIONS = ('personal_info', 'experience', 'education', 'skills', 'about')
+CHILD_TABLES = ('experience', 'education', 'skills')
+SEARCH_CARD_FIELDS = ('name', 'headline', 'location', 'current_company')
+
+# Search results only carry these; a later search hit must not blank out detail columns.
+# A column keeps its stored value when this record left it as None, unless the record
+# re-extracted the column's section and found it changed (e.g. the about text was
+# removed): then the new value is written as-is, None included.
+UPSERT_SQL = """
+INSERT INTO profiles (profile_url, name, headline, location, current_company, connections, about,
+                      profile_picture, contact_info, certifications, languages, page_load_time,
+                      scraped_at, detailed_at, first_seen, updated_at)
+VALUES (:profile_url, :name, :headline, :location, :current_company, :connections, :about,
+        :profile_picture, :contact_info, :certifications, :languages, :page_load_time,
+        :scraped_at, :detailed_at, :now, :now)
+ON CONFLICT (profile_url) DO UPDATE SET
+    name = CASE WHEN :replace_personal_info THEN excluded.name ELSE COALESCE(excluded.name, name) END,
+    headline = CASE WHEN :replace_personal_info THEN excluded.headline ELSE COALESCE(excluded.headline, headline) END,
+    location = CASE WHEN :replace_personal_info THEN excluded.location ELSE COALESCE(excluded.location, location) END,
+    current_company = COALESCE(excluded.current_company, current_company),
+    connections = CASE WHEN :replace_details THEN excluded.connections ELSE COALESCE(excluded.connections, connections) END,
+    about = CASE WHEN :replace_about THEN excluded.about ELSE COALESCE(excluded.about, about) END,
+    profile_picture = CASE WHEN :replace_personal_info THEN excluded.profile_picture
+                           ELSE COALESCE(excluded.profile_picture, profile_picture) END,
+    contact_info = COALESCE(excluded.contact_info, contact_info),
+    certifications = COALESCE(excluded.certifications, certifications),
+    languages = COALESCE(excluded.languages, languages),
+    page_load_time = COALESCE(excluded.page_load_time, page_load_time),
+    scraped_at = COALESCE(excluded.scraped_at, scraped_at),
+    detailed_at = COALESCE(excluded.detailed_at, detailed_at),
+    updated_at = excluded.updated_at
+"""
+
+QUERY_FILTERS = {
+    'headline': "p.headline",
+    'location': "p.location",
+    'company': "p.current_company"
+}
+
+
+def content_hash(value):
+    """Stable short hash of any JSON-serializable section"""
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def search_card_hash(search_result):
+    return content_hash({field: search_result.get(field) for field in SEARCH_CARD_FIELDS})
+
+
+class ProfileStore:
+    """SQLite (WAL) store for search results and detailed profiles, keyed by normalized profile URL"""
+
+    def __init__(self, db_path="output/linkedin_profiles.db", batch_size=100, freshness_window=None, clock=None):
+        self.db_path = db_path
+        # Stamps scrapes and ages them for is_fresh(); a VirtualClock in tests and replays
+        self.clock = clock or SystemClock()
+        self.batch_size = batch_size
+        # Seconds a detail scrape stays valid while the profile's search card is unchanged
+        self.freshness_window = freshness_window
+        self._pending = []
+        self.stats = {'upserts': 0, 'transactions': 0, 'sections_written': 0, 'sections_unchanged': 0}
+
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(db_path, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+
+    def add(self, record):
+        """Queue one search result or detailed profile; written with the next batch"""
+        self._pending.append(record)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write every queued record in one transaction"""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self.upsert_many(pending)
+
+    def upsert_many(self, records):
+        """Insert or merge records in a single transaction; returns how many were written"""
+        now = self.clock.now().isoformat()
+        written = 0
+        with self.conn:
+            for record in records:
+                row = self._profile_row(record, now)
+                if not row['profile_url']:
+                    logging.debug(f"Skipping record without a profile URL: {record.get('name')}")
+                    continue
+                detailed = 'personal_info' in record
+                changed = self._changed_sections(row['profile_url'], record, now) if detailed else ()
+                row.update(
+                    replace_personal_info='personal_info' in changed,
+                    replace_about='about' in changed,
+                    replace_details=detailed
+                )
+                if detailed:
+                    # COALESCE in the upsert keeps the stored value for columns left as None
+                    if 'personal_info' not in changed:
+                        row.update(name=None, headline=None, location=None, profile_picture=None)
+                    if 'about' not in changed:
+                        row['about'] = None
+                self.conn.execute(UPSERT_SQL, row)
+                self._replace_children(row['profile_url'], record, [t for t in CHILD_TABLES if t in changed])
+                written += 1
+        self.stats['upserts'] += written
+        self.stats['transactions'] += 1
+        return written
+
+    def is_fresh(self, search_result, freshness_window=None):
+        """True when the profile was detail-scraped within the window and its search card has not changed"""
+        window = self.freshness_window if freshness_window is None else freshness_window
+        if not window:
+            return False
+        self.flush()
+        url = canonicalize_profile_url(search_result.get('profile_url'))
+        row = self.conn.execute(
+            "SELECT p.detailed_at, h.hash FROM profiles p "
+            "JOIN content_hashes h ON h.profile_url = p.profile_url AND h.section = 'search_card' "
+            "WHERE p.profile_url = ?", (url,)
+        ).fetchone()
+        if row is None or not row['detailed_at'] or row['hash'] != search_card_hash(search_result):
+            return False
+        try:
+            age = self.clock.now() - datetime.datetime.fromisoformat(row['detailed_at'])
+        except ValueError:
+            return False
+        return age.total_seconds() <= window
+
+    def record_search_card(self, search_result):
+        """Remember the search card a detail scrape was based on, for is_fresh()"""
+        url = canonicalize_profile_url(search_result.get('profile_url'))
+        if not url:
+            return
+        with self.conn:
+            self._set_hash(url, 'search_card', search_card_hash(search_result), self.clock.now().isoformat())
+
+    def get(self, profile_url):
+        """Return one stored profile with its experience, education and skills, or None"""
+        url = canonicalize_profile_url(profile_url)
+        row = self.conn.execute("SELECT * FROM profiles WHERE profile_url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        profile = self._row_dict(row)
+        profile['experience'] = [
+            dict(r) for r in self.conn.execute(
+                "SELECT title, company, duration, location, description FROM experience "
+                "WHERE profile_url = ? ORDER BY position", (url,))
+        ]
+        profile['education'] = [
+            dict(r) for r in self.conn.execute(
+                "SELECT school, degree, duration FROM education WHERE profile_url = ? ORDER BY position", (url,))
+        ]
+        profile['skills'] = [
+            r['skill'] for r in self.conn.execute(
+                "SELECT skill FROM skills WHERE profile_url = ? ORDER BY position", (url,))
+        ]
+        return profile
+
+    def query(self, headline=None, location=None, company=None, skill=None, limit=None, offset=0):
+        """Yield matching profile rows without loading the table into memory.
+
+        Filters are case-insensitive; a trailing '%' turns one into an indexed prefix match.
+        """
+        clauses = []
+        params = []
+        for name, value in (('headline', headline), ('location', location), ('company', company)):
+            if value is None:
+                continue
+            clauses.append(f"{QUERY_FILTERS[name]} {'LIKE' if value.endswith('%') else '='} ?")
+            params.append(value)
+        if skill is not None:
+            op = 'LIKE' if skill.endswith('%') else '='
+            clauses.append(f"p.profile_url IN (SELECT profile_url FROM skills WHERE skill {op} ?)")
+            params.append(skill)
+
+        sql = "SELECT p.* FROM profiles p"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY p.profile_url"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+
+        for row in self.conn.execute(sql, params):
+            yield self._row_dict(row)
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def close(self):
+        """Write pending records and close the database"""
+        if self.conn is None:
+            return
+        self.flush()
+        self.conn.close()
+        self.conn = None
+        logging.info(f"Profile store closed: {self.stats['upserts']} upserts to {self.db_path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @staticmethod
+    def _profile_row(record, now):
+        """Flatten a search result or a detailed profile (or both merged) into profile columns"""
+        personal_info = record.get('personal_info') or {}
+        detailed = 'personal_info' in record
+        current_company = record.get('current_company')
+        if current_company is None and record.get('experience'):
+            current_company = record['experience'][0].get('company')
+
+        def as_json(key):
+            value = record.get(key)
+            return json.dumps(value, ensure_ascii=False) if detailed and value is not None else None
+
+        return {
+            'profile_url': canonicalize_profile_url(record.get('profile_url') or record.get('url')),
+            'name': record.get('name') or personal_info.get('name'),
+            'headline': record.get('headline') or personal_info.get('headline'),
+            'location': record.get('location') or personal_info.get('location'),
+            'current_company': current_company,
+            'connections': record.get('connections'),
+            'about': record.get('about'),
+            'profile_picture': personal_info.get('profile_picture'),
+            'contact_info': as_json('contact_info'),
+            'certifications': as_json('certifications'),
+            'languages': as_json('languages'),
+            'page_load_time': record.get('page_load_time'),
+            'scraped_at': record.get('scraped_at'),
+            'detailed_at': record.get('scraped_at') if detailed else None,
+            'now': now
+        }
+
+    def _changed_sections(self, profile_url, record, now):
+        """Hash every section, store the new hashes and return the sections that differ"""
+        stored = dict(self.conn.execute(
+            "SELECT section, hash FROM content_hashes WHERE profile_url = ?", (profile_url,)
+        ).fetchall())
+        changed = []
+        for section in HASHED_SECTIONS:
+            digest = content_hash(record.get(section))
+            if stored.get(section) == digest:
+                self.stats['sections_unchanged'] += 1
+                continue
+            self._set_hash(profile_url, section, digest, now)
+            self.stats['sections_written'] += 1
+            changed.append(section)
+        return changed
+
+    def _set_hash(self, profile_url, section, digest, now):
+        self.conn.execute(
+            "INSERT INTO content_hashes (profile_url, section, hash, changed_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (profile_url, section) DO UPDATE SET hash = excluded.hash, changed_at = excluded.changed_at",
+            (profile_url, section, digest, now)
+        )
+
+    def _replace_children(self, profile_url, record, tables):
+        for table in tables:
+            self.conn.execute(f"DELETE FROM {table} WHERE profile_url = ?", (profile_url,))
+        if 'experience' in tables:
+            self.conn.executemany(
+                "INSERT INTO experience (profile_url, position, title, company, duration, location, description) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(profile_url, i, e.get('title'), e.get('company'), e.get('duration'), e.get('location'), e.get('description'))
+                 for i, e in enumerate(record.get('experience') or [])]
+            )
+        if 'education' in tables:
+            self.conn.executemany(
+                "INSERT INTO education (profile_url, position, school, degree, duration) VALUES (?, ?, ?, ?, ?)",
+                [(profile_url, i, e.get('school'), e.get('degree'), e.get('duration'))
+                 for i, e in enumerate(record.get('education') or [])]
+            )
+        if 'skills' in tables:
+            self.conn.executemany(
+                "INSERT INTO skills (profile_url, position, skill) VALUES (?, ?, ?)",
+                [(profile_url, i, s) for i, s in enumerate(record.get('skills') or [])]
+            )
+
+    @staticmethod
+    def _row_dict(row):
+        profile = dict(row)
+        for key in ('contact_info', 'certifications', 'languages'):
+            if profile.get(key):
+                profile[key] = json.loads(profile[key])
+        return profile
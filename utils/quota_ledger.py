@@ -0,0 +1,124 @@
+import logging
+import os
+import sqlite3
+import time
+import uuid
+from utils.clock import SystemClock
+
+
+class QuotaLedger:
+    """Request-slot ledger shared by every process on the host through one SQLite file.
+
+    reserve() checks all limits and claims a slot in each bucket inside a single
+    BEGIN IMMEDIATE transaction, so concurrent workers can never overshoot a limit.
+    A reservation that is neither committed nor released within reservation_timeout
+    (e.g. the worker died) stops counting.
+
+    Slots are stamped with clock.time(); RequestThrottler passes its own clock's time as
+    now, so windows and slot timestamps always come from the same time source.
+    """
+
+    def __init__(self, db_path="cache/quota_ledger.db", reservation_timeout=300, retention=2 * 86400, clock=None):
+        self.clock = clock or SystemClock()
+        self.db_path = db_path
+        self.reservation_timeout = reservation_timeout
+        self.retention = retention  # Rows older than this are pruned
+        self.stats = {'reserved': 0, 'committed': 0, 'released': 0, 'denied': 0}
+
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        # Autocommit mode; transactions are opened explicitly with BEGIN IMMEDIATE
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._initialize()
+        self._prune()
+
+    def reserve(self, limits, now=None):
+        """Claim one slot in every bucket of limits = {bucket: (limit, window_start)}.
+
+        Returns (token, None) on success or (None, bucket) naming the first exhausted bucket.
+        """
+        now = self.clock.time() if now is None else now
+        stale_before = now - self.reservation_timeout
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for bucket, (limit, window_start) in limits.items():
+                used = self.conn.execute(
+                    "SELECT COUNT(*) FROM slots WHERE bucket = ? AND created_at >= ? "
+                    "AND (committed = 1 OR created_at >= ?)",
+                    (bucket, window_start, stale_before)
+                ).fetchone()[0]
+                if used >= limit:
+                    self.conn.execute("ROLLBACK")
+                    self.stats['denied'] += 1
+                    return None, bucket
+
+            token = uuid.uuid4().hex
+            self.conn.executemany(
+                "INSERT INTO slots (token, bucket, created_at) VALUES (?, ?, ?)",
+                [(token, bucket, now) for bucket in limits]
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.stats['reserved'] += 1
+        return token, None
+
+    def commit(self, token):
+        """Mark a reservation as spent; it counts against its windows from now on"""
+        self.conn.execute("UPDATE slots SET committed = 1 WHERE token = ?", (token,))
+        self.stats['committed'] += 1
+
+    def release(self, token):
+        """Give back a reservation whose request was never made"""
+        self.conn.execute("DELETE FROM slots WHERE token = ?", (token,))
+        self.stats['released'] += 1
+
+    def usage(self, bucket, window_start, now=None):
+        """Committed plus live reserved slots in a bucket since window_start"""
+        now = self.clock.time() if now is None else now
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM slots WHERE bucket = ? AND created_at >= ? AND (committed = 1 OR created_at >= ?)",
+            (bucket, window_start, now - self.reservation_timeout)
+        ).fetchone()[0]
+
+    def oldest(self, bucket, window_start, now=None):
+        """Creation time of the oldest slot still counting in the window, or None"""
+        now = self.clock.time() if now is None else now
+        return self.conn.execute(
+            "SELECT MIN(created_at) FROM slots WHERE bucket = ? AND created_at >= ? AND (committed = 1 OR created_at >= ?)",
+            (bucket, window_start, now - self.reservation_timeout)
+        ).fetchone()[0]
+
+    def get_stats(self):
+        return dict(self.stats)
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def _initialize(self, attempts=50):
+        """Create the schema; workers starting together may briefly see the file locked"""
+        for attempt in range(attempts):
+            try:
+                if self.conn.execute("PRAGMA journal_mode").fetchone()[0] != 'wal':
+                    self.conn.execute("PRAGMA journal_mode=WAL")
+                self.conn.execute("PRAGMA synchronous=NORMAL")
+                self.conn.execute(
+                    "CREATE TABLE IF NOT EXISTS slots ("
+                    "id INTEGER PRIMARY KEY, token TEXT NOT NULL, bucket TEXT NOT NULL, "
+                    "created_at REAL NOT NULL, committed INTEGER NOT NULL DEFAULT 0)"
+                )
+                self.conn.execute("CREATE INDEX IF NOT EXISTS idx_slots_bucket ON slots (bucket, created_at)")
+                self.conn.execute("CREATE INDEX IF NOT EXISTS idx_slots_token ON slots (token)")
+                return
+            except sqlite3.OperationalError as e:
+                if 'locked' not in str(e) or attempt == attempts - 1:
+                    raise
+                time.sleep(0.1)
+
+    def _prune(self):
+        try:
+            self.conn.execute("DELETE FROM slots WHERE created_at < ?", (self.clock.time() - self.retention,))
+        except sqlite3.OperationalError as e:
+            logging.debug(f"Quota ledger prune skipped: {e}")
@@ -0,0 +1,167 @@
+import json
+import logging
+from collections import defaultdict
+
+
+# URL patterns (Network.setBlockedURLs wildcard syntax) the extractors never read
+IMAGE_PATTERNS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*media.licdn.com/dms/image*']
+FONT_PATTERNS = ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot']
+MEDIA_PATTERNS = ['*.mp4', '*.webm', '*.m3u8', '*.mp3', '*dms.licdn.com/playlist*']
+TRACKING_PATTERNS = [
+    '*px.ads.linkedin.com*', '*linkedin.com/li/track*', '*linkedin.com/realtime/*',
+    '*doubleclick.net*', '*google-analytics.com*', '*googletagmanager.com*'
+]
+PATTERNS_BY_TYPE = {
+    'Image': IMAGE_PATTERNS,
+    'Font': FONT_PATTERNS,
+    'Media': MEDIA_PATTERNS,
+    'Tracking': TRACKING_PATTERNS
+}
+
+# Typical transfer size of a blocked request by resource type. A blocked request never
+# transfers, so its size cannot be measured; savings are these constants times blocked counts.
+TYPICAL_BYTES = {'Image': 30_000, 'Font': 45_000, 'Media': 300_000, 'Other': 5_000}
+
+
+class ResourcePolicy:
+    """Blocks resources the extractors never read and measures what each navigation transfers.
+
+    CDP's Network.setBlockedURLs only matches URL patterns, so each blocked resource type
+    is expanded to the patterns above. With measure=True the driver's performance log is
+    read after every navigation to record transferred and blocked requests, and totals are
+    kept per page type, so a pooled process does not accumulate one record per page.
+    Without measuring, images are also disabled through the Chrome content-settings pref;
+    while measuring that pref stays off, because Chrome then never requests the images and
+    their blocked requests would be missing from the log and from the savings estimate.
+    """
+
+    def __init__(self, block_types=('Image', 'Font', 'Media', 'Tracking'), extra_patterns=None, measure=True):
+        self.block_types = tuple(block_types)
+        self.patterns = [p for t in self.block_types for p in PATTERNS_BY_TYPE.get(t, [])]
+        self.patterns += list(extra_patterns or [])
+        self.measure = measure
+        self.totals = {}            # page_type -> summed counters of finished navigations
+        self.last_navigation = None  # Still collecting lazy-loaded traffic until the next navigation
+        self._request_types = {}
+
+    @classmethod
+    def measure_only(cls):
+        """Blocks nothing; the baseline to compare a blocking policy against"""
+        return cls(block_types=(), measure=True)
+
+    def chrome_prefs(self, prefs):
+        """The ChromeOptions "prefs" to apply: images are disabled when Image is blocked and not measured"""
+        prefs = dict(prefs)
+        image_pref = "profile.managed_default_content_settings.images"
+        if 'Image' in self.block_types and not self.measure:
+            prefs[image_pref] = 2
+        else:
+            prefs.pop(image_pref, None)
+        return prefs
+
+    def configure_options(self, options):
+        """Enable the performance log the byte accounting reads"""
+        if self.measure:
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+    def apply(self, driver):
+        """Install the URL blocklist on a live driver"""
+        if not self.patterns:
+            return
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.patterns})
+            logging.info(f"Resource policy blocking {len(self.patterns)} URL patterns ({', '.join(self.block_types)})")
+        except Exception as e:
+            logging.warning(f"Could not apply resource policy: {e}")
+
+    def before_navigation(self, driver):
+        """Charge traffic since the last navigation (scroll-triggered lazy loads) to that page"""
+        if self.measure and self.last_navigation:
+            self._accumulate(self.last_navigation, self._drain(driver))
+
+    def record_navigation(self, driver, url, page_type, load_seconds):
+        record = {
+            'url': url,
+            'page_type': page_type,
+            'load_seconds': round(load_seconds, 4),
+            'requests': 0,
+            'bytes': 0,
+            'blocked': 0,
+            'blocked_by_type': defaultdict(int)
+        }
+        if self.measure:
+            self._accumulate(record, self._drain(driver))
+        if self.last_navigation:
+            self._add_to_totals(self.totals, self.last_navigation)
+        self.last_navigation = record
+        return record
+
+    def get_stats(self):
+        """Per page type averages of measured traffic, plus an estimate of the bytes blocked requests saved.
+
+        avg_bytes and avg_blocked_requests come from the performance log. The saving is not
+        measured: it is blocked requests times TYPICAL_BYTES, and is labelled as an estimate.
+        For a measured saving, compare avg_bytes against a measure_only() run of the same pages.
+        """
+        by_type = {page_type: dict(totals) for page_type, totals in self.totals.items()}
+        if self.last_navigation:
+            self._add_to_totals(by_type, self.last_navigation)
+        return {
+            'blocked_patterns': len(self.patterns),
+            'traffic_measured': self.measure,
+            'bytes_saved_basis': 'estimate: blocked requests x typical bytes per resource type',
+            'page_types': {
+                page_type: {
+                    'navigations': t['navigations'],
+                    'avg_load_seconds': round(t['load_seconds'] / t['navigations'], 4),
+                    'avg_bytes': round(t['bytes'] / t['navigations']),
+                    'avg_blocked_requests': round(t['blocked'] / t['navigations'], 1),
+                    'avg_bytes_saved_estimate': round(t['saved'] / t['navigations'])
+                }
+                for page_type, t in by_type.items()
+            }
+        }
+
+    @classmethod
+    def _add_to_totals(cls, by_type, record):
+        totals = by_type.setdefault(
+            record['page_type'], {'navigations': 0, 'load_seconds': 0.0, 'bytes': 0, 'blocked': 0, 'saved': 0}
+        )
+        totals['navigations'] += 1
+        totals['load_seconds'] += record['load_seconds']
+        totals['bytes'] += record['bytes']
+        totals['blocked'] += record['blocked']
+        totals['saved'] += cls.estimated_savings(record)
+
+    @staticmethod
+    def estimated_savings(record):
+        return sum(TYPICAL_BYTES.get(t, TYPICAL_BYTES['Other']) * n for t, n in record['blocked_by_type'].items())
+
+    def _drain(self, driver):
+        try:
+            return driver.get_log('performance')
+        except Exception:
+            # Replay drivers and browsers started without the performance log
+            return []
+
+    def _accumulate(self, record, entries):
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+            if method == 'Network.requestWillBeSent':
+                self._request_types[params.get('requestId')] = params.get('type', 'Other')
+                record['requests'] += 1
+            elif method == 'Network.loadingFinished':
+                record['bytes'] += int(params.get('encodedDataLength', 0))
+                self._request_types.pop(params.get('requestId'), None)
+            elif method == 'Network.loadingFailed':
+                resource_type = params.get('type') or self._request_types.get(params.get('requestId'), 'Other')
+                self._request_types.pop(params.get('requestId'), None)
+                if params.get('blockedReason'):
+                    record['blocked'] += 1
+                    record['blocked_by_type'][resource_type] += 1
@@ -0,0 +1,117 @@
+import json
+import logging
+import os
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlencode, urlsplit
+from utils.clock import SystemClock
+from utils.output_sink import json_default
+
+
+# Session/tracking parameters that do not change which results a search returns
+IGNORED_PARAMS = ('sid', 'origin', 'page')
+
+
+def normalize_search_url(search_url):
+    """Order-independent, case-insensitive form of a people-search URL"""
+    parts = urlsplit(search_url)
+    params = sorted(
+        (key, value.strip().lower())
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in IGNORED_PARAMS
+    )
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/')}?{urlencode(params)}"
+
+
+class SearchResultCache:
+    """Persisted TTL + LRU cache of extracted search result pages.
+
+    Entries are keyed by the normalized search URL and page index. A page that was
+    cut short by max_results only answers requests that want no more results than that.
+    """
+
+    def __init__(self, cache_file="cache/search_results.json", ttl=6 * 3600, max_entries=500, clock=None):
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.clock = clock or SystemClock()  # Stamps entries and ages them against ttl
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.stats = {'hits': 0, 'misses': 0, 'expired': 0, 'evictions': 0}
+        self.load()
+
+    @staticmethod
+    def key(search_url, page):
+        return f"{normalize_search_url(search_url)}#page={page}"
+
+    def get(self, search_url, page, max_results=None):
+        """Return {'profiles', 'has_next'} for a fresh cached page, or None"""
+        key = self.key(search_url, page)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.stats['misses'] += 1
+            return None
+        if self.clock.time() - entry['cached_at'] > self.ttl:
+            del self.entries[key]
+            self.stats['expired'] += 1
+            self.stats['misses'] += 1
+            return None
+        if entry['truncated'] and max_results is not None and max_results > entry['limit']:
+            self.stats['misses'] += 1
+            return None
+        self.entries.move_to_end(key)
+        self.stats['hits'] += 1
+        return entry
+
+    def put(self, search_url, page, profiles, max_results, has_next=True):
+        """Cache one extracted page; evicts the least recently used pages over max_entries"""
+        key = self.key(search_url, page)
+        self.entries[key] = {
+            'profiles': profiles,
+            'has_next': has_next,
+            'truncated': len(profiles) >= max_results,
+            'limit': max_results,
+            'cached_at': self.clock.time()
+        }
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.stats['evictions'] += 1
+        self.save()
+
+    def mark_last_page(self, search_url, page):
+        """Record that this page had no next page, so cached replays stop there too"""
+        entry = self.entries.get(self.key(search_url, page))
+        if entry is not None:
+            entry['has_next'] = False
+            self.save()
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        stats['entries'] = len(self.entries)
+        return stats
+
+    def load(self):
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            now = self.clock.time()
+            self.entries = OrderedDict(
+                (key, entry) for key, entry in data.get('entries', [])
+                if now - entry['cached_at'] <= self.ttl
+            )
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"Could not load search cache {self.cache_file}: {e}")
+
+    def save(self):
+        """Write the cache atomically, preserving LRU order"""
+        if not self.cache_file:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
+            tmp_file = f"{self.cache_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'entries': list(self.entries.items())}, f, ensure_ascii=False, default=json_default)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            logging.warning(f"Could not save search cache {self.cache_file}: {e}")
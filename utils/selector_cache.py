@@ -0,0 +1,120 @@
+import json
+import logging
+import os
+import time
+
+
+class SelectorRankingCache:
+    """Persisted per-field hit-rate cache that moves the selector that currently matches to the front"""
+
+    def __init__(self, cache_file="cache/selector_ranking.json", ttl=7 * 24 * 3600, decay=0.8, autosave_interval=300):
+        self.cache_file = cache_file
+        self.ttl = ttl  # Winners that have not hit for this long lose their rank
+        self.decay = decay  # Weight kept by the previous score on every update
+        # Seconds between saves from record(); close() always saves. Lookups run on the
+        # extraction hot path, so they must not rewrite the file every few records.
+        self.autosave_interval = autosave_interval
+        self.fields = {}
+        self.stats = {}
+        self._dirty = False
+        self._last_save = time.monotonic()
+        self.load()
+
+    def rank(self, field, selectors):
+        """Return selectors ordered by recent hit rate; unknown or stale ones keep their original order"""
+        entries = self.fields.get(field)
+        if not entries:
+            return list(selectors)
+
+        now = time.time()
+
+        def is_live(selector):
+            entry = entries.get(selector)
+            return entry is not None and now - entry['last_hit'] <= self.ttl
+
+        # sorted() is stable, so equally scored selectors keep their original order
+        promoted = sorted((s for s in selectors if is_live(s)), key=lambda s: entries[s]['score'], reverse=True)
+        return promoted + [s for s in selectors if not is_live(s)]
+
+    def record(self, field, tried_selectors, winner=None):
+        """Record one lookup: every selector tried before the winner missed, the winner hit"""
+        now = time.time()
+        entries = self.fields.setdefault(field, {})
+        field_stats = self.stats.setdefault(field, {'hits': 0, 'misses': 0, 'not_found': 0})
+
+        for selector in tried_selectors:
+            entry = entries.setdefault(selector, {'score': 0.0, 'hits': 0, 'misses': 0, 'last_hit': 0})
+            if selector == winner:
+                entry['score'] = entry['score'] * self.decay + (1 - self.decay)
+                entry['hits'] += 1
+                entry['last_hit'] = now
+                break
+            entry['score'] *= self.decay
+            entry['misses'] += 1
+
+        # A cache hit means the first probe matched
+        if winner is None:
+            field_stats['not_found'] += 1
+            field_stats['misses'] += 1
+        elif tried_selectors and tried_selectors[0] == winner:
+            field_stats['hits'] += 1
+        else:
+            field_stats['misses'] += 1
+
+        self._dirty = True
+        if self.autosave_interval and time.monotonic() - self._last_save >= self.autosave_interval:
+            self.save()
+
+    def get_stats(self):
+        """Return per-field cache hit/miss counters and the current winning selector"""
+        stats = {}
+        for field, field_stats in self.stats.items():
+            ranked = self.rank(field, list(self.fields.get(field, {})))
+            lookups = field_stats['hits'] + field_stats['misses']
+            stats[field] = dict(field_stats)
+            stats[field]['hit_rate'] = round(field_stats['hits'] / lookups, 3) if lookups else 0.0
+            stats[field]['top_selector'] = ranked[0] if ranked else None
+        return stats
+
+    def expire_stale(self):
+        """Drop selectors that have not matched within the TTL"""
+        cutoff = time.time() - self.ttl
+        for field in list(self.fields):
+            entries = self.fields[field]
+            for selector in [s for s, e in entries.items() if e['last_hit'] < cutoff]:
+                del entries[selector]
+            if not entries:
+                del self.fields[field]
+
+    def load(self):
+        """Load persisted rankings, ignoring a missing or corrupt cache file"""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                self.fields = json.load(f).get('fields', {})
+            self.expire_stale()
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable selector cache {self.cache_file}: {e}")
+            self.fields = {}
+
+    def close(self):
+        """Persist rankings recorded since the last save"""
+        if self._dirty:
+            self.save()
+
+    def save(self):
+        """Atomically persist rankings"""
+        self._last_save = time.monotonic()
+        if not self.cache_file:
+            return
+        try:
+            self.expire_stale()
+            os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
+            tmp_file = f"{self.cache_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'fields': self.fields, 'saved_at': time.time()}, f)
+            os.replace(tmp_file, self.cache_file)
+            self._dirty = False
+        except OSError as e:
+            logging.warning(f"Failed to save selector cache: {e}")
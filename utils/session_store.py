@@ -0,0 +1,81 @@
+import hashlib
+import json
+import logging
+import os
+import time
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # Session persistence is optional; every run then logs in from scratch
+    Fernet = None
+    InvalidToken = None
+
+
+class SessionStore:
+    """Fernet-encrypted login cookies on disk, one file per account.
+
+    The key comes from SESSION_STORE_KEY (generate one with Fernet.generate_key()).
+    Sessions older than max_age, or whose li_at cookie has expired, are not restored.
+    """
+
+    def __init__(self, directory="cache/sessions", key=None, max_age=7 * 86400):
+        if Fernet is None:
+            raise ImportError("cryptography is required for the session store")
+        key = key or os.getenv("SESSION_STORE_KEY")
+        if not key:
+            raise ValueError("SessionStore needs a Fernet key (set SESSION_STORE_KEY)")
+        self.fernet = Fernet(key.encode() if isinstance(key, str) else key)
+        self.directory = directory
+        self.max_age = max_age
+        self.stats = {'restored': 0, 'saved': 0, 'expired': 0, 'unreadable': 0}
+
+    def path_for(self, account):
+        # The file name must not reveal the account
+        digest = hashlib.sha256(account.strip().lower().encode('utf-8')).hexdigest()[:24]
+        return os.path.join(self.directory, f"{digest}.session")
+
+    def load(self, account):
+        """Saved cookies for account, or None when missing, expired or undecryptable"""
+        path = self.path_for(account)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                payload = json.loads(self.fernet.decrypt(f.read(), ttl=self.max_age))
+        except (OSError, ValueError, InvalidToken) as e:
+            # InvalidToken also covers sessions older than max_age and a rotated key
+            logging.info(f"Stored session for this account is unusable: {type(e).__name__}")
+            self.stats['unreadable'] += 1
+            return None
+
+        cookies = payload.get('cookies') or []
+        session_cookie = next((c for c in cookies if c.get('name') == 'li_at'), None)
+        if not session_cookie or session_cookie.get('expiry', float('inf')) <= time.time():
+            self.stats['expired'] += 1
+            return None
+        self.stats['restored'] += 1
+        return cookies
+
+    def save(self, account, cookies):
+        """Encrypt and atomically write the account's cookies (readable by this user only)"""
+        path = self.path_for(account)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            token = self.fernet.encrypt(json.dumps({'saved_at': time.time(), 'cookies': cookies}).encode('utf-8'))
+            tmp_file = f"{path}.tmp"
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(token)
+            os.replace(tmp_file, path)
+            self.stats['saved'] += 1
+        except OSError as e:
+            logging.warning(f"Could not save session: {e}")
+
+    def clear(self, account):
+        try:
+            os.remove(self.path_for(account))
+        except FileNotFoundError:
+            pass
+
+    def get_stats(self):
+        return dict(self.stats)
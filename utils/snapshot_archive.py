@@ -0,0 +1,332 @@
+import logging
+import os
+import sqlite3
+import time
+
+from utils.search_cache import normalize_search_url
+
+try:
+    import zstandard
+except ImportError:  # The archive is optional; scraping works without it
+    zstandard = None
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY,
+    page_type TEXT NOT NULL,
+    url TEXT NOT NULL,
+    captured_at REAL NOT NULL,
+    segment INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    raw_length INTEGER NOT NULL,
+    dict_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pages_url ON pages (url, captured_at);
+CREATE INDEX IF NOT EXISTS idx_pages_captured ON pages (captured_at);
+CREATE TABLE IF NOT EXISTS dictionaries (
+    dict_id INTEGER PRIMARY KEY,
+    page_type TEXT NOT NULL,
+    trained_at REAL NOT NULL,
+    samples INTEGER NOT NULL
+);
+"""
+
+
+def search_page_key(search_url, page):
+    """Canonical archive URL of one search results page"""
+    return f"https://{normalize_search_url(search_url)}#page={page}"
+
+
+class SnapshotArchive:
+    """Append-only archive of visited pages' HTML, compressed with a zstd dictionary per page type.
+
+    Every page is an independent zstd frame appended to a segment file; a SQLite index maps
+    (canonical URL, capture time) to segment, offset and length, so any page is read back
+    with one seek. Until train_samples pages of a type exist they are compressed without a
+    dictionary; then a dictionary is trained on them and used for every later page of that
+    type. Frames record which dictionary they need, so retraining never breaks old pages.
+    Training reads its samples back from the segments (at most train_sample_bytes of raw
+    HTML), so pages are not also held in memory while they wait for a dictionary.
+    """
+
+    def __init__(self, directory="archive", segment_bytes=256 * 1024 * 1024, level=9,
+                 dict_size=112 * 1024, train_samples=100, train_sample_bytes=32 * 1024 * 1024, batch_size=50,
+                 readonly=False):
+        if zstandard is None:
+            raise ImportError("zstandard is required for the snapshot archive")
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.level = level
+        self.dict_size = dict_size
+        self.train_samples = train_samples
+        self.train_sample_bytes = train_sample_bytes
+        self.batch_size = batch_size
+        self.readonly = readonly
+
+        os.makedirs(os.path.join(directory, 'segments'), exist_ok=True)
+        os.makedirs(os.path.join(directory, 'dicts'), exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(directory, 'index.db'), timeout=30)
+        if not readonly:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(SCHEMA)
+
+        self._dicts = {}            # dict_id -> ZstdCompressionDict
+        self._compressors = {}      # page_type -> (dict_id, ZstdCompressor)
+        self._decompressors = {}    # dict_id -> ZstdDecompressor
+        self._untrained = {}        # page_type -> pages stored without a dictionary since the last training
+        self._pending = []
+        self._segment = None
+        self._segment_file = None
+        self.stats = {'added': 0, 'raw_bytes': 0, 'stored_bytes': 0, 'dictionaries_trained': 0}
+        self._load_dictionaries()
+
+    def add(self, page_type, url, html, captured_at=None):
+        """Compress and append one page; it becomes readable after the next flush"""
+        if self.readonly:
+            raise RuntimeError("Snapshot archive was opened read-only")
+        raw = html.encode('utf-8')
+        dict_id, compressor = self._compressor(page_type)
+        frame = compressor.compress(raw)
+
+        self._open_segment(len(frame))
+        offset = self._segment_file.tell()
+        self._segment_file.write(frame)
+        self._pending.append((page_type, url, captured_at or time.time(), self._segment, offset,
+                              len(frame), len(raw), dict_id))
+        self.stats['added'] += 1
+        self.stats['raw_bytes'] += len(raw)
+        self.stats['stored_bytes'] += len(frame)
+
+        if dict_id == 0:
+            if page_type not in self._untrained:
+                # Pages an earlier run stored before it could train still count towards this one
+                self._untrained[page_type] = self.conn.execute(
+                    "SELECT COUNT(*) FROM pages WHERE page_type = ? AND dict_id = 0", (page_type,)
+                ).fetchone()[0]
+            self._untrained[page_type] += 1
+            if self._untrained[page_type] >= self.train_samples:
+                self.train_dictionary(page_type)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Make appended frames durable before the index entries that point at them"""
+        if not self._pending:
+            return
+        self._segment_file.flush()
+        os.fsync(self._segment_file.fileno())
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO pages (page_type, url, captured_at, segment, offset, length, raw_length, dict_id) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                self._pending
+            )
+        self._pending = []
+
+    def train_dictionary(self, page_type, samples=None):
+        """Train (or retrain) the page type's dictionary; later pages of that type use it"""
+        samples = samples or self._stored_samples(page_type)
+        if len(samples) < 8:
+            logging.debug(f"Not enough {page_type} samples to train a dictionary ({len(samples)})")
+            return None
+        try:
+            trained = zstandard.train_dictionary(self.dict_size, samples, level=self.level)
+        except zstandard.ZstdError as e:
+            logging.warning(f"Dictionary training for {page_type} pages failed: {e}")
+            self._untrained[page_type] = 0
+            return None
+
+        # The file is durable under a temporary name before its row exists, and renamed before
+        # the row commits, so an indexed dict_id always has its file
+        tmp_file = os.path.join(self.directory, 'dicts', f"{page_type}-{os.getpid()}.zdict.tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(trained.as_bytes())
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            with self.conn:
+                dict_id = self.conn.execute(
+                    "INSERT INTO dictionaries (page_type, trained_at, samples) VALUES (?, ?, ?)",
+                    (page_type, time.time(), len(samples))
+                ).lastrowid
+                os.replace(tmp_file, self._dict_path(dict_id))
+        except (OSError, sqlite3.Error) as e:
+            logging.warning(f"Could not store the {page_type} snapshot dictionary: {e}")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            self._untrained[page_type] = 0
+            return None
+
+        self._dicts[dict_id] = zstandard.ZstdCompressionDict(trained.as_bytes())
+        self._compressors.pop(page_type, None)
+        self._untrained[page_type] = 0
+        self.stats['dictionaries_trained'] += 1
+        logging.info(f"Trained {page_type} snapshot dictionary #{dict_id} on {len(samples)} pages")
+        return dict_id
+
+    def read(self, entry):
+        """HTML of an index entry (a row from entries() or get_entry())"""
+        with open(self._segment_path(entry['segment']), 'rb') as f:
+            f.seek(entry['offset'])
+            frame = f.read(entry['length'])
+        return self._decompressor(entry['dict_id']).decompress(frame).decode('utf-8')
+
+    def get_entry(self, page_id):
+        row = self.conn.execute(f"SELECT {self._columns()} FROM pages WHERE id = ?", (page_id,)).fetchone()
+        return self._entry(row) if row else None
+
+    def latest(self, url):
+        """HTML of the most recent capture of a canonical URL, or None"""
+        row = self.conn.execute(
+            f"SELECT {self._columns()} FROM pages WHERE url = ? ORDER BY captured_at DESC LIMIT 1", (url,)
+        ).fetchone()
+        return self.read(self._entry(row)) if row else None
+
+    def entries(self, page_type=None, since=None, until=None, url_prefix=None):
+        """Yield index entries in capture order, optionally filtered by type, time range and URL prefix"""
+        clauses, params = [], []
+        if page_type:
+            clauses.append("page_type = ?")
+            params.append(page_type)
+        if since is not None:
+            clauses.append("captured_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("captured_at < ?")
+            params.append(until)
+        if url_prefix:
+            # Range scan on the url index instead of LIKE, so % and _ in URLs need no escaping
+            clauses.append("url >= ? AND url < ?")
+            params += [url_prefix, url_prefix + '￿']
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        cursor = self.conn.execute(f"SELECT {self._columns()} FROM pages {where} ORDER BY id", params)
+        for row in cursor:
+            yield self._entry(row)
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0] + len(self._pending)
+
+    def get_stats(self):
+        """Archive-wide sizes per page type, including the compression ratio against raw HTML"""
+        stats = dict(self.stats)
+        stats['page_types'] = {
+            page_type: {
+                'pages': pages,
+                'raw_bytes': raw,
+                'stored_bytes': stored,
+                'ratio': round(stored / raw, 4) if raw else None
+            }
+            for page_type, pages, raw, stored in self.conn.execute(
+                "SELECT page_type, COUNT(*), SUM(raw_length), SUM(length) FROM pages GROUP BY page_type"
+            )
+        }
+        return stats
+
+    def close(self):
+        if self.conn is None:
+            return
+        if not self.readonly:
+            self.flush()
+        if self._segment_file:
+            self._segment_file.close()
+            self._segment_file = None
+        self.conn.close()
+        self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _compressor(self, page_type):
+        cached = self._compressors.get(page_type)
+        if cached is None:
+            dict_id = self._latest_dict_id(page_type)
+            if dict_id:
+                compressor = zstandard.ZstdCompressor(level=self.level, dict_data=self._dicts[dict_id])
+            else:
+                compressor = zstandard.ZstdCompressor(level=self.level)
+            cached = self._compressors[page_type] = (dict_id, compressor)
+        return cached
+
+    def _decompressor(self, dict_id):
+        if dict_id not in self._decompressors:
+            if dict_id and dict_id not in self._dicts:
+                self._load_dictionaries()
+            dict_data = self._dicts.get(dict_id) if dict_id else None
+            self._decompressors[dict_id] = (
+                zstandard.ZstdDecompressor(dict_data=dict_data) if dict_data else zstandard.ZstdDecompressor()
+            )
+        return self._decompressors[dict_id]
+
+    def _stored_samples(self, page_type):
+        """Raw HTML of the latest pages of a type stored without a dictionary, within the sample budgets"""
+        self.flush()
+        rows = self.conn.execute(
+            f"SELECT {self._columns()} FROM pages WHERE page_type = ? AND dict_id = 0 ORDER BY id DESC LIMIT ?",
+            (page_type, self.train_samples)
+        ).fetchall()
+        samples, total = [], 0
+        for row in rows:
+            entry = self._entry(row)
+            if samples and total + entry['raw_length'] > self.train_sample_bytes:
+                break
+            samples.append(self.read(entry).encode('utf-8'))
+            total += entry['raw_length']
+        return samples
+
+    def _latest_dict_id(self, page_type):
+        """Newest dictionary of the type whose file loaded (0 for none)"""
+        rows = self.conn.execute(
+            "SELECT dict_id FROM dictionaries WHERE page_type = ? ORDER BY dict_id DESC", (page_type,)
+        )
+        return next((dict_id for (dict_id,) in rows if dict_id in self._dicts), 0)
+
+    def _load_dictionaries(self):
+        try:
+            rows = self.conn.execute("SELECT dict_id FROM dictionaries").fetchall()
+        except sqlite3.OperationalError:
+            return  # Read-only view of an archive that was never written
+        for (dict_id,) in rows:
+            if dict_id not in self._dicts:
+                try:
+                    with open(self._dict_path(dict_id), 'rb') as f:
+                        self._dicts[dict_id] = zstandard.ZstdCompressionDict(f.read())
+                except OSError as e:
+                    # Archives written before the file was stored ahead of its row; only the
+                    # pages compressed with this dictionary become unreadable
+                    logging.warning(f"Snapshot dictionary #{dict_id} is missing, skipping it: {e}")
+
+    def _open_segment(self, incoming_bytes):
+        if self._segment_file and self._segment_file.tell() + incoming_bytes <= self.segment_bytes:
+            return
+        if self._segment_file:
+            self.flush()
+            self._segment_file.close()
+            self._segment += 1
+        else:
+            row = self.conn.execute("SELECT MAX(segment) FROM pages").fetchone()
+            # Never append to a segment another run wrote; frames past its last index entry may be torn
+            self._segment = (row[0] or 0) + 1
+            while os.path.exists(self._segment_path(self._segment)):
+                self._segment += 1
+        self._segment_file = open(self._segment_path(self._segment), 'ab')
+
+    def _segment_path(self, segment):
+        return os.path.join(self.directory, 'segments', f"segment-{segment:06d}.zst")
+
+    def _dict_path(self, dict_id):
+        return os.path.join(self.directory, 'dicts', f"dict-{dict_id:04d}.zdict")
+
+    @staticmethod
+    def _columns():
+        return "id, page_type, url, captured_at, segment, offset, length, raw_length, dict_id"
+
+    @staticmethod
+    def _entry(row):
+        keys = ('id', 'page_type', 'url', 'captured_at', 'segment', 'offset', 'length', 'raw_length', 'dict_id')
+        return dict(zip(keys, row))
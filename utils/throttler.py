@@ -1,13 +1,23 @@
 import random
-import datetime
 import time
 import logging
+import threading
+from utils.clock import SystemClock
+
+
+# Hourly counter each request type is charged to, besides page_views
+HOURLY_COUNTER_KEYS = {
+    'profile_visit': 'profile_visits',
+    'search': 'searches'
+}
 
 
 class RequestThrottler:
     """Advanced request throttling system to mimic natural browsing behavior"""
     
-    def __init__(self, min_delay=1, max_delay=10, burst_protection=True):
+    def __init__(self, min_delay=1, max_delay=10, burst_protection=True, ledger=None, clock=None, metrics=None):
+        # SystemClock sleeps for real; a VirtualClock advances instantly and records each delay
+        self.clock = clock or SystemClock()
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.burst_protection = burst_protection
@@ -17,8 +27,8 @@ class RequestThrottler:
         self.burst_delay_multiplier = 2.0
         self.daily_request_count = 0
         self.daily_request_limit = 1000  # Daily request limit
-        self.last_reset_date = datetime.date.today()
-        self.session_start_time = time.time()
+        self.last_reset_date = self.clock.today()
+        self.session_start_time = self.clock.time()
         self.hourly_limits = {
             'profile_visits': 50,
             'searches': 20,
@@ -29,43 +39,95 @@ class RequestThrottler:
             'searches': 0,
             'page_views': 0
         }
-        self.last_hourly_reset = time.time()
+        self.last_hourly_reset = self.clock.time()
+        # Optional QuotaLedger; daily and hourly limits are then enforced across processes
+        self.ledger = ledger
+        self._lock = threading.RLock()
+        # Optional MetricsRegistry; every wait is observed per request type
+        self.metrics = metrics
+        if metrics:
+            self.wait_histogram = metrics.histogram(
+                'throttle_wait_seconds', 'Time spent waiting before a request, including hourly limit waits'
+            )
+            self.request_counter = metrics.counter('throttled_requests', 'Requests released by the throttler')
+            metrics.gauge('daily_requests', 'Requests made today by this process',
+                          source=lambda: self.daily_request_count)
     
     def reset_hourly_counters(self):
         """Reset hourly counters if an hour has passed"""
-        if time.time() - self.last_hourly_reset >= 3600:  # 1 hour
+        if self.clock.time() - self.last_hourly_reset >= 3600:  # 1 hour
             self.hourly_counters = {key: 0 for key in self.hourly_counters}
-            self.last_hourly_reset = time.time()
+            self.last_hourly_reset = self.clock.time()
             logging.info("Hourly counters reset")
     
+    def hourly_buckets(self, request_type):
+        """Hourly counters a request of this type is charged to"""
+        buckets = ['page_views']
+        if request_type in HOURLY_COUNTER_KEYS:
+            buckets.insert(0, HOURLY_COUNTER_KEYS[request_type])
+        return buckets
+    
     def check_hourly_limits(self, request_type):
         """Check if hourly limits are exceeded"""
         self.reset_hourly_counters()
         
-        if request_type in self.hourly_counters:
-            if self.hourly_counters[request_type] >= self.hourly_limits[request_type]:
-                wait_time = 3600 - (time.time() - self.last_hourly_reset)
-                logging.warning(f"Hourly limit for {request_type} exceeded. Waiting {wait_time:.0f} seconds")
-                time.sleep(wait_time)
+        for bucket in self.hourly_buckets(request_type):
+            if self.hourly_counters[bucket] >= self.hourly_limits[bucket]:
+                wait_time = 3600 - (self.clock.time() - self.last_hourly_reset)
+                logging.warning(f"Hourly limit for {bucket} exceeded. Waiting {wait_time:.0f} seconds")
+                self.clock.sleep(wait_time)
                 self.reset_hourly_counters()
     
+    def reserve_quota(self, request_type):
+        """Claim a request slot in the shared ledger, waiting out exhausted hourly windows.
+
+        Returns the ledger token; raises like the in-process check once the daily limit is hit.
+        """
+        while True:
+            now = self.clock.time()
+            day_start = time.mktime(self.clock.today().timetuple())
+            limits = {'daily': (self.daily_request_limit, day_start)}
+            for bucket in self.hourly_buckets(request_type):
+                limits[bucket] = (self.hourly_limits[bucket], now - 3600)
+            
+            token, exhausted = self.ledger.reserve(limits, now=now)
+            if token:
+                return token
+            if exhausted == 'daily':
+                logging.warning(f"Daily request limit ({self.daily_request_limit}) reached across workers. Stopping.")
+                raise Exception("Daily request limit exceeded")
+            
+            oldest = self.ledger.oldest(exhausted, now - 3600, now=now)
+            wait_time = max(1.0, (oldest or now) + 3600 - now)
+            logging.warning(f"Hourly limit for {exhausted} exceeded across workers. Waiting {wait_time:.0f} seconds")
+            self.clock.sleep(wait_time)
+    
     def wait_for_next_request(self, request_type="normal"):
         """Wait appropriate time before next request based on throttling rules"""
-        current_time = time.time()
+        with self._lock:
+            self._wait_for_next_request(request_type)
+    
+    def _wait_for_next_request(self, request_type):
+        current_time = self.clock.time()
         
         # Reset daily counter if new day
-        if datetime.date.today() > self.last_reset_date:
+        if self.clock.today() > self.last_reset_date:
             self.daily_request_count = 0
-            self.last_reset_date = datetime.date.today()
+            self.last_reset_date = self.clock.today()
             logging.info("Daily request counter reset")
         
-        # Check hourly limits
-        self.check_hourly_limits(request_type)
-        
-        # Check daily limit
-        if self.daily_request_count >= self.daily_request_limit:
-            logging.warning(f"Daily request limit ({self.daily_request_limit}) reached. Stopping.")
-            raise Exception("Daily request limit exceeded")
+        ledger_token = None
+        if self.ledger:
+            # Limits are shared by every worker on the host
+            ledger_token = self.reserve_quota(request_type)
+        else:
+            # Check hourly limits
+            self.check_hourly_limits(request_type)
+            
+            # Check daily limit
+            if self.daily_request_count >= self.daily_request_limit:
+                logging.warning(f"Daily request limit ({self.daily_request_limit}) reached. Stopping.")
+                raise Exception("Daily request limit exceeded")
         
         # Calculate base delay with enhanced randomness
         if request_type == "profile_visit":
@@ -93,7 +155,7 @@ class RequestThrottler:
             self.request_count = 0  # Reset burst counter
         
         # Apply time-of-day adjustments (slower during peak hours)
-        current_hour = datetime.datetime.now().hour
+        current_hour = self.clock.now().hour
         if 9 <= current_hour <= 17:  # Business hours
             base_delay *= random.uniform(1.2, 1.8)
             logging.debug("Business hours detected - applying slower delays")
@@ -103,16 +165,28 @@ class RequestThrottler:
         if time_since_last < base_delay:
             wait_time = base_delay - time_since_last
             logging.info(f"Throttling: waiting {wait_time:.2f}s before next {request_type} request")
-            time.sleep(wait_time)
+            try:
+                self.clock.sleep(wait_time)
+            except BaseException:
+                if ledger_token:
+                    self.ledger.release(ledger_token)
+                raise
+        
+        if ledger_token:
+            self.ledger.commit(ledger_token)
         
         # Update counters
-        self.last_request_time = time.time()
+        self.last_request_time = self.clock.time()
         self.request_count += 1
         self.daily_request_count += 1
         
         # Update hourly counters
-        if request_type in self.hourly_counters:
-            self.hourly_counters[request_type] += 1
+        for bucket in self.hourly_buckets(request_type):
+            self.hourly_counters[bucket] += 1
+        
+        if self.metrics:
+            self.wait_histogram.observe(self.last_request_time - current_time, request_type=request_type)
+            self.request_counter.inc(request_type=request_type)
         
         logging.debug(f"Request #{self.daily_request_count} today, burst count: {self.request_count}")
     
@@ -152,7 +226,7 @@ class RequestThrottler:
             logging.info(f"Simulating distraction - extra {distraction_delay:.1f}s delay")
         
         logging.info(f"Smart delay applied: {delay:.2f}s")
-        time.sleep(delay)
+        self.clock.sleep(delay)
     
     def get_reading_time(self, content_length):
         """Calculate realistic reading time based on content length"""
@@ -0,0 +1,176 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+
+
+class _NoopSpan:
+    """Shared do-nothing span handed out while tracing is disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer.record(self.name, self.category, self.start, end - self.start, self.args)
+        return False
+
+    def set(self, **args):
+        """Attach extra args (e.g. counts known only at the end) to the span"""
+        self.args.update(args)
+
+
+class _InstrumentedProxy:
+    """Wraps every public method call of the target in a span named <category>.<method>.
+
+    Attribute assignments and deletions go to the target, so code holding the proxy can
+    still reconfigure it (e.g. throttler.daily_request_limit = ...).
+    """
+
+    _OWN_ATTRIBUTES = ('_tracer', '_target', '_category')
+
+    def __init__(self, tracer, target, category):
+        object.__setattr__(self, '_tracer', tracer)
+        object.__setattr__(self, '_target', target)
+        object.__setattr__(self, '_category', category)
+
+    def __setattr__(self, name, value):
+        if name in self._OWN_ATTRIBUTES:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._target, name, value)
+
+    def __delattr__(self, name):
+        delattr(self._target, name)
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        if name.startswith('_') or not callable(value):
+            return value
+
+        @functools.wraps(value)
+        def traced(*args, **kwargs):
+            with self._tracer.span(f"{self._category}.{name}", self._category):
+                return value(*args, **kwargs)
+        return traced
+
+
+class Tracer:
+    """Span recorder that writes Chrome trace-event objects, one per JSONL line.
+
+    A Tracer without a path is disabled: span() returns a shared no-op object and
+    instrument() returns the target unchanged, so instrumentation costs one attribute check.
+    """
+
+    def __init__(self, path=None, buffer_events=256):
+        self.path = path
+        self.enabled = bool(path)
+        self.buffer_events = buffer_events
+        self._events = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self.events_written = 0
+        if self.enabled:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            self._file = open(path, 'a', encoding='utf-8')
+
+    def span(self, name, category='scraper', **args):
+        """Context manager timing one phase; a no-op when tracing is disabled"""
+        if not self.enabled:
+            return NOOP_SPAN
+        return _Span(self, name, category, args)
+
+    def instrument(self, target, category):
+        """Trace every public method call on target (or return it as-is when disabled)"""
+        if not self.enabled:
+            return target
+        return _InstrumentedProxy(self, target, category)
+
+    def begin(self, name, category='scraper', **args):
+        """Open a span that cannot be written as a with-block; close it with end()"""
+        if self.enabled:
+            self._append(self._event(name, category, 'B', time.perf_counter(), args))
+
+    def end(self, name, category='scraper', **args):
+        if self.enabled:
+            self._append(self._event(name, category, 'E', time.perf_counter(), args))
+
+    def record(self, name, category, start, duration, args=None):
+        event = self._event(name, category, 'X', start, args)
+        event['dur'] = round(duration * 1e6, 1)
+        self._append(event)
+
+    def _event(self, name, category, phase, start, args):
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': phase,
+            'ts': round((start - self._origin) * 1e6, 1),
+            'pid': self._pid,
+            'tid': threading.get_ident()
+        }
+        if args:
+            event['args'] = args
+        return event
+
+    def _append(self, event):
+        with self._lock:
+            self._events.append(event)
+            if len(self._events) >= self.buffer_events:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        if not self.enabled:
+            return
+        self.flush()
+        self._file.close()
+        self.enabled = False
+        logging.info(f"Trace closed: {self.events_written} spans written to {self.path}")
+
+    def _flush_locked(self):
+        if not self._events:
+            return
+        self._file.write(''.join(json.dumps(e, default=str) + '\n' for e in self._events))
+        self._file.flush()
+        self.events_written += len(self._events)
+        self._events = []
+
+    @staticmethod
+    def export_chrome_trace(jsonl_path, output_path):
+        """Convert a JSONL trace into a JSON file chrome://tracing and Perfetto can open"""
+        with open(jsonl_path, 'r', encoding='utf-8') as f:
+            events = [json.loads(line) for line in f if line.strip()]
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return output_path
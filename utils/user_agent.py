@@ -1,11 +1,11 @@
 import random
-from fake_useragent import UserAgent
 
 class UserAgentRotator:
     """Enhanced User-Agent rotation with predefined and dynamic agents"""
     
     def __init__(self):
-        self.ua = UserAgent()
+        # fake_useragent loads its dataset on construction; build it on first use only
+        self._ua = None
         
         # High-quality, real User-Agent strings
         self.predefined_agents = [
@@ -20,6 +20,13 @@ class UserAgentRotator:
         
         self.current_index = 0
     
+    @property
+    def ua(self):
+        if self._ua is None:
+            from fake_useragent import UserAgent
+            self._ua = UserAgent()
+        return self._ua
+    
     def get_random_agent(self):
         """Get a random User-Agent from fake_useragent library"""
         try: